@@ -94,6 +94,17 @@ Combined sub-classes
    Bond
    Bonds
 
+Functions for generating bond topology
+--------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   compute_bonds
+   compute_angles
+   compute_dihedrals
+   assign_topology_types
+   generate_topology
+
 Classes for molecular dynamics simulations
 ------------------------------------------
 
@@ -102,6 +113,10 @@ Classes for molecular dynamics simulations
 
    Trajectory
    Snapshot
+   compute_msd
+   compute_vacf
+   BondTracker
+   VerletList
 
 """
 from __future__ import absolute_import, division, print_function
@@ -130,8 +145,10 @@ from ._kdtree_atoms import *
 from ._poav_atoms import *
 
 from ._bonds import *
+from ._topology import *
 
 from ._md_atoms import *
+from ._bond_tracker import *
 from ._trajectory import *
 
 from ._structure_atoms import *
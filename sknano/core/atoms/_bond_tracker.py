@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+Bond dynamics analysis (:mod:`sknano.core.atoms._bond_tracker`)
+===============================================================================
+
+Classes for tracking bond formation and breaking across trajectory
+snapshots.
+
+.. currentmodule:: sknano.core.atoms._bond_tracker
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    raise ImportError('Install scipy version >= 0.16.0 to allow '
+                      'nearest-neighbor queries between atoms.')
+
+from sknano.core import BaseClass
+
+__all__ = ['BondTracker', 'VerletList']
+
+
+class VerletList:
+    """Verlet neighbor list of atom pairs.
+
+    The candidate pair list is built with a cutoff of `rc` + `skin` and
+    only rebuilt once an atom has moved more than half the `skin` distance
+    since the last build.
+
+    Parameters
+    ----------
+    rc : :class:`~python:float`
+        Bond cutoff distance.
+    skin : :class:`~python:float`, optional
+        Verlet skin distance.
+    boxsize : {None, array_like}, optional
+        Orthogonal periodic box lengths.
+
+    """
+    def __init__(self, rc, skin=0.5, boxsize=None):
+        self.rc = rc
+        self.skin = skin
+        self.boxsize = None if boxsize is None else np.asarray(boxsize)
+        self.candidates = None
+        self.nbuilds = 0
+        self._r0 = None
+
+    def _wrap(self, r):
+        if self.boxsize is not None:
+            r = np.mod(r, self.boxsize)
+            r[r >= self.boxsize] = 0.0
+        return r
+
+    def _displacements(self, dr):
+        if self.boxsize is not None:
+            dr -= self.boxsize * np.round(dr / self.boxsize)
+        return dr
+
+    def build(self, r):
+        """Build candidate pair list from :math:`(N, 3)` positions `r`."""
+        r = self._wrap(r)
+        tree = cKDTree(r, boxsize=self.boxsize)
+        self.candidates = np.array(sorted(tree.query_pairs(self.rc +
+                                                           self.skin)),
+                                   dtype=int).reshape((-1, 2))
+        self._r0 = r.copy()
+        self.nbuilds += 1
+
+    def pairs(self, r):
+        """Return sorted :math:`(M, 2)` array of atom index pairs.
+
+        Parameters
+        ----------
+        r : :class:`~numpy:numpy.ndarray`
+            :math:`(N, 3)` array of atom positions.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Pairs :math:`(i, j)` with :math:`i < j` within distance `rc`.
+
+        """
+        r = self._wrap(r)
+        if self.candidates is None or len(r) != len(self._r0):
+            self.build(r)
+        else:
+            dr = self._displacements(r - self._r0)
+            if np.max(np.einsum('ij,ij->i', dr, dr)) > (self.skin / 2) ** 2:
+                self.build(r)
+
+        i, j = self.candidates.T
+        dr = self._displacements(r[j] - r[i])
+        pairs = self.candidates[np.einsum('ij,ij->i', dr, dr) <= self.rc ** 2]
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+class BondTracker(BaseClass):
+    """Track bond formation/breaking events between consecutive snapshots.
+
+    Bonds are defined by a distance cutoff and represented as sorted
+    integer pair keys, so consecutive snapshots are compared with set
+    differences on sorted arrays instead of per-atom neighbor lists.
+
+    Parameters
+    ----------
+    trajectory : :class:`~sknano.core.atoms.Trajectory`
+    rc : :class:`~python:float`
+        Bond cutoff distance.
+    skin : :class:`~python:float`, optional
+        Verlet skin distance used to reuse the candidate pair list
+        between snapshots.
+    pbc : :class:`~python:bool`, optional
+        Apply periodic boundary conditions using the orthogonal
+        simulation box of each snapshot.
+
+    Attributes
+    ----------
+    ids : :class:`~numpy:numpy.ndarray`
+        Sorted atom ids. Atom indices in pair arrays refer to this array.
+    timesteps : :class:`~numpy:numpy.ndarray`
+        Timesteps of the tracked snapshots.
+    bonds : :class:`~python:list`
+        :math:`(M_t, 2)` arrays of bonded atom ids for each snapshot.
+    formed_bonds, broken_bonds : :class:`~python:list`
+        :math:`(k, 2)` arrays of atom ids for the bonds formed/broken
+        relative to the previous snapshot. Both are empty for the first
+        snapshot.
+    coordination_numbers : :class:`~numpy:numpy.ndarray`
+        :math:`(T, N)` array of coordination numbers.
+
+    """
+    def __init__(self, trajectory=None, rc=None, skin=0.5, pbc=False):
+        super().__init__()
+        self.trajectory = trajectory
+        self.rc = rc
+        self.skin = skin
+        self.pbc = pbc
+        self.fmtstr = "trajectory={trajectory!r}, rc={rc!r}, skin={skin!r}, " \
+            "pbc={pbc!r}"
+
+        self.ids = None
+        self.timesteps = None
+        self.bonds = []
+        self.formed_bonds = []
+        self.broken_bonds = []
+        self.coordination_numbers = None
+        self._lifetimes = []
+        self._censored = []
+
+        if trajectory is not None and rc is not None:
+            self.compute()
+
+    def _boxsize(self, snapshot):
+        if not self.pbc:
+            return None
+        if snapshot.triclinic:
+            raise ValueError('Periodic bond tracking requires an '
+                             'orthogonal simulation box.')
+        return np.diag(snapshot.cell_matrix).copy()
+
+    def compute(self):
+        """Compute bond events for the selected trajectory snapshots.
+
+        Raises
+        ------
+        :class:`~python:ValueError`
+            If the number of atoms changes between snapshots.
+
+        """
+        snapshots = self.trajectory.selected_snapshots
+        Nsnaps = len(snapshots)
+
+        self.ids = \
+            np.sort(snapshots[0].get_attrs('id')[:, 0]).astype(int)
+        Natoms = len(self.ids)
+        self.timesteps = np.asarray([snapshot.timestep for snapshot in
+                                     snapshots])
+        self.bonds = []
+        self.formed_bonds = []
+        self.broken_bonds = []
+        self.coordination_numbers = np.zeros((Nsnaps, Natoms), dtype=int)
+        lifetimes = []
+        censored = []
+
+        verlet_list = None
+        alive = np.empty(0, dtype=np.int64)
+        birth = np.empty(0, dtype=int)
+        for t, snapshot in enumerate(snapshots):
+            r = snapshot.get_positions(unwrap=False)
+            if len(r) != Natoms:
+                raise ValueError(
+                    'Bond tracking requires a constant number of atoms, '
+                    'but the snapshot at timestep {} has {} atoms instead '
+                    'of {}.'.format(snapshot.timestep, len(r), Natoms))
+            boxsize = self._boxsize(snapshot)
+            if verlet_list is None or \
+                    not np.array_equal(boxsize, verlet_list.boxsize):
+                verlet_list = VerletList(self.rc, skin=self.skin,
+                                         boxsize=boxsize)
+            pairs = verlet_list.pairs(r)
+            keys = pairs[:, 0].astype(np.int64) * Natoms + pairs[:, 1]
+
+            self.coordination_numbers[t] = \
+                np.bincount(pairs.ravel(), minlength=Natoms)
+            self.bonds.append(self.ids[pairs])
+
+            survived = np.in1d(alive, keys, assume_unique=True)
+            broken = alive[~survived]
+            formed = np.setdiff1d(keys, alive, assume_unique=True) \
+                if t > 0 else alive
+            self.broken_bonds.append(self._keys_to_ids(broken))
+            self.formed_bonds.append(self._keys_to_ids(formed))
+
+            lifetimes.append(self.timesteps[t] -
+                             self.timesteps[birth[~survived]])
+            censored.append(birth[~survived] == 0)
+
+            new_birth = np.full(len(keys), t, dtype=int)
+            new_birth[np.searchsorted(keys, alive[survived])] = \
+                birth[survived]
+            alive, birth = keys, new_birth
+
+        lifetimes.append(self.timesteps[-1] - self.timesteps[birth])
+        censored.append(np.ones(len(birth), dtype=bool))
+        self._lifetimes = np.concatenate(lifetimes)
+        self._censored = np.concatenate(censored)
+
+    def _keys_to_ids(self, keys):
+        Natoms = len(self.ids)
+        return self.ids[np.column_stack((keys // Natoms, keys % Natoms))]
+
+    @property
+    def Nsnaps(self):
+        """Number of tracked snapshots."""
+        return len(self.bonds)
+
+    @property
+    def Nformed(self):
+        """:class:`~numpy:numpy.ndarray` of bond formation counts."""
+        return np.asarray([len(bonds) for bonds in self.formed_bonds])
+
+    @property
+    def Nbroken(self):
+        """:class:`~numpy:numpy.ndarray` of bond breaking counts."""
+        return np.asarray([len(bonds) for bonds in self.broken_bonds])
+
+    def survival_times(self, include_censored=False):
+        """Return bond survival times in timestep units.
+
+        Parameters
+        ----------
+        include_censored : :class:`~python:bool`, optional
+            If `True`, include the bonds that existed in the first
+            snapshot or still exist in the last snapshot, whose true
+            lifetimes are not known.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        if include_censored:
+            return self._lifetimes
+        return self._lifetimes[~self._censored]
+
+    def survival_time_distribution(self, include_censored=False, **kwargs):
+        """Histogram of bond survival times.
+
+        Parameters
+        ----------
+        include_censored : :class:`~python:bool`, optional
+        kwargs : :class:`~python:dict`, optional
+            Keyword arguments passed to :func:`~numpy:numpy.histogram`.
+
+        Returns
+        -------
+        hist, bin_edges : :class:`~numpy:numpy.ndarray`
+
+        """
+        return np.histogram(
+            self.survival_times(include_censored=include_censored), **kwargs)
+
+    @property
+    def coordination_changes(self):
+        """:math:`(T, N)` array of coordination number changes relative \
+            to the previous snapshot."""
+        CN = self.coordination_numbers
+        return np.vstack((np.zeros_like(CN[:1]), np.diff(CN, axis=0)))
+
+    def coordination_timeline(self, atom_id):
+        """Return the timesteps and coordination numbers at which the \
+            coordination number of atom `atom_id` changes.
+
+        Parameters
+        ----------
+        atom_id : :class:`~python:int`
+
+        Returns
+        -------
+        timesteps, CN : :class:`~numpy:numpy.ndarray`
+
+        """
+        i = np.searchsorted(self.ids, atom_id)
+        if i == len(self.ids) or self.ids[i] != atom_id:
+            raise ValueError('No atom with id = {}'.format(atom_id))
+        CN = self.coordination_numbers[:, i]
+        changed = np.concatenate(([True], CN[1:] != CN[:-1]))
+        return self.timesteps[changed], CN[changed]
+
+    def todict(self):
+        return dict(trajectory=self.trajectory, rc=self.rc, skin=self.skin,
+                    pbc=self.pbc)
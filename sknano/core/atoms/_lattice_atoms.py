@@ -17,13 +17,22 @@ import copy
 import numbers
 import numpy as np
 
-from sknano.core.math import Vector
+from sknano.core.math import Vector, rotation_matrix
 
 from ._atoms import Atom, Atoms
 
 __all__ = ['LatticeAtom', 'LatticeAtoms']
 
 
+def _transformed_lattice(lattice, transform, *args, **kwargs):
+    """Return a copy of `lattice` transformed by its `transform` method."""
+    if lattice is None:
+        return None
+    lattice = copy.deepcopy(lattice)
+    getattr(lattice, transform)(*args, **kwargs)
+    return lattice
+
+
 @total_ordering
 class LatticeAtom(Atom):
     """Class representation of a crystal structure lattice atom.
@@ -202,16 +211,19 @@ class LatticeAtom(Atom):
 
     @property
     def lattice(self):
-        """:class:`~sknano.core.crystallography.Crystal3DLattice`."""
+        """:class:`~sknano.core.crystallography.Crystal3DLattice`.
+
+        The lattice is stored by reference, so atoms assigned the same
+        lattice share a single lattice object. :meth:`rotate` and
+        :meth:`translate` replace the reference with a transformed copy
+        instead of modifying the shared lattice in place.
+
+        """
         return self._lattice
 
     @lattice.setter
     def lattice(self, value):
-        self._lattice = copy.deepcopy(value)
-        try:
-            self.rs = self.lattice.cartesian_to_fractional(self.r)
-        except AttributeError:
-            pass
+        self._lattice = value
 
     def rotate(self, **kwargs):
         """Rotate `Atom` position vector.
@@ -228,7 +240,8 @@ class LatticeAtom(Atom):
 
         """
         try:
-            self.lattice.rotate(**kwargs)
+            self._lattice = \
+                _transformed_lattice(self.lattice, 'rotate', **kwargs)
         except AttributeError:
             pass
         super().rotate(**kwargs)
@@ -244,7 +257,8 @@ class LatticeAtom(Atom):
         """
         if not fix_anchor_point:
             try:
-                self.lattice.translate(t)
+                self._lattice = \
+                    _transformed_lattice(self.lattice, 'translate', t)
             except AttributeError:
                 pass
         super().translate(t, fix_anchor_point=fix_anchor_point)
@@ -305,3 +319,62 @@ class LatticeAtoms(Atoms):
     @lattice.setter
     def lattice(self, value):
         [setattr(atom, 'lattice', value) for atom in self]
+
+    def rotate(self, **kwargs):
+        """Rotate `Atom` vectors and lattices.
+
+        Each distinct lattice referenced by the atoms is copied and rotated
+        once, and the rotated copy is shared by all atoms that referenced
+        it.
+
+        Parameters
+        ----------
+        angle : float
+        axis : :class:`~sknano.core.math.Vector`, optional
+        anchor_point : :class:`~sknano.core.math.Point`, optional
+        rot_point : :class:`~sknano.core.math.Point`, optional
+        from_vector, to_vector : :class:`~sknano.core.math.Vector`, optional
+        degrees : bool, optional
+        transform_matrix : :class:`~numpy:numpy.ndarray`
+
+        """
+        if kwargs.get('transform_matrix', None) is None:
+            kwargs['transform_matrix'] = rotation_matrix(**kwargs)
+        lattices = self._detach_lattices()
+        super().rotate(**kwargs)
+        self._attach_lattices(lattices, 'rotate', **kwargs)
+
+    def translate(self, t, fix_anchor_points=True):
+        """Translate `Atom` vectors by :class:`Vector` `t`.
+
+        If `fix_anchor_points` is `False`, each distinct lattice referenced
+        by the atoms is copied and translated once.
+
+        Parameters
+        ----------
+        t : :class:`Vector`
+        fix_anchor_points : bool, optional
+
+        """
+        lattices = self._detach_lattices()
+        super().translate(t, fix_anchor_points=fix_anchor_points)
+        if fix_anchor_points:
+            self._attach_lattices(lattices)
+        else:
+            self._attach_lattices(lattices, 'translate', t)
+
+    def _detach_lattices(self):
+        lattices = [atom.lattice for atom in self]
+        [setattr(atom, 'lattice', None) for atom in self]
+        return lattices
+
+    def _attach_lattices(self, lattices, transform=None, *args, **kwargs):
+        transformed = {}
+        for atom, lattice in zip(self, lattices):
+            if transform is not None and lattice is not None:
+                if id(lattice) not in transformed:
+                    transformed[id(lattice)] = \
+                        _transformed_lattice(lattice, transform, *args,
+                                             **kwargs)
+                lattice = transformed[id(lattice)]
+            atom.lattice = lattice
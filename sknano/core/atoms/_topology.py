@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+Bond topology generation (:mod:`sknano.core.atoms._topology`)
+===============================================================================
+
+Functions for generating bond, angle, and dihedral topology arrays
+from atom positions.
+
+.. currentmodule:: sknano.core.atoms._topology
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    raise ImportError('Install scipy version >= 0.16.0 to allow '
+                      'nearest-neighbor queries between atoms.')
+
+__all__ = ['compute_bonds', 'compute_angles', 'compute_dihedrals',
+           'assign_topology_types', 'generate_topology']
+
+
+def _neighbor_list(bonds, Natoms):
+    """Return the CSR neighbor list `indptr`, `indices` of `bonds`."""
+    i = np.concatenate((bonds[:, 0], bonds[:, 1]))
+    j = np.concatenate((bonds[:, 1], bonds[:, 0]))
+    order = np.lexsort((j, i))
+    indptr = np.concatenate(
+        ([0], np.cumsum(np.bincount(i, minlength=Natoms))))
+    return indptr, j[order]
+
+
+def _group_arange(counts):
+    """Return concatenated `np.arange(count)` for each of the `counts`."""
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(counts.sum()) - offsets
+
+
+def compute_bonds(coords, rc=2.0, boxsize=None):
+    """Compute the bonded atom pairs within a cutoff distance.
+
+    Parameters
+    ----------
+    coords : array_like
+        :math:`(N, 3)` array of atom positions.
+    rc : :class:`~python:float`, optional
+        Bond cutoff distance.
+    boxsize : {None, array_like}, optional
+        Orthogonal periodic box lengths. Dimensions with a box length of
+        `0` are not periodic. The `coords` are wrapped into the box.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+        Sorted :math:`(M, 2)` array of atom index pairs :math:`(i, j)`
+        with :math:`i < j`.
+
+    """
+    coords = np.asarray(coords, dtype=float)
+    if len(coords) < 2:
+        return np.empty((0, 2), dtype=int)
+
+    if boxsize is not None:
+        boxsize = np.asarray(boxsize, dtype=float) * np.ones(3)
+        periodic = boxsize > 0
+        coords = coords - coords.min(axis=0)
+        # pad the non-periodic dimensions so that no pair is within `rc`
+        # across their boundaries
+        boxsize[~periodic] = coords[:, ~periodic].max(axis=0) + 2 * rc + 1
+        coords = np.mod(coords, boxsize)
+        coords[coords >= boxsize] = 0.0
+
+    # sliding midpoint splits build much faster than median splits
+    # for the degenerate coordinates of lattice structures
+    tree = cKDTree(coords, boxsize=boxsize, balanced_tree=False)
+    bonds = np.array(list(tree.query_pairs(rc)), dtype=int).reshape((-1, 2))
+    return bonds[np.lexsort((bonds[:, 1], bonds[:, 0]))]
+
+
+def compute_angles(bonds, Natoms=None):
+    """Compute the bond angle triplets of a set of bonds.
+
+    Parameters
+    ----------
+    bonds : array_like
+        :math:`(M, 2)` array of bonded atom index pairs.
+    Natoms : {None, :class:`~python:int`}, optional
+        Number of atoms. Default is one more than the largest atom index.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+        :math:`(K, 3)` array of atom index triplets :math:`(i, j, k)`
+        with the vertex atom :math:`j` in the middle and :math:`i < k`.
+
+    """
+    bonds = np.asarray(bonds, dtype=int).reshape(-1, 2)
+    if Natoms is None:
+        Natoms = bonds.max() + 1 if len(bonds) > 0 else 0
+    indptr, indices = _neighbor_list(bonds, Natoms)
+
+    # pair each neighbor list entry with the entries after it in its row
+    vertices = np.repeat(np.arange(Natoms), np.diff(indptr))
+    counts = indptr[vertices + 1] - np.arange(len(indices)) - 1
+    first = np.repeat(np.arange(len(indices)), counts)
+    second = first + 1 + _group_arange(counts)
+    return np.column_stack((indices[first], vertices[first],
+                            indices[second]))
+
+
+def compute_dihedrals(bonds, Natoms=None):
+    """Compute the dihedral quadruplets of a set of bonds.
+
+    Parameters
+    ----------
+    bonds : array_like
+        :math:`(M, 2)` array of bonded atom index pairs.
+    Natoms : {None, :class:`~python:int`}, optional
+        Number of atoms. Default is one more than the largest atom index.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+        :math:`(L, 4)` array of atom index quadruplets :math:`(i, j, k, l)`
+        about the central bond :math:`(j, k)`, with :math:`j < k`.
+
+    """
+    bonds = np.asarray(bonds, dtype=int).reshape(-1, 2)
+    if Natoms is None:
+        Natoms = bonds.max() + 1 if len(bonds) > 0 else 0
+    indptr, indices = _neighbor_list(bonds, Natoms)
+    degree = np.diff(indptr)
+
+    j, k = np.sort(bonds, axis=1).T
+    dj, dk = degree[j], degree[k]
+    counts = dj * dk
+    t = _group_arange(counts)
+    dk_t = np.repeat(dk, counts)
+    j_t = np.repeat(j, counts)
+    k_t = np.repeat(k, counts)
+    i_t = indices[indptr[j_t] + t // dk_t]
+    l_t = indices[indptr[k_t] + t % dk_t]
+    mask = (i_t != k_t) & (l_t != j_t) & (i_t != l_t)
+    return np.column_stack((i_t, j_t, k_t, l_t))[mask]
+
+
+def assign_topology_types(labels, tuples):
+    """Assign types to topology tuples from the labels of their atoms.
+
+    Tuples with the same sequence of atom labels, read forwards or
+    backwards, are assigned the same type.
+
+    Parameters
+    ----------
+    labels : array_like
+        :math:`(N,)` array of atom labels, e.g. elements or atom types.
+    tuples : array_like
+        :math:`(M, k)` array of atom indices.
+
+    Returns
+    -------
+    types : :class:`~numpy:numpy.ndarray`
+        :math:`(M,)` array of types numbered from 1.
+    type_labels : :class:`~python:list`
+        List of the atom label tuples of each type.
+
+    """
+    unique_labels, codes = np.unique(np.asarray(labels), return_inverse=True)
+    tuples = np.asarray(tuples, dtype=int)
+    if len(tuples) == 0:
+        return np.empty(0, dtype=int), []
+    n = len(unique_labels)
+    codes = codes[tuples].astype(np.int64)
+    forward = np.zeros(len(codes), dtype=np.int64)
+    backward = np.zeros(len(codes), dtype=np.int64)
+    for col in range(codes.shape[1]):
+        forward = forward * n + codes[:, col]
+        backward = backward * n + codes[:, -1 - col]
+    keys, types = np.unique(np.minimum(forward, backward),
+                            return_inverse=True)
+
+    type_labels = []
+    for key in keys.tolist():
+        label = []
+        for _ in range(codes.shape[1]):
+            key, code = divmod(key, n)
+            label.append(unique_labels[code])
+        type_labels.append(tuple(label[::-1]))
+    return types + 1, type_labels
+
+
+def generate_topology(coords, labels, rc=2.0, angles=True, dihedrals=False,
+                      boxsize=None):
+    """Generate bond topology from atom positions.
+
+    Parameters
+    ----------
+    coords : array_like
+        :math:`(N, 3)` array of atom positions.
+    labels : array_like
+        :math:`(N,)` array of atom labels used to assign the
+        bond/angle/dihedral types, e.g. elements.
+    rc : :class:`~python:float`, optional
+        Bond cutoff distance.
+    angles, dihedrals : :class:`~python:bool`, optional
+        Generate angles and dihedrals.
+    boxsize : {None, array_like}, optional
+        Orthogonal periodic box lengths. See :func:`compute_bonds`.
+
+    Returns
+    -------
+    :class:`~python:collections.OrderedDict`
+        Maps each of the `'Bonds'`, `'Angles'`, and `'Dihedrals'` sections
+        to a tuple `(types, indices, type_labels)` as returned by
+        :func:`compute_bonds`, :func:`compute_angles`,
+        :func:`compute_dihedrals`, and :func:`assign_topology_types`.
+
+    """
+    Natoms = len(coords)
+    topology = OrderedDict()
+    bonds = compute_bonds(coords, rc=rc, boxsize=boxsize)
+    topology['Bonds'] = bonds
+    if angles:
+        topology['Angles'] = compute_angles(bonds, Natoms=Natoms)
+    if dihedrals:
+        topology['Dihedrals'] = compute_dihedrals(bonds, Natoms=Natoms)
+
+    for section, indices in topology.items():
+        types, type_labels = assign_topology_types(labels, indices)
+        topology[section] = (types, indices, type_labels)
+    return topology
@@ -18,9 +18,127 @@ from operator import attrgetter
 import numpy as np
 
 from sknano.core import BaseClass, UserList
+from ._bond_tracker import BondTracker
 from ._md_atoms import MDAtom as Atom, MDAtoms as Atoms
 
-__all__ = ['Snapshot', 'Trajectory']
+__all__ = ['Snapshot', 'Trajectory', 'compute_msd', 'compute_vacf']
+
+
+def _fft_autocorrelation(a):
+    """Unnormalized autocorrelation of `a` along axis 0 using FFTs.
+
+    Parameters
+    ----------
+    a : :class:`~numpy:numpy.ndarray`
+        Array with time along the first axis.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+        Array with the same shape as `a` whose :math:`m^{th}` row is
+        :math:`\\sum_{k=0}^{T-m-1}a_k a_{k+m}`.
+
+    """
+    T = a.shape[0]
+    nfft = 1 << int(2 * T - 1).bit_length()
+    F = np.fft.rfft(a, n=nfft, axis=0)
+    return np.fft.irfft(F * F.conjugate(), n=nfft, axis=0)[:T]
+
+
+def compute_msd(positions, per_atom=False, chunk_size=1024):
+    """Compute the mean-squared displacement averaged over time origins.
+
+    The MSD is computed for all lag times with the :math:`O(T\\log T)`
+    FFT algorithm, processing `chunk_size` atoms at a time to bound the
+    size of the intermediate arrays.
+
+    Parameters
+    ----------
+    positions : array_like
+        :math:`(T, N, 3)` array of unwrapped atom positions.
+    per_atom : :class:`~python:bool`, optional
+        If `True`, return the :math:`(T, N)` MSD of each atom, otherwise
+        return the :math:`(T,)` MSD averaged over atoms.
+    chunk_size : :class:`~python:int`, optional
+        Number of atoms processed per FFT batch.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+
+    """
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim == 2:
+        positions = positions[:, :, np.newaxis]
+    T, N = positions.shape[:2]
+    norm = (T - np.arange(T))[:, np.newaxis]
+
+    msd = np.empty((T, N)) if per_atom else np.zeros(T)
+    for start in range(0, N, chunk_size):
+        r = positions[:, start:start + chunk_size]
+        D = (r ** 2).sum(axis=-1)
+        D_cumsum = np.vstack((np.zeros((1, D.shape[1])),
+                              np.cumsum(D, axis=0)))
+        # sum_{k=0}^{T-m-1} (r_{k+m}^2 + r_k^2)
+        S1 = (D_cumsum[-1] - D_cumsum[:T]) + D_cumsum[T:0:-1]
+        S2 = _fft_autocorrelation(r).sum(axis=-1)
+        chunk_msd = (S1 - 2 * S2) / norm
+        if per_atom:
+            msd[:, start:start + chunk_size] = chunk_msd
+        else:
+            msd += chunk_msd.sum(axis=-1)
+
+    if not per_atom and N > 0:
+        msd /= N
+    return msd
+
+
+def compute_vacf(velocities, per_atom=False, normalize=False,
+                 chunk_size=1024):
+    """Compute the velocity autocorrelation function.
+
+    The VACF is averaged over all time origins and computed for all lag
+    times with FFTs, processing `chunk_size` atoms at a time.
+
+    Parameters
+    ----------
+    velocities : array_like
+        :math:`(T, N, 3)` array of atom velocities.
+    per_atom : :class:`~python:bool`, optional
+        If `True`, return the :math:`(T, N)` VACF of each atom, otherwise
+        return the :math:`(T,)` VACF averaged over atoms.
+    normalize : :class:`~python:bool`, optional
+        If `True`, normalize the VACF by its value at zero lag time.
+    chunk_size : :class:`~python:int`, optional
+        Number of atoms processed per FFT batch.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+
+    """
+    velocities = np.asarray(velocities, dtype=float)
+    if velocities.ndim == 2:
+        velocities = velocities[:, :, np.newaxis]
+    T, N = velocities.shape[:2]
+    norm = (T - np.arange(T))[:, np.newaxis]
+
+    vacf = np.empty((T, N)) if per_atom else np.zeros(T)
+    for start in range(0, N, chunk_size):
+        v = velocities[:, start:start + chunk_size]
+        chunk_vacf = _fft_autocorrelation(v).sum(axis=-1) / norm
+        if per_atom:
+            vacf[:, start:start + chunk_size] = chunk_vacf
+        else:
+            vacf += chunk_vacf.sum(axis=-1)
+
+    if not per_atom and N > 0:
+        vacf /= N
+
+    if normalize:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vacf = vacf / vacf[0]
+    return vacf
 
 
 class AtomSelection:
@@ -231,6 +349,71 @@ class Snapshot(BaseClass):
             return self._atoms
         return self.atoms
 
+    def get_attrs(self, *attrs, sort_by_id=True):
+        """Get array of per-atom attribute values.
+
+        Parameters
+        ----------
+        *attrs : :class:`~python:str`
+            One or more atom attribute names.
+        sort_by_id : :class:`~python:bool`, optional
+            If `True`, sort the rows by atom id so that rows from different
+            snapshots refer to the same atoms.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            :math:`(N, len(attrs))` array.
+
+        """
+        atoms = self.get_atoms(asarray=True)
+        try:
+            cols = [self.atomattrs.index(attr) for attr in attrs]
+        except ValueError:
+            raise ValueError('Snapshot atom attributes must include '
+                             '{}'.format(', '.join(attrs)))
+        values = atoms[:, cols]
+        if sort_by_id and 'id' in self.atomattrs:
+            values = \
+                values[np.argsort(atoms[:, self.atomattrs.index('id')],
+                                  kind='mergesort')]
+        return values
+
+    @property
+    def cell_matrix(self):
+        """Simulation box matrix with rows :math:`\\mathbf{a}`, \
+            :math:`\\mathbf{b}`, :math:`\\mathbf{c}`."""
+        xlo, xhi, ylo, yhi = self.xlo, self.xhi, self.ylo, self.yhi
+        xy, xz, yz = self.xy, self.xz, self.yz
+        if self.triclinic:
+            xlo = xlo - min((0.0, xy, xz, xy + xz))
+            xhi = xhi - max((0.0, xy, xz, xy + xz))
+            ylo = ylo - min((0.0, yz))
+            yhi = yhi - max((0.0, yz))
+        return np.array([[xhi - xlo, 0.0, 0.0],
+                         [xy, yhi - ylo, 0.0],
+                         [xz, yz, self.zhi - self.zlo]])
+
+    def get_positions(self, unwrap=True):
+        """Get :math:`(N, 3)` array of atom positions sorted by atom id.
+
+        Parameters
+        ----------
+        unwrap : :class:`~python:bool`, optional
+            If `True` and the image flags *ix*, *iy*, *iz* were dumped,
+            return the unwrapped positions.
+
+        """
+        r = self.get_attrs('x', 'y', 'z')
+        if unwrap and all(attr in self.atomattrs for attr in
+                          ('ix', 'iy', 'iz')):
+            r += np.dot(self.get_attrs('ix', 'iy', 'iz'), self.cell_matrix)
+        return r
+
+    def get_velocities(self):
+        """Get :math:`(N, 3)` array of atom velocities sorted by atom id."""
+        return self.get_attrs('vx', 'vy', 'vz')
+
     def todict(self):
         return dict(trajectory=self.trajectory)
 
@@ -376,5 +559,130 @@ class Trajectory(BaseClass, UserList):
                 v[i] = snapshot.timestep
         return v
 
+    @property
+    def selected_snapshots(self):
+        """List of selected :class:`Snapshot`\\ s."""
+        return [snapshot for snapshot in self if snapshot.selected]
+
+    def get_positions(self, unwrap=True):
+        """Get :math:`(T, N, 3)` array of atom positions.
+
+        The positions of the selected snapshots are sorted by atom id
+        and stacked into one contiguous array.
+
+        Parameters
+        ----------
+        unwrap : :class:`~python:bool`, optional
+            Unwrap positions using the dumped image flags.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        return np.ascontiguousarray(
+            [snapshot.get_positions(unwrap=unwrap)
+             for snapshot in self.selected_snapshots])
+
+    def get_velocities(self):
+        """Get :math:`(T, N, 3)` array of atom velocities."""
+        return np.ascontiguousarray(
+            [snapshot.get_velocities() for snapshot in
+             self.selected_snapshots])
+
+    def _get_types(self):
+        return self.selected_snapshots[0].get_attrs('type')[:, 0].astype(int)
+
+    def msd(self, per_atom=False, by_type=False, unwrap=True,
+            chunk_size=1024):
+        """Mean-squared displacement of the selected snapshots.
+
+        The MSD is averaged over all time origins, with lag times
+        given by the spacing of the selected snapshots.
+
+        Parameters
+        ----------
+        per_atom : :class:`~python:bool`, optional
+            Return the :math:`(T, N)` MSD of each atom.
+        by_type : :class:`~python:bool`, optional
+            Return a :class:`~python:dict` mapping each atom type to
+            its :math:`(T,)` MSD.
+        unwrap : :class:`~python:bool`, optional
+            Unwrap positions using the dumped image flags.
+        chunk_size : :class:`~python:int`, optional
+            Number of atoms processed per FFT batch.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray` or :class:`~python:dict`
+
+        See Also
+        --------
+        compute_msd
+
+        """
+        positions = self.get_positions(unwrap=unwrap)
+        if by_type:
+            types = self._get_types()
+            return {atomtype: compute_msd(positions[:, types == atomtype],
+                                          chunk_size=chunk_size)
+                    for atomtype in np.unique(types)}
+        return compute_msd(positions, per_atom=per_atom,
+                           chunk_size=chunk_size)
+
+    def vacf(self, per_atom=False, by_type=False, normalize=False,
+             chunk_size=1024):
+        """Velocity autocorrelation function of the selected snapshots.
+
+        Parameters
+        ----------
+        per_atom : :class:`~python:bool`, optional
+            Return the :math:`(T, N)` VACF of each atom.
+        by_type : :class:`~python:bool`, optional
+            Return a :class:`~python:dict` mapping each atom type to
+            its :math:`(T,)` VACF.
+        normalize : :class:`~python:bool`, optional
+            Normalize the VACF by its value at zero lag time.
+        chunk_size : :class:`~python:int`, optional
+            Number of atoms processed per FFT batch.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray` or :class:`~python:dict`
+
+        See Also
+        --------
+        compute_vacf
+
+        """
+        velocities = self.get_velocities()
+        if by_type:
+            types = self._get_types()
+            return {atomtype: compute_vacf(velocities[:, types == atomtype],
+                                           normalize=normalize,
+                                           chunk_size=chunk_size)
+                    for atomtype in np.unique(types)}
+        return compute_vacf(velocities, per_atom=per_atom,
+                            normalize=normalize, chunk_size=chunk_size)
+
+    def track_bonds(self, rc, skin=0.5, pbc=False):
+        """Track bond formation and breaking in the selected snapshots.
+
+        Parameters
+        ----------
+        rc : :class:`~python:float`
+            Bond cutoff distance.
+        skin : :class:`~python:float`, optional
+            Verlet skin distance.
+        pbc : :class:`~python:bool`, optional
+            Apply periodic boundary conditions.
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.BondTracker`
+
+        """
+        return BondTracker(self, rc=rc, skin=skin, pbc=pbc)
+
     def todict(self):
         return dict(snapshots=self.data)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import nose
 from nose.tools import assert_true, assert_equal, assert_is_instance
+import numpy as np
 from sknano.core.atoms import BasisAtom, BasisAtoms
 from sknano.core.crystallography import Crystal2DLattice, Crystal3DLattice
 from sknano.testing import generate_atoms
@@ -64,5 +65,25 @@ def test5():
     print(atoms[:2])
 
 
+def test6():
+    lattice = Crystal3DLattice.cubic(a=5.0)
+    basis = BasisAtoms(atoms=['C', 'C'])
+    basis[1].x = 2.5
+    basis.lattice = lattice
+    assert_true(all(atom.lattice is lattice for atom in basis))
+    assert_true(np.allclose(basis.rs, [[0, 0, 0], [0.5, 0, 0]]))
+
+    c, s = np.cos(np.pi / 2), np.sin(np.pi / 2)
+    transform_matrix = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+    basis.rotate(transform_matrix=transform_matrix)
+    assert_true(basis[0].lattice is basis[1].lattice)
+    assert_true(basis[0].lattice is not lattice)
+    assert_true(np.allclose(lattice.orientation_matrix, np.eye(3)))
+    assert_true(np.allclose(basis.rs, [[0, 0, 0], [0.5, 0, 0]]))
+
+    basis[0].rotate(transform_matrix=transform_matrix)
+    assert_true(basis[0].lattice is not basis[1].lattice)
+
+
 if __name__ == '__main__':
     nose.runmodule()
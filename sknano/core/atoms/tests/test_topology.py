@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import *
+import numpy as np
+from sknano.core.atoms import compute_bonds, compute_angles, \
+    compute_dihedrals, assign_topology_types, generate_topology
+from sknano.generators import SWNTGenerator
+
+
+def test1():
+    # butane-like zigzag chain 0-1-2-3 plus a branch 1-4
+    coords = np.array([[0.0, 0.0, 0.0], [1.5, 0.0, 0.0], [2.0, 1.4, 0.0],
+                       [3.5, 1.4, 0.0], [1.5, -1.5, 0.0]])
+    bonds = compute_bonds(coords, rc=1.6)
+    assert_equal(bonds.tolist(), [[0, 1], [1, 2], [1, 4], [2, 3]])
+
+    angles = compute_angles(bonds)
+    assert_equal(sorted(map(tuple, angles.tolist())),
+                 [(0, 1, 2), (0, 1, 4), (1, 2, 3), (2, 1, 4)])
+
+    dihedrals = compute_dihedrals(bonds)
+    assert_equal(sorted(map(tuple, dihedrals.tolist())),
+                 [(0, 1, 2, 3), (4, 1, 2, 3)])
+
+
+def test2():
+    labels = ['C', 'N', 'C', 'N']
+    types, type_labels = \
+        assign_topology_types(labels, [[0, 1], [1, 2], [0, 2], [3, 1]])
+    assert_equal(type_labels, [('C', 'C'), ('C', 'N'), ('N', 'N')])
+    assert_equal(types.tolist(), [2, 2, 1, 3])
+
+    types, type_labels = \
+        assign_topology_types(labels, [[1, 0, 2], [0, 1, 3], [3, 1, 0]])
+    assert_equal(type_labels, [('C', 'C', 'N'), ('C', 'N', 'N')])
+    assert_equal(types.tolist(), [1, 2, 2])
+
+
+def test3():
+    swnt = SWNTGenerator(n=10, m=10, nz=3)
+    atoms = swnt.atoms
+    topology = generate_topology(atoms.coords, atoms.elements, rc=2.0,
+                                 dihedrals=True)
+    bond_types, bonds, bond_labels = topology['Bonds']
+    assert_equal(bond_labels, [('C', 'C')])
+    assert_true(np.all(bonds[:, 0] < bonds[:, 1]))
+    CN = np.bincount(bonds.ravel(), minlength=atoms.Natoms)
+    assert_equal(CN.sum(), 2 * len(bonds))
+    assert_true(np.all((CN == 2) | (CN == 3)))
+
+    angle_types, angles, angle_labels = topology['Angles']
+    assert_equal(len(angles), (CN * (CN - 1) // 2).sum())
+    assert_equal(angle_labels, [('C', 'C', 'C')])
+
+    dihedral_types, dihedrals, _ = topology['Dihedrals']
+    assert_equal(len(dihedrals),
+                 ((CN[bonds[:, 0]] - 1) * (CN[bonds[:, 1]] - 1)).sum())
+
+    bonds = compute_bonds(atoms.coords, rc=2.0,
+                          boxsize=[0, 0, swnt.lattice.c])
+    CN = np.bincount(bonds.ravel(), minlength=atoms.Natoms)
+    assert_true(np.all(CN == 3))
+
+
+if __name__ == '__main__':
+    nose.runmodule()
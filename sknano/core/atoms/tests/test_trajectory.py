@@ -11,7 +11,8 @@ from nose.tools import *
 
 import numpy as np
 
-from sknano.core.atoms import Trajectory
+from sknano.core.atoms import Trajectory, Snapshot, compute_msd, \
+    compute_vacf
 from sknano.io import DUMPReader
 # from sknano.testing import generate_atoms
 
@@ -56,6 +57,67 @@ def test2():
         prev_ss_atom = atom
 
 
+def test3():
+    rng = np.random.RandomState(0)
+    T = 50
+    positions = np.cumsum(rng.randn(T, 7, 3), axis=0)
+    msd = np.array([np.mean(((positions[m:] - positions[:T-m]) ** 2).sum(-1),
+                            axis=0) for m in range(T)])
+    assert_true(np.allclose(compute_msd(positions, per_atom=True,
+                                        chunk_size=3), msd))
+    assert_true(np.allclose(compute_msd(positions), msd.mean(axis=1)))
+
+
+def test4():
+    rng = np.random.RandomState(1)
+    T = 40
+    velocities = rng.randn(T, 5, 3)
+    vacf = np.array([np.mean((velocities[m:] * velocities[:T-m]).sum(-1),
+                             axis=0) for m in range(T)])
+    assert_true(np.allclose(compute_vacf(velocities, per_atom=True,
+                                         chunk_size=2), vacf))
+    assert_true(np.allclose(compute_vacf(velocities, normalize=True),
+                            vacf.mean(axis=1) / vacf.mean(axis=1)[0]))
+
+
+def test5():
+    traj = Trajectory()
+    frames = [[[0, 0, 0], [1.4, 0, 0], [5, 5, 5]],
+              [[0, 0, 0], [1.4, 0, 0], [6, 5, 5]],
+              [[0, 0, 0], [2.4, 0, 0], [9.5, 0, 0]],
+              [[0, 0, 0], [1.4, 0, 0], [9.5, 0, 0]]]
+    for i, frame in enumerate(frames):
+        snapshot = Snapshot(traj)
+        snapshot.timestep = 10 * i
+        snapshot.atomattrs = ['id', 'type', 'x', 'y', 'z']
+        snapshot.attr_dtypes = [int, int, float, float, float]
+        snapshot.atoms = np.column_stack(([3, 2, 1], [1, 1, 1], frame[::-1]))
+        snapshot.selected = True
+        snapshot.triclinic = False
+        snapshot.xlo = snapshot.ylo = snapshot.zlo = 0.0
+        snapshot.xhi = snapshot.yhi = snapshot.zhi = 10.0
+        snapshot.xy = snapshot.xz = snapshot.yz = 0.0
+        traj.append(snapshot)
+
+    bonds = traj.track_bonds(1.6)
+    assert_true(np.all(bonds.Nformed == [0, 0, 0, 1]))
+    assert_true(np.all(bonds.Nbroken == [0, 0, 1, 0]))
+    assert_true(np.all(bonds.broken_bonds[2] == [[1, 2]]))
+    assert_true(np.all(bonds.coordination_numbers[:, 0] == [1, 1, 0, 1]))
+    assert_true(np.all(bonds.survival_times(include_censored=True) ==
+                       [20, 0]))
+    assert_equal(len(bonds.survival_times()), 0)
+
+    bonds = traj.track_bonds(1.6, pbc=True)
+    assert_true(np.all(bonds.bonds[3] == [[1, 2], [1, 3]]))
+    timesteps, CN = bonds.coordination_timeline(1)
+    assert_true(np.all(timesteps == [0, 30]))
+    assert_true(np.all(CN == [1, 2]))
+
+    traj[3].atoms = np.column_stack(([2, 1], [1, 1], frames[3][1::-1]))
+    assert_raises(ValueError, traj.track_bonds, 1.6)
+
+
 class TrajectoryTestFixture(unittest.TestCase):
 
     def setUp(self):
@@ -94,6 +156,28 @@ class TestCase(TrajectoryTestFixture):
         assert_equal(self.dump.nselected, self.dump.Nsnaps)
         assert_equal(self.dump.Nsnaps, len(self.dump.timesteps))
 
+    def test5(self):
+        traj = self.dump.trajectory
+        positions = traj.get_positions()
+        assert_equal(positions.shape, (traj.Nsnaps, traj[0].Natoms, 3))
+        msd = traj.msd()
+        assert_equal(msd.shape, (traj.Nsnaps,))
+        assert_almost_equal(msd[0], 0.0)
+        msd_by_type = traj.msd(by_type=True)
+        assert_true(np.allclose(msd_by_type[1], msd))
+        vacf = traj.vacf(per_atom=True)
+        assert_equal(vacf.shape, (traj.Nsnaps, traj[0].Natoms))
+
+    def test6(self):
+        traj = self.dump.trajectory
+        bonds = traj.track_bonds(1.7)
+        assert_equal(bonds.Nsnaps, traj.Nsnaps)
+        assert_equal(bonds.coordination_numbers.shape,
+                     (traj.Nsnaps, traj[0].Natoms))
+        assert_true(np.all(np.cumsum(bonds.Nformed - bonds.Nbroken) ==
+                           [len(b) - len(bonds.bonds[0])
+                            for b in bonds.bonds]))
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -12,7 +12,7 @@ from __future__ import absolute_import, division, print_function, \
 __docformat__ = 'restructuredtext en'
 
 from functools import total_ordering
-# import copy
+import copy
 import numbers
 
 import numpy as np
@@ -108,14 +108,20 @@ class UnitCell(BaseClass):
 
     def rotate(self, **kwargs):
         """Rotate unit cell lattice vectors and basis."""
-        self.lattice.rotate(**kwargs)
+        # The lattice may be shared with the basis atoms and other cells,
+        # so rotate a copy instead of the lattice itself.
+        lattice = copy.deepcopy(self.lattice)
+        lattice.rotate(**kwargs)
         self.basis.rotate(**kwargs)
+        self.lattice = self.basis.lattice = lattice
 
     def translate(self, t, fix_anchor_points=True):
         """Translate unit cell basis."""
-        if not fix_anchor_points:
-            self.lattice.translate(t)
         self.basis.translate(t, fix_anchor_points=fix_anchor_points)
+        if not fix_anchor_points:
+            lattice = copy.deepcopy(self.lattice)
+            lattice.translate(t)
+            self.lattice = self.basis.lattice = lattice
 
     def todict(self):
         """Return `dict` of `UnitCell` parameters."""
@@ -140,6 +146,10 @@ class CrystalCell(BaseClass):
 
     """
 
+    # Pending supercell basis, built by the `basis` getter on first
+    # access. See the `@scaling_matrix.setter` method.
+    _supercell_basis = None
+
     def __init__(self, lattice=None, basis=None, coords=None, cartesian=False,
                  wrap_coords=False, unit_cell=None, scaling_matrix=None):
         super().__init__()
@@ -218,10 +228,13 @@ class CrystalCell(BaseClass):
 
     @property
     def basis(self):
+        if self._supercell_basis is not None:
+            self._build_supercell_basis()
         return self._basis
 
     @basis.setter
     def basis(self, value):
+        self._supercell_basis = None
         self._basis = value
         # if self.unit_cell is not None:
         #     self.unit_cell.basis[:] = \
@@ -234,8 +247,8 @@ class CrystalCell(BaseClass):
     @lattice.setter
     def lattice(self, value):
         self._lattice = value
-        if self.basis is not None:
-            self.basis.lattice = self.lattice
+        if self._supercell_basis is None and self._basis is not None:
+            self._basis.lattice = self.lattice
 
     @property
     def unit_cell(self):
@@ -291,33 +304,66 @@ class CrystalCell(BaseClass):
                 np.asmatrix(supercell_lattice_points(self.scaling_matrix)) *
                 self.lattice.matrix)
 
-        basis = self.basis[:]
-        self.basis = BasisAtoms()
-        for atom in basis:
-            for tvec in tvecs:
-                xs, ys, zs = \
-                    self.lattice.cartesian_to_fractional(atom.r + tvec)
-                if self.wrap_coords:
-                    xs, ys, zs = \
-                        self.lattice.wrap_fractional_coordinate(
-                            [xs, ys, zs])
-                self.basis.append(BasisAtom(atom.element, lattice=self.lattice,
-                                            xs=xs, ys=ys, zs=zs))
+        # The supercell basis atoms are only created when the `basis` is
+        # first accessed, so that the supercell lattice is available
+        # without the cost of creating every supercell atom.
+        elements, r = self._basis_arrays()
+        if len(r) == 0:
+            self.basis = BasisAtoms()
+            return
+        self._supercell_basis = \
+            (elements, r, tvecs, self.lattice, self.wrap_coords)
+
+    def _basis_arrays(self):
+        """Return the :attr:`basis` elements and coordinates arrays."""
+        if self._supercell_basis is not None:
+            return self._supercell_arrays()
+        basis = self._basis
+        if basis is None or basis.Natoms == 0:
+            return np.array([], dtype=str), np.zeros((0, 3))
+        return np.asarray(basis.elements), np.asarray(basis.r)
+
+    def _supercell_arrays(self):
+        """Return the elements and coordinates arrays of the pending \
+            supercell basis."""
+        elements, r, tvecs, lattice, wrap_coords = self._supercell_basis
+        # Replicate every basis atom over every lattice translation vector
+        # at once. The atom-major ordering of the previous nested loops is
+        # preserved by the `(Natoms, Ntvecs, 3)` broadcast.
+        r = (r[:, np.newaxis, :] + tvecs[np.newaxis, :, :]).reshape((-1, 3))
+        rs = lattice.cartesian_to_fractional(r).reshape((-1, 3))
+        if wrap_coords:
+            rs = np.asarray(lattice.wrap_fractional_coordinate(rs))
+        r = lattice.fractional_to_cartesian(rs).reshape((-1, 3))
+        return np.repeat(elements, len(tvecs)), r
+
+    def _build_supercell_basis(self):
+        elements, r = self._supercell_arrays()
+        self._supercell_basis = None
+        self._basis = BasisAtoms([BasisAtom(element, x=x, y=y, z=z)
+                                  for element, (x, y, z) in
+                                  zip(elements.tolist(), r.tolist())],
+                                 casttype=False)
+        self._basis.lattice = self.lattice
 
     def rotate(self, **kwargs):
         """Rotate crystal cell lattice, basis, and unit cell."""
-        if self.lattice is not None:
-            self.lattice.rotate(**kwargs)
+        lattice = copy.deepcopy(self.lattice)
+        if lattice is not None:
+            lattice.rotate(**kwargs)
         if self.basis is not None:
             self.basis.rotate(**kwargs)
+        self.lattice = lattice
         self.unit_cell.rotate(**kwargs)
 
     def translate(self, t, fix_anchor_points=True):
         """Translate crystal cell basis."""
-        if not fix_anchor_points and self.lattice is not None:
-            self.lattice.translate(t)
         if self.basis is not None:
             self.basis.translate(t, fix_anchor_points=fix_anchor_points)
+        if not fix_anchor_points and self.lattice is not None:
+            lattice = copy.deepcopy(self.lattice)
+            lattice.translate(t)
+            self.lattice = lattice
         self.unit_cell.translate(t, fix_anchor_points=fix_anchor_points)
 
     def update_basis(self, element, index=None, step=None):
@@ -147,6 +147,7 @@ class LatticeBase(BaseClass):
         Parameters
         ----------
         p : array_like
+            :math:`(3,)` coordinate or :math:`(N, 3)` array of coordinates.
 
         Returns
         -------
@@ -156,7 +157,7 @@ class LatticeBase(BaseClass):
         if pbc is None:
             pbc = np.asarray(np.ones(3), dtype=bool)
 
-        p = np.ma.array(p, mask=~pbc)
+        p = np.ma.array(p, mask=np.ones(np.shape(p), dtype=bool) & ~pbc)
         p = np.ma.fmod(p, 1)
         p[np.ma.where(p < 0)] += 1
         p[np.ma.where(p > 1 - epsilon)] -= 1
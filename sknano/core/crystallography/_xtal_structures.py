@@ -175,7 +175,19 @@ class BaseStructureMixin:
 
     def read_xyz(self, *args, **kwargs):
         from sknano.io import XYZReader
-        return XYZReader.read(*args, **kwargs)
+        return XYZReader(*args, **kwargs)
+
+    def read_pdb(self, *args, **kwargs):
+        from sknano.io import PDBReader
+        return PDBReader(*args, **kwargs)
+
+    def read_npz(self, *args, **kwargs):
+        from sknano.io import NPZReader
+        return NPZReader(*args, **kwargs)
+
+    def read_h5(self, *args, **kwargs):
+        from sknano.io import H5Reader
+        return H5Reader(*args, **kwargs)
 
     def write_data(self, **kwargs):
         from sknano.io import DATAWriter
@@ -189,6 +201,18 @@ class BaseStructureMixin:
         from sknano.io import XYZWriter
         XYZWriter.write(**kwargs)
 
+    def write_pdb(self, **kwargs):
+        from sknano.io import PDBWriter
+        PDBWriter.write(**kwargs)
+
+    def write_npz(self, **kwargs):
+        from sknano.io import NPZWriter
+        NPZWriter.write(**kwargs)
+
+    def write_h5(self, **kwargs):
+        from sknano.io import H5Writer
+        H5Writer.write(**kwargs)
+
 
 class BaseStructure(BaseStructureMixin):
     """Base structure class for structure data."""
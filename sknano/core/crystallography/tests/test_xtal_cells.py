@@ -62,5 +62,29 @@ def test4():
     assert_true(np.allclose(2**3 * gold.unit_cell.volume, supercell.volume))
 
 
+def test5():
+    lattice = Crystal3DLattice.cubic(4.0)
+    cell = UnitCell(lattice=lattice, basis=['Au', 'Ag'],
+                    coords=[[0, 0, 0], [0.5, 0.5, 0.5]])
+    supercell = SuperCell(cell, scaling_matrix=[2, 3, 1])
+    assert_equal(supercell.basis.Natoms, 12)
+    assert_equal(supercell.basis.symbols.tolist(), 6 * ['Au'] + 6 * ['Ag'])
+    expected = []
+    for r in ([0, 0, 0], [2, 2, 2]):
+        for i in range(2):
+            for j in range(3):
+                expected.append(np.add(r, [4 * i, 4 * j, 0]))
+    assert_true(np.allclose(sorted(supercell.basis.r.tolist()),
+                            sorted(np.asarray(expected).tolist())))
+    assert_true(np.allclose(supercell.basis.rs * [2, 3, 1],
+                            np.asarray(expected) / 4))
+
+    supercell = SuperCell(
+        UnitCell(lattice=lattice, basis=['Au'], coords=[[-0.25, 1.25, 0]]),
+        scaling_matrix=2, wrap_coords=True)
+    assert_true(np.all(supercell.basis.rs >= 0))
+    assert_true(np.all(supercell.basis.rs < 1))
+
+
 if __name__ == '__main__':
     nose.runmodule()
@@ -45,6 +45,17 @@ Bulk structure generators
    RocksaltStructureGenerator
    ZincblendeStructureGenerator
 
+Generated structure cache
+-------------------------
+
+.. autosummary::
+   :toctree: generated/
+
+   StructureCache
+
+.. autodata:: structure_cache
+   :annotation: = default `StructureCache` used by the generators.
+
 Other
 -----
 
@@ -56,6 +67,7 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from ._cache import *
 from ._base import *
 from ._bulk_structure_generator import *
 from ._mixins import *
@@ -13,11 +13,19 @@ __docformat__ = 'restructuredtext en'
 
 # from abc import ABCMeta, abstractmethod
 
+from collections import OrderedDict, namedtuple
 import copy
+import functools
 import os
 
+import numpy as np
+
 from sknano.core.atoms import StructureAtom as Atom, StructureAtoms as Atoms
-from sknano.io import default_structure_format, supported_structure_formats
+from sknano.core.math import transformation_matrix
+from sknano.io import default_comment_line, default_structure_format, \
+    get_structure_writer, guess_structure_format, structure_arrays, \
+    structure_atoms, structure_formats
+from ._cache import structure_cache
 
 __all__ = ['Atom', 'Atoms', 'GeneratorBase', 'BulkGeneratorBase',
            'STRUCTURE_GENERATORS']
@@ -45,13 +53,181 @@ STRUCTURE_GENERATORS = ('FullereneGenerator',
                         'MoS2Generator')
 
 
+def _replicate_atoms(atoms, r, v=None, lattices=None):
+    r"""Return copies of `atoms` with the positions `r`.
+
+    All copies are built in one pass from the tiled column arrays of
+    `atoms`, and the atoms of the `i`\ th copy get `mol` id `i + 1`.
+
+    Parameters
+    ----------
+    atoms : :class:`~sknano.core.atoms.StructureAtoms`
+    r : :class:`~numpy:numpy.ndarray`
+        :math:`(N_{\mathrm{copies}}, N_{\mathrm{atoms}}, 3)` array of the
+        atom positions of each copy.
+    v : {None, :class:`~numpy:numpy.ndarray`}, optional
+        Atom velocities of each copy, with the same shape as `r`.
+    lattices : {None, sequence}, optional
+        Lattice of each copy. If `None`, the atoms of each copy keep the
+        lattices of the corresponding atoms of `atoms`, e.g. the wall
+        lattices of a multi-walled nanotube.
+
+    Returns
+    -------
+    :class:`~python:list`
+        List of :class:`~sknano.core.atoms.StructureAtoms`, one per copy.
+
+    """
+    ncopies, Natoms = np.shape(r)[:2]
+    atom_lattices = None
+    if lattices is None:
+        atom_lattices = [atom.lattice for atom in atoms]
+        lattices = ncopies * [None]
+
+    arrays = structure_arrays(atoms)
+    for key, values in arrays.items():
+        if values.ndim > 0:
+            arrays[key] = np.tile(values, (ncopies,) + (1,) *
+                                  (values.ndim - 1))
+    arrays['r'] = np.reshape(r, (-1, 3))
+    if v is not None:
+        arrays['v'] = np.reshape(v, (-1, 3))
+    arrays['mol'] = np.repeat(np.arange(1, ncopies + 1), Natoms)
+
+    atoms = structure_atoms(arrays).data
+    copies = []
+    for i, lattice in enumerate(lattices):
+        atoms_copy = Atoms(atoms[i * Natoms:(i + 1) * Natoms], casttype=False)
+        if lattice is not None:
+            atoms_copy.lattice = lattice
+        elif atom_lattices is not None:
+            for atom, atom_lattice in zip(atoms_copy, atom_lattices):
+                atom.lattice = atom_lattice
+        copies.append(atoms_copy)
+    return copies
+
+
+# Typical memory in bytes used per generated `StructureAtom`, which is
+# about 7 kB, or about 11 kB including the crystal cell `BasisAtom` it was
+# created from.
+_atom_nbytes = 9000
+
+# Size in bytes of an `xyz` atom line and of the `data` file `Atoms` and
+# `Velocities` section lines, excluding the atom id columns.
+_xyz_line_width = 49
+_data_line_width = (3 + 2 + 4 + 3 * 14 + 3 * 3 + 1) + (3 * 14 + 1)
+_data_header_size = 400
+
+# Bytes per atom of the `npz` and `h5` column arrays
+# (element, id, mol, type, q, mass, r, v, image).
+_array_nbytes = 8 + 5 * 8 + 3 * 3 * 8
+
+#: Return type of :meth:`GeneratorBase.generate_chunks`.
+StructureChunks = namedtuple('StructureChunks',
+                             ['Natoms', 'centroid', 'masses', 'chunks'])
+
+
+def _chunk_arrays(atoms):
+    """Return the per-atom column arrays of `atoms`, without atom ids."""
+    return OrderedDict((key, values) for key, values in
+                       structure_arrays(atoms).items()
+                       if values.ndim > 0 and key != 'id')
+
+
+def _chunk_masses(arrays):
+    """Return the map of the elements in `arrays` to their masses, in \
+        order of first appearance."""
+    _, first = np.unique(arrays['element'], return_index=True)
+    return OrderedDict((arrays['element'][i], arrays['mass'][i].item())
+                       for i in np.sort(first).tolist())
+
+
+def _transform_chunk(chunk, transform_matrix):
+    chunk = OrderedDict(chunk)
+    R = transform_matrix[:3, :3]
+    chunk['r'] = np.dot(chunk['r'], R.T) + transform_matrix[:3, 3]
+    chunk['v'] = np.dot(chunk['v'], R.T)
+    return chunk
+
+
 class GeneratorBase:
-    """Base structure generator class."""
-    def __init__(self, *args, autogen=True, **kwargs):
+    """Base structure generator class.
+
+    Parameters
+    ----------
+    autogen : bool, optional
+        if `True`, automatically generate structure data.
+    lazy : bool, optional
+        if `True`, the automatically generated structure data are
+        generated on first access of :attr:`~GeneratorBase.atoms`
+        instead of on construction. Structure metadata such as
+        :attr:`Natoms`, :attr:`Ntubes`, :attr:`Lz`, and the estimates of
+        :meth:`~GeneratorBase.estimate_memory` and
+        :meth:`~GeneratorBase.estimate_file_size` are computed from the
+        structure parameters without generating the atoms.
+    use_cache : bool, optional
+        if `True`, the automatically generated atoms are looked up in and
+        stored to :data:`~sknano.generators.structure_cache`, keyed on the
+        generator class and parameters. Only the atom attributes stored by
+        the `npz` structure format are cached.
+
+    Examples
+    --------
+    >>> from sknano.generators import SWNTBundleGenerator
+    >>> bundle = SWNTBundleGenerator(n=10, m=10, nx=10, ny=10, nz=100,
+    ...                              lazy=True)
+    >>> bundle.Natoms
+    400000
+    >>> bundle.estimate_file_size('xyz') > 10 ** 7
+    True
+    >>> bundle.save(stream=True)
+
+    """
+    def __init__(self, *args, autogen=True, lazy=False, use_cache=False,
+                 **kwargs):
         super().__init__(*args, **kwargs)
+        self.use_cache = use_cache
 
         if autogen:
-            self.generate()
+            if use_cache:
+                generate = functools.partial(self._generate_cached,
+                                             self.generate, *args, **kwargs)
+            else:
+                generate = self.generate
+            self._autogenerate(generate, lazy=lazy)
+
+    @property
+    def atoms(self):
+        """Structure :class:`~sknano.core.atoms.StructureAtoms`.
+
+        If the generator was created with `lazy=True`, the structure
+        data are generated on first access.
+
+        """
+        generate = self.__dict__.pop('_lazy_generate', None)
+        if generate is not None:
+            generate()
+        return self._atoms
+
+    def _autogenerate(self, generate, lazy=False):
+        if lazy:
+            self._lazy_generate = generate
+        else:
+            generate()
+
+    def _generate_cached(self, generate, *args, **kwargs):
+        key = structure_cache.key(type(self), *args, **kwargs)
+        atoms = structure_cache.get_atoms(key)
+        if atoms is None:
+            generate()
+            structure_cache.put_atoms(key, self.atoms)
+            return
+
+        self.structure_data.clear()
+        self.atoms.extend(atoms)
+        lattice = getattr(self, 'lattice', None)
+        if lattice is not None:
+            self.atoms.lattice = lattice
 
     def generate(self):
         """Common :meth:`~GeneratorBase.generate` method structure \
@@ -60,10 +236,83 @@ class GeneratorBase:
         for atom in self.crystal_cell:
             self.atoms.append(Atom(**atom.todict()))
 
+    def generate_chunks(self):
+        r"""Return the structure atoms as chunks of per-atom column arrays.
+
+        Generators of structures built from copies of a smaller
+        structure, such as nanotube bundles or layered structures,
+        generate one copy per chunk, so that the full structure is never
+        held in memory. Otherwise, the full structure is generated if
+        it has not been generated yet and returned as a single chunk.
+
+        Returns
+        -------
+        Natoms : int
+            Total number of atoms.
+        centroid : :class:`~numpy:numpy.ndarray`
+            Centroid of the atom coordinates.
+        masses : :class:`~python:collections.OrderedDict`
+            Map of the elements to their masses, in order of first
+            appearance.
+        chunks : iterator
+            Iterator over :class:`~python:dict`\ s of per-atom column
+            arrays with the keys of :func:`~sknano.io.structure_arrays`,
+            except for the atom `id`.
+
+        """
+        if self.atoms.Natoms == 0:
+            self.generate()
+        arrays = _chunk_arrays(self.atoms)
+        Natoms = len(arrays['r'])
+        centroid = arrays['r'].mean(axis=0) if Natoms > 0 else np.zeros(3)
+        return StructureChunks(Natoms, centroid, _chunk_masses(arrays),
+                               iter([arrays]))
+
+    def estimate_memory(self):
+        """Return an estimate of the memory in bytes used by the \
+            generated structure data.
+
+        The estimate is :attr:`Natoms` times the typical memory used per
+        generated :class:`~sknano.core.atoms.StructureAtom`. Structures
+        saved with `stream=True` need only the memory of one chunk of
+        atoms.
+
+        """
+        return int(self.Natoms) * _atom_nbytes
+
+    def estimate_file_size(self, structure_format=None):
+        """Return an estimate of the size in bytes of the structure data \
+            file written by :meth:`~GeneratorBase.save`.
+
+        The estimate is computed from :attr:`Natoms` and the line widths
+        or column data types of `structure_format`.
+
+        Parameters
+        ----------
+        structure_format : {None, str}, optional
+            One of `xyz`, `data`, `npz`, or `h5`. Defaults to `xyz`.
+
+        """
+        if structure_format is None:
+            structure_format = default_structure_format
+        Natoms = int(self.Natoms)
+        if structure_format == 'xyz':
+            return len('{:d}\n{}\n'.format(Natoms, default_comment_line)) + \
+                Natoms * _xyz_line_width
+        elif structure_format == 'data':
+            # `full` style `Atoms` and `Velocities` section lines
+            id_width = len(str(Natoms)) + 1
+            return _data_header_size + \
+                Natoms * (2 * id_width + _data_line_width)
+        elif structure_format in ('npz', 'h5'):
+            return Natoms * _array_nbytes
+        raise ValueError('Unsupported structure format: `{}`'.format(
+            structure_format))
+
     def save(self, fname=None, outpath=None, structure_format=None,
              deepcopy=True, center_centroid=True, center_com=False,
              region_bounds=None, filter_condition=None,
-             rotation_parameters=None, **kwargs):
+             rotation_parameters=None, stream=False, **kwargs):
         """Save structure data.
 
         Parameters
@@ -77,11 +326,17 @@ class GeneratorBase:
 
                 - `xyz`
                 - `data`
+                - `npz`
+                - `h5`
 
+            or another format registered with
+            :func:`~sknano.io.register_structure_format`.
             If `None`, then guess based on `fname` file extension or
             default to `xyz` format.
         center_centroid : bool, optional
-            Center centroid on origin.
+            Center centroid on origin. The generated atoms are centered
+            in place, so that the saved coordinates are the same with
+            and without `stream`.
         center_com : bool, optional
             Center center-of-mass on origin.
         region_bounds : :class:`GeometricRegion`, optional
@@ -92,21 +347,35 @@ class GeneratorBase:
             to filter the atoms not contained within the
             `GeometricRegion`.
         filter_condition : array_like, optional
+        stream : bool, optional
+            If `True`, write the atoms one chunk at a time as they are
+            generated by :meth:`~GeneratorBase.generate_chunks`, with the
+            file header computed ahead of time, instead of writing
+            :attr:`~GeneratorBase.atoms`. Nanotube bundle and layered
+            generators created with `autogen=False` or `lazy=True`
+            generate one tube or layer at a time and never hold the full
+            structure. Other generators, such as SWNT and MWNT
+            generators, write the full structure as a single chunk.
+            Supported by the `xyz`, `data`, and `h5` formats. The
+            `center_com`, `region_bounds`, and `filter_condition`
+            options and the `data` format `topology` option are not
+            supported.
+        kwargs : dict, optional
+            Keyword arguments passed to the structure writer. For the
+            `data` format with `atom_style='full'` or `'molecular'`,
+            pass `topology=True` to write `Bonds` and `Angles` sections
+            (and `Dihedrals` if `dihedrals=True`) generated from the atom
+            pairs within `bond_cutoff` distance. See
+            :meth:`~sknano.io.DATAWriter.write`.
 
         """
-        if fname.endswith(supported_structure_formats) and \
-                structure_format is None:
-            for ext in supported_structure_formats:
-                if fname.endswith(ext):
-                    structure_format = ext
-                    break
-        elif structure_format is None or \
-            structure_format not in supported_structure_formats or \
-            (not fname.endswith(supported_structure_formats) and
-             structure_format not in supported_structure_formats):
+        if structure_format is None:
+            structure_format = guess_structure_format(fname, sniff=False)
+        if structure_format is None or \
+                structure_format not in structure_formats:
             structure_format = default_structure_format
 
-        if not fname.endswith(structure_format):
+        if guess_structure_format(fname, sniff=False) != structure_format:
             fname += '.' + structure_format
         self.fname = fname
 
@@ -118,11 +387,6 @@ class GeneratorBase:
 
         # self._structure_format = structure_format
 
-        if deepcopy:
-            atoms = copy.deepcopy(self.atoms)
-        else:
-            atoms = self.atoms[:]
-
         if any([kw in kwargs for kw
                 in ('center_CM', 'center_center_of_mass')]):
             if 'center_CM' in kwargs:
@@ -132,18 +396,6 @@ class GeneratorBase:
                 center_com = kwargs['center_center_of_mass']
                 del kwargs['center_center_of_mass']
 
-        if center_centroid:
-            atoms.center_centroid()
-        elif center_com:
-            atoms.center_com()
-
-        if region_bounds is not None:
-            atoms.clip_bounds(region_bounds)
-
-        if filter_condition is not None:
-            atoms.filter(filter_condition)
-            # atoms = atoms.filtered(filter_condition)
-
         rotation_kwargs = ['rotation_angle', 'angle', 'rot_axis', 'axis',
                            'anchor_point', 'deg2rad', 'degrees', 'rot_point',
                            'from_vector', 'to_vector', 'transform_matrix']
@@ -166,17 +418,84 @@ class GeneratorBase:
             kwargs = {k: v for k, v in kwargs.items()
                       if k not in rotation_kwargs}
 
+        if stream:
+            if center_com or region_bounds is not None or \
+                    filter_condition is not None:
+                raise ValueError('`center_com`, `region_bounds`, and '
+                                 '`filter_condition` are not supported '
+                                 'when streaming.')
+            self._save_chunks(structure_format, fname=fname,
+                              outpath=outpath,
+                              center_centroid=center_centroid,
+                              rotation_parameters=rotation_parameters,
+                              **kwargs)
+            return
+
+        if center_centroid:
+            # the structure writers write the atoms of `self`
+            self.atoms.center_centroid()
+
+        if deepcopy:
+            atoms = copy.deepcopy(self.atoms)
+        else:
+            atoms = self.atoms[:]
+
+        if center_centroid:
+            atoms.center_centroid()
+        elif center_com:
+            atoms.center_com()
+
+        if region_bounds is not None:
+            atoms.clip_bounds(region_bounds)
+
+        if filter_condition is not None:
+            atoms.filter(filter_condition)
+            # atoms = atoms.filtered(filter_condition)
+
         if rotation_parameters is not None and \
                 isinstance(rotation_parameters, dict):
             self.rotate(**rotation_parameters)
 
-        getattr(self, 'write_' + structure_format)(
+        get_structure_writer(structure_format).write(
             fname=fname, outpath=outpath, structure=self, **kwargs)
 
         # StructureWriter.write(fname=fname, outpath=outpath,
         #                       structure_format=structure_format,
         #                       structure=self.structure)
 
+    def _save_chunks(self, structure_format, center_centroid=True,
+                     rotation_parameters=None, **kwargs):
+        writer = get_structure_writer(structure_format)
+        if not hasattr(writer, 'write_chunks'):
+            raise ValueError('Streaming is not supported for the `{}` '
+                             'structure format.'.format(structure_format))
+
+        Natoms, centroid, masses, chunks = self.generate_chunks()
+
+        tmatrix = np.eye(4)
+        if center_centroid:
+            tmatrix[:3, 3] = -centroid
+
+        lattice = getattr(self, 'lattice', None)
+        if isinstance(rotation_parameters, dict):
+            rotation_parameters = rotation_parameters.copy()
+            R = rotation_parameters.pop('transform_matrix', None)
+            if R is None:
+                R = transformation_matrix(**rotation_parameters)
+            R = np.asarray(R)
+            if R.shape != (4, 4):
+                R4 = np.eye(4)
+                R4[:3, :3] = R
+                R = R4
+            tmatrix = np.dot(R, tmatrix)
+            if lattice is not None:
+                lattice = copy.deepcopy(lattice)
+                lattice.rotate(transform_matrix=R[:3, :3])
+
+        writer.write_chunks((_transform_chunk(chunk, tmatrix)
+                             for chunk in chunks), Natoms, masses=masses,
+                            lattice=lattice, **kwargs)
+
 
 class BulkGeneratorBase(GeneratorBase):
     """Base class for the *bulk structure generator* classes."""
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+Generated structure cache (:mod:`sknano.generators._cache`)
+===============================================================================
+
+.. currentmodule:: sknano.generators._cache
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+import hashlib
+import json
+import numbers
+import os
+import re
+import tempfile
+
+import numpy as np
+
+from sknano.io import structure_arrays, structure_atoms
+from sknano.version import version
+
+__all__ = ['StructureCache', 'structure_cache']
+
+
+def _canonical(value):
+    """Return a JSON serializable representation of a generator \
+        parameter `value`."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return _canonical(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    try:
+        return [type(value).__name__, _canonical(value.todict())]
+    except AttributeError:
+        return repr(value)
+
+
+class StructureCache:
+    """Cache of generated structure data keyed by generator parameters.
+
+    The generated atoms are stored as the column arrays of the native
+    `npz` structure format (see :func:`~sknano.io.structure_arrays`) in an
+    in-process LRU cache and, if `cache_dir` is set, in `npz` files in
+    `cache_dir` that persist across sessions and can be read with
+    :class:`~sknano.io.NPZReader`. Cache hits return copies of the stored
+    arrays.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of structures held in memory. If `0`, only the
+        on-disk store is used.
+    cache_dir : {None, str}, optional
+        Directory of the on-disk store. If `None`, structures are only
+        cached in memory.
+
+    Examples
+    --------
+    Generators use the module level :data:`structure_cache` instance
+    when called with `use_cache=True`:
+
+    >>> from sknano.generators import SWNTGenerator, structure_cache
+    >>> structure_cache.cache_dir = 'swnt_cache'
+    >>> swnt = SWNTGenerator((10, 5), nz=10, use_cache=True)
+
+    """
+    def __init__(self, maxsize=128, cache_dir=None):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._arrays = OrderedDict()
+
+    def __len__(self):
+        return len(self._arrays)
+
+    def __contains__(self, key):
+        return key in self._arrays or \
+            (self.cache_dir is not None and os.path.exists(self.fpath(key)))
+
+    @staticmethod
+    def key(generator, *args, **kwargs):
+        """Return the cache key of a structure generated by calling \
+            `generator` with `args` and `kwargs`.
+
+        Parameters
+        ----------
+        generator : class
+            Structure generator class.
+        args, kwargs
+            Generator parameters.
+
+        Returns
+        -------
+        :class:`~python:str`
+            SHA-1 hex digest of the generator class, the generator
+            parameters and the `scikit-nano` version.
+
+        """
+        params = dict(generator='.'.join((generator.__module__,
+                                          generator.__name__)),
+                      version=version, args=_canonical(args),
+                      kwargs=_canonical(kwargs))
+        return hashlib.sha1(
+            json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def fpath(self, key):
+        """Return the on-disk store file path of `key`."""
+        return os.path.join(self.cache_dir, key + '.npz')
+
+    def get(self, key):
+        """Return the cached arrays of `key` or `None` if not cached.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        {None, :class:`~python:collections.OrderedDict`}
+            Copies of the stored arrays.
+
+        """
+        arrays = self._arrays.get(key)
+        if arrays is not None:
+            self._arrays.move_to_end(key)
+        elif self.cache_dir is not None and os.path.exists(self.fpath(key)):
+            try:
+                npz = np.load(self.fpath(key), allow_pickle=False)
+            except TypeError:
+                # numpy < 1.10 has no `allow_pickle` argument
+                npz = np.load(self.fpath(key))
+            try:
+                arrays = OrderedDict((name, npz[name]) for name in npz.files)
+            finally:
+                npz.close()
+            self._insert(key, arrays)
+
+        if arrays is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return OrderedDict((name, value.copy())
+                           for name, value in arrays.items())
+
+    def put(self, key, arrays):
+        """Store copies of `arrays` under `key`.
+
+        Parameters
+        ----------
+        key : str
+        arrays : :class:`~python:dict`
+
+        """
+        arrays = OrderedDict((name, np.array(value))
+                             for name, value in arrays.items())
+        self._insert(key, arrays)
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so that concurrent readers
+            # never see a partially written file.
+            fd, tmpfile = tempfile.mkstemp(suffix='.npz', dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(f, **arrays)
+                os.replace(tmpfile, self.fpath(key))
+            except BaseException:
+                os.remove(tmpfile)
+                raise
+
+    def get_atoms(self, key):
+        """Return new :class:`~sknano.core.atoms.StructureAtoms` built \
+            from the cached arrays of `key` or `None` if not cached."""
+        arrays = self.get(key)
+        if arrays is None:
+            return None
+        return structure_atoms(arrays)
+
+    def put_atoms(self, key, atoms):
+        """Store the column arrays of `atoms` under `key`."""
+        self.put(key, structure_arrays(atoms))
+
+    def clear(self, disk=False):
+        """Clear the in-process cache.
+
+        Parameters
+        ----------
+        disk : bool, optional
+            Also remove the cached `npz` files of the on-disk store.
+
+        """
+        self._arrays.clear()
+        self.hits = self.misses = 0
+        if disk and self.cache_dir is not None and \
+                os.path.isdir(self.cache_dir):
+            for fname in os.listdir(self.cache_dir):
+                if re.match(r'^[0-9a-f]{40}\.npz$', fname):
+                    os.remove(os.path.join(self.cache_dir, fname))
+
+    def _insert(self, key, arrays):
+        if self.maxsize <= 0:
+            return
+        self._arrays[key] = arrays
+        self._arrays.move_to_end(key)
+        while len(self._arrays) > self.maxsize:
+            self._arrays.popitem(last=False)
+
+
+#: Default :class:`StructureCache` used by the structure generators.
+structure_cache = StructureCache()
@@ -11,14 +11,12 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
-import copy
-
 import numpy as np
 
-from sknano.core.math import Vector
 from sknano.core.crystallography import SuperCell
 from sknano.structures import PrimitiveCellGraphene, ConventionalCellGraphene
 from ._base import Atom, Atoms, GeneratorBase
+from ._mixins import LayeredGeneratorMixin
 
 __all__ = ['GrapheneGenerator',
            'GrapheneGeneratorBase',
@@ -30,7 +28,7 @@ __all__ = ['GrapheneGenerator',
            'RectangularCellGrapheneGenerator']
 
 
-class GrapheneGeneratorBase(GeneratorBase):
+class GrapheneGeneratorBase(LayeredGeneratorMixin, GeneratorBase):
     """`N`-layer graphene generator class.
 
     Parameters
@@ -66,23 +64,29 @@ class GrapheneGeneratorBase(GeneratorBase):
         """Generate the full structure coordinates."""
 
         self.structure_data.clear()
+        layer0 = self._generate_layer0()
+        # self.Natoms_per_layer = layer0.Natoms
+
+        self.layers = self.generate_layers(layer0, [0, 0, 1])
+        for layer in self.layers:
+            self.atoms.extend(layer)
+
+    def generate_chunks(self):
+        """Return the structure atoms as an iterator over one chunk per \
+            layer.
+
+        See :meth:`~sknano.generators.GeneratorBase.generate_chunks`.
+
+        """
+        return self.generate_layer_chunks(self._generate_layer0(), [0, 0, 1])
+
+    def _generate_layer0(self):
         layer0 = Atoms()
         for atom in SuperCell(self.unit_cell, [self.n1, self.n2, 1]):
             layer0.append(Atom(**atom.todict()))
 
         layer0.center_centroid()
-        # self.Natoms_per_layer = layer0.Natoms
-
-        self.layers = []
-        for nlayer in range(self.nlayers):
-            layer = copy.deepcopy(layer0)
-            layer.translate(Vector([0, 0, nlayer * self.layer_spacing]))
-            if (nlayer % 2) != 0:
-                layer.translate(self.layer_shift)
-            [setattr(atom, 'mol', nlayer + 1) for atom in layer]
-            layer.rotate(angle=self.layer_rotation_angles[nlayer], axis='z')
-            self.atoms.extend(layer)
-            self.layers.append(layer)
+        return layer0
 
     @classmethod
     def generate_fname(cls, nlayers=None, basis=None, **kwargs):
@@ -96,7 +100,7 @@ class GrapheneGeneratorBase(GeneratorBase):
 
     def save(self, fname=None, outpath=None, structure_format=None,
              center_centroid=True, rotation_angle=np.pi / 2, rotation_axis='x',
-             **kwargs):
+             stream=False, **kwargs):
         """Save structure data.
 
         See :meth:`~sknano.generators.GeneratorBase.save` method
@@ -107,12 +111,11 @@ class GrapheneGeneratorBase(GeneratorBase):
             fname = \
                 self.generate_fname(nlayers=self.nlayers, basis=self.basis)
 
-        if center_centroid and self.nlayers > 1:
-            self.atoms.center_centroid()
-
         super().save(fname=fname, outpath=outpath,
-                     structure_format=structure_format, center_centroid=False,
-                     angle=rotation_angle, axis=rotation_axis, **kwargs)
+                     structure_format=structure_format,
+                     center_centroid=center_centroid and self.nlayers > 1,
+                     angle=rotation_angle, axis=rotation_axis, stream=stream,
+                     **kwargs)
 
 
 class PrimitiveCellGrapheneGenerator(GrapheneGeneratorBase,
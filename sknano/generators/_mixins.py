@@ -11,9 +11,16 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from collections import OrderedDict
 import copy
 
-__all__ = ['CappedNanotubeGeneratorMixin']
+import numpy as np
+
+from sknano.core.math import Rz
+from ._base import StructureChunks, _chunk_arrays, _chunk_masses, \
+    _replicate_atoms
+
+__all__ = ['CappedNanotubeGeneratorMixin', 'LayeredGeneratorMixin']
 
 
 class CappedNanotubeGeneratorMixin:
@@ -21,3 +28,95 @@ class CappedNanotubeGeneratorMixin:
 
     def generate_endcaps(self):
         pass
+
+
+class LayeredGeneratorMixin:
+    """Mixin class for generating layered structures."""
+
+    def _layer_transforms(self, stacking_direction):
+        """Return the translation vectors, rotation angles, and rotation \
+            matrices of the layers."""
+        nlayers = self.nlayers
+        layer_index = np.arange(nlayers)
+        shifts = np.outer(layer_index * self.layer_spacing,
+                          stacking_direction) + \
+            np.outer(layer_index % 2, np.asarray(self.layer_shift))
+        angles = np.asarray(self.layer_rotation_angles, dtype=float)
+        R = np.array([Rz(angle) for angle in angles]).reshape((nlayers, 3, 3))
+        return shifts, angles, R
+
+    def generate_layers(self, layer0, stacking_direction):
+        r"""Generate :attr:`nlayers` layers from the atoms of `layer0`.
+
+        Layer `i` is `layer0` translated by `i` times
+        :attr:`layer_spacing` along `stacking_direction`, shifted by
+        :attr:`layer_shift` if `i` is odd, and rotated about the
+        :math:`z` axis by :attr:`layer_rotation_angles`\ `[i]`.
+        The per-layer transforms are applied to the `layer0` coordinates
+        in a single batched matrix product, and the atoms of layer `i`
+        get `mol` id `i + 1`.
+
+        Parameters
+        ----------
+        layer0 : :class:`~sknano.core.atoms.StructureAtoms`
+        stacking_direction : array_like
+            Unit vector of the layer stacking direction.
+
+        Returns
+        -------
+        :class:`~python:list`
+            List of :class:`~sknano.core.atoms.StructureAtoms`, one per
+            layer.
+
+        """
+        shifts, angles, R = self._layer_transforms(stacking_direction)
+        r = np.einsum('lni,lji->lnj', np.asarray(layer0.r)[np.newaxis] +
+                      shifts[:, np.newaxis], R)
+        v = np.einsum('ni,lji->lnj', np.asarray(layer0.v), R)
+
+        lattice = layer0[0].lattice if layer0.Natoms > 0 else None
+        lattices = []
+        rotated_lattices = {}
+        for angle, Ri in zip(angles, R):
+            if lattice is None or angle == 0:
+                lattices.append(lattice)
+                continue
+            if angle not in rotated_lattices:
+                rotated_lattice = copy.deepcopy(lattice)
+                rotated_lattice.rotate(transform_matrix=Ri)
+                rotated_lattices[angle] = rotated_lattice
+            lattices.append(rotated_lattices[angle])
+
+        return _replicate_atoms(layer0, r, v=v, lattices=lattices)
+
+    def generate_layer_chunks(self, layer0, stacking_direction):
+        """Return the atoms of the :attr:`nlayers` layers generated from \
+            `layer0` as an iterator over one chunk per layer.
+
+        The layers are transformed as in :meth:`generate_layers`, one
+        layer at a time. See
+        :meth:`~sknano.generators.GeneratorBase.generate_chunks`.
+
+        Parameters
+        ----------
+        layer0 : :class:`~sknano.core.atoms.StructureAtoms`
+        stacking_direction : array_like
+            Unit vector of the layer stacking direction.
+
+        """
+        shifts, _, R = self._layer_transforms(stacking_direction)
+        layer = _chunk_arrays(layer0)
+        Natoms = len(layer['r'])
+        centroid0 = layer['r'].mean(axis=0) if Natoms > 0 else np.zeros(3)
+        centroids = np.einsum('ijk,ik->ij', R, centroid0 + shifts)
+
+        def chunks():
+            for mol, (shift, Ri) in enumerate(zip(shifts, R), start=1):
+                chunk = OrderedDict(layer)
+                chunk['r'] = np.dot(layer['r'] + shift, Ri.T)
+                chunk['v'] = np.dot(layer['v'], Ri.T)
+                chunk['mol'] = np.full(Natoms, mol, dtype=int)
+                yield chunk
+
+        return StructureChunks(Natoms * len(shifts), centroids.mean(axis=0),
+                               _chunk_masses(layer), chunks())
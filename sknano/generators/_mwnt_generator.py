@@ -103,18 +103,12 @@ class MWNTGenerator(GeneratorBase, MWNT):
 
     """
     def generate(self):
-        """Generate structure data.
-
-        .. todo::
-
-           Load the diameter and chirality data from file instead of
-           generating it every time.
-
-        """
-
+        """Generate structure data."""
         self.structure_data.clear()
         for swnt in self.walls:
-            self.atoms.extend(SWNTGenerator(**swnt.todict()).atoms)
+            self.atoms.extend(
+                SWNTGenerator(use_cache=getattr(self, 'use_cache', False),
+                              **swnt.todict()).atoms)
 
     @classmethod
     def generate_fname(cls, Ch_list=None, Nwalls=None, **kwargs):
@@ -11,19 +11,31 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
-import copy
+from collections import OrderedDict
+import functools
+
+import numpy as np
+
+from ._base import StructureChunks, _chunk_arrays, _chunk_masses, \
+    _replicate_atoms
 
 __all__ = ['NanotubeBundleGeneratorBase']
 
 
 class NanotubeBundleGeneratorBase:
     """Base class for generating nanotube bundles."""
-    def __init__(self, autogen=True, **kwargs):
+    def __init__(self, *args, autogen=True, lazy=False, use_cache=False,
+                 **kwargs):
 
-        super().__init__(autogen=False, **kwargs)
+        super().__init__(*args, autogen=False, use_cache=use_cache, **kwargs)
 
         if autogen:
-            self.generate(generate_bundle_from_bundle_coords=True)
+            generate = functools.partial(
+                self.generate, generate_bundle_from_bundle_coords=True)
+            if use_cache:
+                generate = functools.partial(self._generate_cached,
+                                             generate, *args, **kwargs)
+            self._autogenerate(generate, lazy=lazy)
 
     def generate(self, generate_bundle=True,
                  generate_bundle_from_bundle_coords=False):
@@ -43,12 +55,59 @@ class NanotubeBundleGeneratorBase:
         self.crystal_cell.scaling_matrix = [self.nx, self.ny, 1]
 
     def generate_bundle_from_bundle_coords(self):
-        atomsobj0 = copy.deepcopy(self.atoms)
-        atomsobj0.center_centroid()
+        """Generate the bundle by tiling the generated tube atoms at \
+            the :attr:`bundle_coords`.
+
+        The atom coordinates of all tubes are computed in one
+        :math:`(N_{\\mathrm{tubes}}, N_{\\mathrm{atoms/tube}}, 3)` broadcast
+        and the :attr:`~sknano.core.atoms.MolecularAtom.mol` ids are set to
+        the tube numbers.
+
+        """
+        atoms0 = self.atoms
+        bundle_coords = np.asarray(self.bundle_coords).reshape((-1, 3))
+        r = np.asarray(atoms0.r) - np.asarray(atoms0.centroid)
+        r = bundle_coords[:, np.newaxis, :] + r[np.newaxis, :, :]
+        tubes = _replicate_atoms(atoms0, r)
+
         self.structure_data.clear()
-        for mol_id, dr in enumerate(self.bundle_coords, start=1):
-            atomsobj = copy.deepcopy(atomsobj0)
-            atomsobj.translate(dr)
-            [setattr(atom, 'mol', mol_id) for atom in atomsobj]
-            self.atoms.extend(atomsobj)
-            self.bundle_list.append(atomsobj)
+        for tube in tubes:
+            self.atoms.extend(tube)
+        self.bundle_list.extend(tubes)
+
+    def generate_chunks(self):
+        """Return the bundle atoms as an iterator over one chunk per tube.
+
+        Only the atoms of a single tube are generated. The chunks are
+        the tube coordinates translated to the :attr:`bundle_coords`.
+        If the bundle atoms have already been generated, they are
+        returned as a single chunk.
+        See :meth:`~sknano.generators.GeneratorBase.generate_chunks`.
+
+        """
+        if '_lazy_generate' not in self.__dict__ and self._atoms.Natoms > 0:
+            # already generated
+            return super().generate_chunks()
+
+        # keep the lazily generated bundle pending
+        lazy_generate = self.__dict__.pop('_lazy_generate', None)
+        super().generate()
+        tube = _chunk_arrays(self.atoms)
+        self.structure_data.clear()
+        if lazy_generate is not None:
+            self._lazy_generate = lazy_generate
+
+        Natoms = len(tube['r'])
+        r = tube['r'] - tube['r'].mean(axis=0) if Natoms > 0 else tube['r']
+        bundle_coords = np.asarray(self.bundle_coords).reshape((-1, 3))
+
+        def chunks():
+            for mol, offset in enumerate(bundle_coords, start=1):
+                chunk = OrderedDict(tube)
+                chunk['r'] = r + offset
+                chunk['mol'] = np.full(Natoms, mol, dtype=int)
+                yield chunk
+
+        return StructureChunks(Natoms * len(bundle_coords),
+                               bundle_coords.mean(axis=0),
+                               _chunk_masses(tube), chunks())
@@ -20,21 +20,20 @@ from __future__ import absolute_import, division, print_function, \
     unicode_literals
 __docformat__ = 'restructuredtext en'
 
-import copy
-
 import numpy as np
 
 from sknano.core import pluralize
 from sknano.core.crystallography import SuperCell
-from sknano.core.math import Vector
 from sknano.structures import UnrolledSWNT
 # from sknano.core.geometric_regions import Cuboid
 from ._base import Atom, Atoms, GeneratorBase
+from ._mixins import LayeredGeneratorMixin
 
 __all__ = ['UnrolledSWNTGenerator']
 
 
-class UnrolledSWNTGenerator(GeneratorBase, UnrolledSWNT):
+class UnrolledSWNTGenerator(LayeredGeneratorMixin, GeneratorBase,
+                            UnrolledSWNT):
     """Class for generating unrolled nanotube structures.
 
     .. versionadded:: 0.2.23
@@ -107,6 +106,22 @@ class UnrolledSWNTGenerator(GeneratorBase, UnrolledSWNT):
         """Generate structure data."""
 
         self.structure_data.clear()
+        layer0 = self._generate_layer0()
+
+        self.layers = self.generate_layers(layer0, [0, 1, 0])
+        for layer in self.layers:
+            self.atoms.extend(layer)
+
+    def generate_chunks(self):
+        """Return the structure atoms as an iterator over one chunk per \
+            layer.
+
+        See :meth:`~sknano.generators.GeneratorBase.generate_chunks`.
+
+        """
+        return self.generate_layer_chunks(self._generate_layer0(), [0, 1, 0])
+
+    def _generate_layer0(self):
         layer0 = Atoms()
         scaling_matrix = [int(np.ceil(self.nx)), 1, int(np.ceil(self.nz))]
 
@@ -114,17 +129,7 @@ class UnrolledSWNTGenerator(GeneratorBase, UnrolledSWNT):
             layer0.append(Atom(**atom.todict()))
 
         layer0.center_centroid()
-
-        self.layers = []
-        for nlayer in range(self.nlayers):
-            layer = copy.deepcopy(layer0)
-            layer.translate(Vector([0, nlayer * self.layer_spacing, 0]))
-            [setattr(atom, 'mol', nlayer + 1) for atom in layer]
-            if (nlayer % 2) != 0:
-                layer.translate(self.layer_shift)
-            layer.rotate(angle=self.layer_rotation_angles[nlayer], axis='z')
-            self.atoms.extend(layer)
-            self.layers.append(layer)
+        return layer0
 
     @classmethod
     def generate_fname(cls, n=None, m=None, nx=None, nz=None,
@@ -145,7 +150,7 @@ class UnrolledSWNTGenerator(GeneratorBase, UnrolledSWNT):
         return fname
 
     def save(self, fname=None, outpath=None, structure_format=None,
-             center_centroid=True, **kwargs):
+             center_centroid=True, stream=False, **kwargs):
         """Save structure data.
 
         See :meth:`~sknano.generators.GeneratorBase.save` method
@@ -158,9 +163,7 @@ class UnrolledSWNTGenerator(GeneratorBase, UnrolledSWNT):
                                         fix_Lx=self.fix_Lx,
                                         fix_Lz=self.fix_Lz)
 
-        if center_centroid:
-            self.atoms.center_centroid()
-
         super().save(fname=fname, outpath=outpath,
                      structure_format=structure_format,
-                     center_centroid=False, **kwargs)
+                     center_centroid=center_centroid,
+                     stream=stream, **kwargs)
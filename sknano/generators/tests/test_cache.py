@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+
+import nose
+from nose.tools import *
+
+import numpy as np
+
+from sknano.generators import StructureCache, SWNTBundleGenerator, \
+    SWNTGenerator, structure_cache
+from sknano.io import NPZReader
+
+
+def test1():
+    key = StructureCache.key(SWNTGenerator, (10, 5), nz=2, basis=['C', 'C'])
+    assert_equal(key, StructureCache.key(SWNTGenerator, [10, 5],
+                                         basis=('C', 'C'), nz=2.0))
+    assert_not_equal(key, StructureCache.key(SWNTGenerator, (10, 5), nz=3,
+                                             basis=['C', 'C']))
+
+    cache = StructureCache(maxsize=2)
+    for i in range(3):
+        cache.put(str(i), dict(r=np.arange(3.0) + i))
+    assert_equal(len(cache), 2)
+    assert_false('0' in cache)
+    assert_is_none(cache.get('0'))
+    arrays = cache.get('1')
+    arrays['r'][:] = 0
+    assert_true(np.allclose(cache.get('1')['r'], [1, 2, 3]))
+    assert_equal(cache.hits, 2)
+    assert_equal(cache.misses, 1)
+
+
+def test2():
+    cache_dir = tempfile.mkdtemp()
+    maxsize = structure_cache.maxsize
+    try:
+        structure_cache.clear()
+        structure_cache.cache_dir = cache_dir
+        swnt = SWNTGenerator((5, 5), nz=2, use_cache=True)
+        assert_equal(structure_cache.misses, 1)
+        key = StructureCache.key(SWNTGenerator, (5, 5), nz=2)
+        assert_true(os.path.exists(structure_cache.fpath(key)))
+        assert_true(np.allclose(NPZReader(structure_cache.fpath(key)).atoms.r,
+                                swnt.atoms.r))
+
+        cached_swnt = SWNTGenerator((5, 5), nz=2, use_cache=True)
+        assert_equal(structure_cache.hits, 1)
+        assert_true(np.allclose(cached_swnt.atoms.r, swnt.atoms.r))
+        assert_equal(cached_swnt.atoms.symbols.tolist(),
+                     swnt.atoms.symbols.tolist())
+        assert_is(cached_swnt.atoms[0].lattice, cached_swnt.lattice)
+
+        structure_cache.clear()
+        structure_cache.maxsize = 0
+        cached_swnt = SWNTGenerator((5, 5), nz=2, use_cache=True)
+        assert_equal(structure_cache.hits, 1)
+        assert_true(np.allclose(cached_swnt.atoms.r, swnt.atoms.r))
+        structure_cache.clear(disk=True)
+        assert_equal(os.listdir(cache_dir), [])
+    finally:
+        structure_cache.cache_dir = None
+        structure_cache.maxsize = maxsize
+        structure_cache.clear()
+        shutil.rmtree(cache_dir)
+
+
+def test3():
+    try:
+        structure_cache.clear()
+        bundle = SWNTBundleGenerator((5, 5), nx=2, ny=1, nz=2, use_cache=True)
+        assert_equal(structure_cache.misses, 1)
+        cached_bundle = SWNTBundleGenerator((5, 5), nx=2, ny=1, nz=2,
+                                            use_cache=True)
+        assert_equal(structure_cache.hits, 1)
+        assert_equal(cached_bundle.atoms.Natoms, bundle.atoms.Natoms)
+        assert_equal(cached_bundle.Natoms, bundle.Natoms)
+        assert_true(np.allclose(cached_bundle.atoms.r, bundle.atoms.r))
+        assert_equal(cached_bundle.atoms.mols.tolist(),
+                     bundle.atoms.mols.tolist())
+
+        lazy_bundle = SWNTBundleGenerator((5, 5), nx=2, ny=1, nz=2,
+                                          use_cache=True, lazy=True)
+        assert_equal(structure_cache.hits, 1)
+        assert_true(np.allclose(lazy_bundle.atoms.r, bundle.atoms.r))
+        assert_equal(structure_cache.hits, 2)
+    finally:
+        structure_cache.clear()
+
+
+if __name__ == '__main__':
+    nose.runmodule()
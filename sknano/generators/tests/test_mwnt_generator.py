@@ -42,6 +42,12 @@ class TestCase(GeneratorTestFixtures):
         mwnt.save(structure_format='data')
         self.tmpdata.append(mwnt.fname)
 
+    def test4(self):
+        mwnt = MWNTGenerator(Ch_list=[(5, 5), (10, 10)], Lz=1, lazy=True)
+        assert_equal(mwnt.Natoms, 300)
+        assert_equal(mwnt.Natoms_list, [100, 200])
+        assert_equal(mwnt.atoms.Natoms, mwnt.Natoms)
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -3,9 +3,15 @@
 from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
+import os
+
 import nose
 from nose.tools import *
-from sknano.generators import SWNTGenerator, SWNTBundleGenerator
+import numpy as np
+from sknano.generators import MWNTGenerator, MWNTBundleGenerator, \
+    SWNTGenerator, SWNTBundleGenerator
+from sknano.generators._base import _atom_nbytes
+from sknano.io import DATAReader, XYZReader
 from sknano.testing import GeneratorTestFixtures
 
 
@@ -46,6 +52,111 @@ class TestCase(GeneratorTestFixtures):
         assert_true(bundle.Natoms, bundle.Ntubes * swnt.Natoms)
         assert_equal(bundle.Ntubes, len(set(bundle.mol_ids)))
 
+    def test5(self):
+        swnt = SWNTGenerator(n=5, m=5, nz=2)
+        bundle = SWNTBundleGenerator(n=5, m=5, nx=3, ny=3, nz=2,
+                                     bundle_geometry='hexagon')
+        assert_equal(bundle.Ntubes, 7)
+        assert_equal(bundle.bundle_coords.shape, (7, 3))
+        assert_equal(bundle.Natoms_list, 7 * [swnt.Natoms])
+        assert_equal(bundle.mol_ids.tolist(),
+                     np.repeat(np.arange(1, 8), swnt.Natoms).tolist())
+        r = np.asarray(swnt.atoms.r) - np.asarray(swnt.atoms.centroid)
+        r = bundle.bundle_coords[:, np.newaxis] + r[np.newaxis]
+        assert_true(np.allclose(bundle.atoms.r, r.reshape((-1, 3))))
+        lattice = bundle.atoms[0].lattice
+        assert_true(all(atom.lattice is lattice for atom in bundle.atoms))
+
+        mwnt = MWNTGenerator(Ch_list=[(5, 5), (10, 10)], Lz=1)
+        bundle = MWNTBundleGenerator(Ch_list=[(5, 5), (10, 10)], Lz=1,
+                                     nx=2, ny=2)
+        wall_lattices = [atom.lattice for atom in mwnt.atoms]
+        a = [round(lattice.a, 2) for lattice in wall_lattices]
+        assert_equal(sorted(set(a)), [10.18, 16.96])
+        assert_equal([round(atom.lattice.a, 2) for atom in bundle.atoms],
+                     bundle.Ntubes * a)
+
+    def test6(self):
+        bundle = SWNTBundleGenerator(n=5, m=5, nx=3, ny=3, nz=2,
+                                     bundle_geometry='hexagon')
+        bundle.save(fname='bundle.xyz', center_centroid=False)
+        self.tmpdata.append(bundle.fname)
+        bundle.save(fname='bundle.data', center_centroid=False)
+        self.tmpdata.append(bundle.fname)
+
+        stream = SWNTBundleGenerator(n=5, m=5, nx=3, ny=3, nz=2,
+                                     bundle_geometry='hexagon', autogen=False)
+        assert_equal(stream.atoms.Natoms, 0)
+        for fmt in ('xyz', 'data'):
+            stream.save(fname='stream.' + fmt, center_centroid=False,
+                        stream=True)
+            self.tmpdata.append(stream.fname)
+            with open('bundle.' + fmt) as f1, open('stream.' + fmt) as f2:
+                assert_equal(f1.read(), f2.read())
+        assert_equal(stream.atoms.Natoms, 0)
+
+        stream.save(fname='stream.data', stream=True)
+        atoms = DATAReader('stream.data').atoms
+        assert_equal(atoms.Natoms, bundle.Natoms)
+        assert_equal(atoms.mols.tolist(), bundle.mol_ids.tolist())
+        assert_true(np.allclose(np.asarray(atoms.centroid), 0))
+        assert_true(np.allclose(atoms.r, np.asarray(bundle.atoms.r) -
+                                np.asarray(bundle.atoms.centroid)))
+        assert_raises(ValueError, stream.save, fname='stream.npz',
+                      stream=True)
+        assert_raises(ValueError, stream.save, fname='stream.data',
+                      stream=True, topology=True)
+        assert_raises(ValueError, stream.save, fname='stream.data',
+                      stream=True, atom_style='charge')
+
+        stream.save(fname='atomic.data', stream=True, atom_style='atomic')
+        self.tmpdata.append(stream.fname)
+        atoms = DATAReader('atomic.data', atom_style='atomic').atoms
+        assert_equal(atoms.Natoms, bundle.Natoms)
+        assert_true(np.allclose(atoms.r, np.asarray(bundle.atoms.r) -
+                                np.asarray(bundle.atoms.centroid)))
+
+        Natoms = bundle.atoms.Natoms
+        bundle.save(fname='stream.xyz', center_centroid=False, stream=True)
+        assert_equal(bundle.atoms.Natoms, Natoms)
+        with open('bundle.xyz') as f1, open('stream.xyz') as f2:
+            assert_equal(f1.read(), f2.read())
+
+    def test7(self):
+        bundle = SWNTBundleGenerator(n=5, m=5, nx=3, ny=3, nz=2,
+                                     bundle_geometry='hexagon', lazy=True)
+        assert_equal(bundle.Natoms, 7 * 40)
+        assert_equal(bundle.Natoms, bundle.Ntubes * bundle.Natoms_per_tube[0])
+        assert_equal(bundle.estimate_memory(), bundle.Natoms * _atom_nbytes)
+        assert_raises(ValueError, bundle.estimate_file_size, 'pdb')
+
+        for fmt in ('xyz', 'data'):
+            bundle.save(fname='lazy.' + fmt, stream=True)
+            self.tmpdata.append(bundle.fname)
+            size = os.path.getsize(bundle.fname)
+            assert_true(abs(bundle.estimate_file_size(fmt) - size) <
+                        0.05 * size)
+        assert_equal(bundle._atoms.Natoms, 0)
+
+        assert_equal(bundle.atoms.Natoms, bundle.Natoms)
+        assert_equal(bundle.Natoms_list, bundle.Ntubes * [40])
+        assert_true(np.allclose(XYZReader('lazy.xyz').atoms.r,
+                                np.asarray(bundle.atoms.r) -
+                                np.asarray(bundle.atoms.centroid)))
+
+    def test8(self):
+        generators = [lambda: SWNTGenerator(n=5, m=3, nz=2),
+                      lambda: SWNTBundleGenerator(n=5, m=5, nx=2, ny=2, nz=2)]
+        for fmt in ('xyz', 'data'):
+            self.tmpdata.extend(['default.' + fmt, 'stream.' + fmt])
+        for generator in generators:
+            for fmt in ('xyz', 'data'):
+                generator().save(fname='default.' + fmt)
+                generator().save(fname='stream.' + fmt, stream=True)
+                with open('default.' + fmt) as f1, \
+                        open('stream.' + fmt) as f2:
+                    assert_equal(f1.read(), f2.read())
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -3,8 +3,12 @@
 from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
+import os
+
 import nose
 from nose.tools import *
+import numpy as np
+from sknano.core.math import Rz
 from sknano.generators import UnrolledSWNTGenerator
 from sknano.testing import GeneratorTestFixtures
 
@@ -32,6 +36,47 @@ class TestCase(GeneratorTestFixtures):
         unrolled_swnt.save(structure_format='data')
         self.tmpdata.append(unrolled_swnt.fname)
 
+    def test4(self):
+        unrolled_swnt = UnrolledSWNTGenerator(n=6, m=6, nlayers=3,
+                                              layer_rotation_increment=15)
+        layers = unrolled_swnt.layers
+        assert_equal(len(layers), 3)
+        Natoms = layers[0].Natoms
+        assert_equal(unrolled_swnt.atoms.Natoms, 3 * Natoms)
+        assert_equal(unrolled_swnt.atoms.mol_ids.tolist(),
+                     np.repeat([1, 2, 3], Natoms).tolist())
+        r0 = np.asarray(layers[0].r)
+        for i, layer in enumerate(layers):
+            dr = i * unrolled_swnt.layer_spacing * np.array([0, 1, 0]) + \
+                (i % 2) * np.asarray(unrolled_swnt.layer_shift)
+            R = Rz(unrolled_swnt.layer_rotation_angles[i])
+            assert_true(np.allclose(layer.r, (r0 + dr).dot(R.T)))
+
+    def test5(self):
+        unrolled_swnt = UnrolledSWNTGenerator(n=6, m=6, nlayers=3,
+                                              layer_rotation_increment=15)
+        Natoms, centroid, masses, chunks = unrolled_swnt.generate_chunks()
+        assert_equal(Natoms, unrolled_swnt.atoms.Natoms)
+        assert_true(np.allclose(centroid,
+                                np.asarray(unrolled_swnt.atoms.centroid)))
+        assert_equal(list(masses.keys()), ['C'])
+        chunks = list(chunks)
+        assert_equal(len(chunks), 3)
+        for chunk, layer in zip(chunks, unrolled_swnt.layers):
+            assert_true(np.allclose(chunk['r'], layer.r))
+            assert_equal(chunk['mol'].tolist(), layer.mol_ids.tolist())
+
+    def test6(self):
+        unrolled_swnt = UnrolledSWNTGenerator(n=5, m=5, nz=2, nlayers=2,
+                                              lazy=True)
+        assert_equal(unrolled_swnt.Natoms_per_layer, 40)
+        assert_equal(unrolled_swnt.Natoms, 80)
+        unrolled_swnt.save(fname='lazy.xyz', stream=True)
+        self.tmpdata.append(unrolled_swnt.fname)
+        assert_equal(unrolled_swnt.estimate_file_size('xyz'),
+                     os.path.getsize(unrolled_swnt.fname))
+        assert_equal(unrolled_swnt.atoms.Natoms, unrolled_swnt.Natoms)
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -20,6 +20,26 @@ Base I/O classes to inherit from when creating new I/O classes
    StructureFormatSpec
    StructureIOError
    StructureConverter
+   TrajectoryIO
+
+Structure format registry
+-------------------------
+.. autosummary::
+   :toctree: generated/
+
+   register_structure_format
+   get_structure_reader
+   get_structure_writer
+   guess_structure_format
+   structure_formats
+
+Helper functions
+----------------
+.. autosummary::
+   :toctree: generated/
+
+   write_columns
+   iter_chunks
 
 I/O classes for the `LAMMPS data` structure data format
 --------------------------------------------------------
@@ -45,6 +65,77 @@ I/O classes for the `xyz` structure data format
    XYZIOError
    XYZ2DATAConverter
 
+I/O classes for the `pdb` structure data format
+-------------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   PDBReader
+   PDBWriter
+   PDBData
+   PDBFormatSpec
+   PDBIOError
+
+I/O classes for the `LAMMPS dump` trajectory format
+----------------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   DUMPReader
+   BinaryDUMPReader
+   DUMPWriter
+   DUMPData
+   DUMPFormatSpec
+   DUMPIOError
+
+I/O classes for the native binary `npz` and `h5` structure data formats
+------------------------------------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   NPZReader
+   NPZWriter
+   NPZData
+   NPZFormatSpec
+   NPZIOError
+   H5Reader
+   H5Writer
+   H5Data
+   H5FormatSpec
+   H5IOError
+   structure_arrays
+   structure_atoms
+
+I/O classes for the `H5MD` trajectory format
+---------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   H5MDReader
+   H5MDWriter
+   H5MDFormatSpec
+   H5MDIOError
+
+I/O classes for the `DCD` trajectory format
+--------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   DCDReader
+   DCDWriter
+   DCDFormatSpec
+   DCDIOError
+
+I/O classes for the AMBER `NetCDF` trajectory format
+-----------------------------------------------------
+.. autosummary::
+   :toctree: generated/
+
+   NetCDFReader
+   NetCDFWriter
+   NetCDFFormatSpec
+   NetCDFIOError
+
 """
 from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
@@ -54,5 +145,11 @@ from ._base import *
 from ._lammps_data_format import *
 from ._lammps_dump_format import *
 from ._xyz_format import *
+from ._pdb_format import *
+from ._npz_format import *
+from ._h5_format import *
+from ._h5md_format import *
+from ._dcd_format import *
+from ._netcdf_format import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
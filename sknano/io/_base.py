@@ -12,17 +12,28 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from importlib import import_module
+from itertools import chain
+import os
+import re
 
+import numpy as np
+
+from monty.io import zopen
 from sknano.core import get_fpath
-from sknano.core.atoms import StructureAtom as Atom, StructureAtoms as Atoms
+from sknano.core.atoms import StructureAtom as Atom, StructureAtoms as Atoms, \
+    Trajectory
 from sknano.core.crystallography import StructureData
+from sknano.core.geometric_regions import Cuboid
 # from sknano.utils.analysis import StructureAnalyzer
 from sknano.version import version
 
 default_comment_line = \
     'Structure data generated using scikit-nano version {}'.format(version)
 default_structure_format = 'xyz'
-supported_structure_formats = ('xyz', 'data', 'dump')
+supported_structure_formats = ('xyz', 'data', 'dump', 'pdb', 'npz', 'h5')
+default_chunk_size = 65536
 
 __all__ = ['Atom', 'Atoms',
            'StructureIO',
@@ -31,6 +42,15 @@ __all__ = ['Atom', 'Atoms',
            'StructureConverter',
            'StructureIOError',
            'StructureFormatSpec',
+           'TrajectoryIO',
+           'write_columns',
+           'iter_chunks',
+           'register_structure_format',
+           'get_structure_reader',
+           'get_structure_writer',
+           'guess_structure_format',
+           'structure_formats',
+           'default_chunk_size',
            'default_comment_line',
            'default_structure_format',
            'supported_structure_formats']
@@ -84,6 +104,292 @@ class StructureIO(StructureData):
         return cp
 
 
+class TrajectoryIO:
+    """Base class for random access trajectory file readers.
+
+    Subclasses set :attr:`Nframes` and implement :meth:`read_frame`.
+
+    Parameters
+    ----------
+    fpath : str
+
+    """
+    def __init__(self, fpath=None, **kwargs):
+        self.fpath = fpath
+        self.kwargs = kwargs
+        self.Nframes = 0
+        self._trajectory = None
+
+    def __len__(self):
+        return self.Nframes
+
+    def __getitem__(self, index):
+        return self.read_frame(index)
+
+    def __iter__(self):
+        for index in range(self.Nframes):
+            yield self.read_frame(index)
+
+    @property
+    def trajectory(self):
+        """:class:`~sknano.core.atoms.Trajectory` of all frames."""
+        if self._trajectory is None:
+            trajectory = Trajectory()
+            for index in range(self.Nframes):
+                trajectory.append(self.read_frame(index, trajectory))
+            if trajectory.Nsnaps > 0:
+                trajectory.time_selection.all()
+                trajectory.t0_snapshot = trajectory[0]
+            self._trajectory = trajectory
+        return self._trajectory
+
+    def read_frame(self, index, trajectory=None):
+        """Read frame `index` as a :class:`~sknano.core.atoms.Snapshot`.
+
+        Parameters
+        ----------
+        index : int
+        trajectory : {None, :class:`~sknano.core.atoms.Trajectory`}
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        raise NotImplementedError('Subclasses of `TrajectoryIO` need to '
+                                  'implement the `read_frame` method.')
+
+
+def _set_snapshot_box(snapshot, edges, offset):
+    """Set the LAMMPS box bounds of `snapshot` from the box `edges` \
+        matrix and `offset`."""
+    if edges.ndim == 1:
+        edges = np.diag(edges)
+    xy, xz, yz = edges[1, 0], edges[2, 0], edges[2, 1]
+    snapshot.xy, snapshot.xz, snapshot.yz = xy, xz, yz
+    snapshot.triclinic = bool(np.any([xy, xz, yz]))
+    xlo, ylo, zlo = offset
+    snapshot.xlo = xlo + min((0.0, xy, xz, xy + xz))
+    snapshot.xhi = xlo + edges[0, 0] + max((0.0, xy, xz, xy + xz))
+    snapshot.ylo = ylo + min((0.0, yz))
+    snapshot.yhi = ylo + edges[1, 1] + max((0.0, yz))
+    snapshot.zlo = zlo
+    snapshot.zhi = zlo + edges[2, 2]
+    snapshot.bounding_box = Cuboid()
+    for dim in ('x', 'y', 'z'):
+        setattr(snapshot.bounding_box, dim + 'min',
+                getattr(snapshot, dim + 'lo'))
+        setattr(snapshot.bounding_box, dim + 'max',
+                getattr(snapshot, dim + 'hi'))
+
+
+def _snapshot_box_offset(snapshot):
+    """Return the lower corner of the box of `snapshot`."""
+    if not snapshot.triclinic:
+        return np.array([snapshot.xlo, snapshot.ylo, snapshot.zlo])
+    return np.array([snapshot.xlo - min((0.0, snapshot.xy, snapshot.xz,
+                                         snapshot.xy + snapshot.xz)),
+                     snapshot.ylo - min((0.0, snapshot.yz)),
+                     snapshot.zlo])
+
+
+#: :class:`~python:collections.OrderedDict` mapping each registered
+#: structure format name to its reader, writer, file extensions, and
+#: file signatures. See :func:`register_structure_format`.
+structure_formats = OrderedDict()
+
+#: Entry point group used to register structure formats from other
+#: packages.
+structure_formats_entry_point_group = 'sknano.io.structure_formats'
+
+_entry_points_loaded = False
+
+
+def register_structure_format(name, reader=None, writer=None,
+                              extensions=None, magic=None):
+    """Register a structure format.
+
+    Readers and writers may be given as ``'module:attribute'`` strings so
+    that the module implementing the format is only imported when the
+    format is first used.
+
+    Other packages can register formats through the
+    ``sknano.io.structure_formats`` entry point group. Each entry point
+    name is a format name and its object is either a :class:`~python:dict`
+    of the keyword arguments of this function or a callable that
+    registers the format when called.
+
+    Parameters
+    ----------
+    name : str
+        Structure format name, e.g. `'xyz'`.
+    reader, writer : {None, str, class}, optional
+        Structure reader class called as ``reader(fpath, **kwargs)`` and
+        structure writer class with a ``writer.write(**kwargs)`` method.
+    extensions : {None, str, sequence}, optional
+        File extensions of the format. Default is `name`.
+    magic : {None, bytes, callable, sequence}, optional
+        File signatures used to identify files of the format. Each one is
+        either a leading byte string or a callable returning `True` if
+        the leading bytes of a file belong to the format.
+
+    """
+    if extensions is None:
+        extensions = (name,)
+    elif isinstance(extensions, str):
+        extensions = (extensions,)
+    if magic is None:
+        magic = ()
+    elif isinstance(magic, bytes) or callable(magic):
+        magic = (magic,)
+    structure_formats[name] = \
+        dict(reader=reader, writer=writer,
+             extensions=tuple(ext.lstrip('.') for ext in extensions),
+             magic=tuple(magic))
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    try:
+        from pkg_resources import iter_entry_points
+    except ImportError:
+        return
+    for entry_point in \
+            iter_entry_points(structure_formats_entry_point_group):
+        obj = entry_point.load()
+        if isinstance(obj, dict):
+            register_structure_format(entry_point.name, **obj)
+        else:
+            obj()
+
+
+def _get_structure_format(structure_format):
+    _load_entry_points()
+    try:
+        return structure_formats[structure_format]
+    except KeyError:
+        raise StructureIOError(
+            'Unknown `structure_format`: {!r}'.format(structure_format))
+
+
+def _resolve(obj):
+    if isinstance(obj, str):
+        module, attr = obj.split(':')
+        obj = getattr(import_module(module, __package__), attr)
+    return obj
+
+
+def get_structure_reader(structure_format):
+    """Return the reader class of a registered `structure_format`."""
+    reader = _resolve(_get_structure_format(structure_format)['reader'])
+    if reader is None:
+        raise StructureIOError(
+            'No reader for `structure_format`: {!r}'.format(structure_format))
+    return reader
+
+
+def get_structure_writer(structure_format):
+    """Return the writer class of a registered `structure_format`."""
+    writer = _resolve(_get_structure_format(structure_format)['writer'])
+    if writer is None:
+        raise StructureIOError(
+            'No writer for `structure_format`: {!r}'.format(structure_format))
+    return writer
+
+
+def guess_structure_format(fpath, sniff=True):
+    """Guess the structure format of a file.
+
+    The format is looked up by file extension, ignoring a trailing
+    compression extension. If that fails and `sniff` is `True`, the leading
+    bytes of the file are matched against the registered file signatures.
+
+    Parameters
+    ----------
+    fpath : str
+    sniff : bool, optional
+
+    Returns
+    -------
+    {None, str}
+        Structure format name or `None` if it can't be determined.
+
+    """
+    _load_entry_points()
+    root, ext = os.path.splitext(fpath)
+    if ext in ('.gz', '.bz2'):
+        ext = os.path.splitext(root)[-1]
+    ext = ext.lstrip('.')
+    for name, spec in structure_formats.items():
+        if ext in spec['extensions']:
+            return name
+
+    if not sniff or not os.path.isfile(fpath):
+        return None
+    with zopen(fpath, 'rb') as f:
+        header = f.read(4096)
+    for name, spec in structure_formats.items():
+        for magic in spec['magic']:
+            if callable(magic):
+                if magic(header):
+                    return name
+            elif header.startswith(magic):
+                return name
+    return None
+
+
+def _sniff_xyz(header):
+    lines = header.splitlines()
+    return len(lines) > 2 and lines[0].strip().isdigit() and \
+        len(lines[2].split()) >= 4
+
+
+def _sniff_dcd(header):
+    return header[4:8] == b'CORD'
+
+
+def _sniff_data(header):
+    return re.search(br'^\s*\d+\s+atoms\s*$', header, re.M) is not None
+
+
+register_structure_format('data',
+                          reader='._lammps_data_format:DATAReader',
+                          writer='._lammps_data_format:DATAWriter',
+                          extensions=('data', 'lammps'), magic=_sniff_data)
+register_structure_format('dump',
+                          reader='._lammps_dump_format:DUMPReader',
+                          writer='._lammps_dump_format:DUMPWriter',
+                          extensions=('dump', 'lammpstrj'),
+                          magic=b'ITEM: TIMESTEP')
+register_structure_format('bindump',
+                          reader='._lammps_dump_format:BinaryDUMPReader',
+                          extensions='bin',
+                          magic=b'\xf6\xff\xff\xff\xff\xff\xff\xffDUMPCUSTOM')
+register_structure_format('xyz', reader='._xyz_format:XYZReader',
+                          writer='._xyz_format:XYZWriter', magic=_sniff_xyz)
+register_structure_format('pdb', reader='._pdb_format:PDBReader',
+                          writer='._pdb_format:PDBWriter',
+                          extensions=('pdb', 'ent'))
+register_structure_format('npz', reader='._npz_format:NPZReader',
+                          writer='._npz_format:NPZWriter',
+                          magic=b'PK\x03\x04')
+register_structure_format('h5', reader='._h5_format:H5Reader',
+                          writer='._h5_format:H5Writer',
+                          extensions=('h5', 'hdf5'),
+                          magic=b'\x89HDF\r\n\x1a\n')
+register_structure_format('h5md', reader='._h5md_format:H5MDReader',
+                          writer='._h5md_format:H5MDWriter')
+register_structure_format('dcd', reader='._dcd_format:DCDReader',
+                          writer='._dcd_format:DCDWriter', magic=_sniff_dcd)
+register_structure_format('nc', reader='._netcdf_format:NetCDFReader',
+                          writer='._netcdf_format:NetCDFWriter',
+                          extensions=('nc', 'ncdf', 'netcdf'),
+                          magic=(b'CDF\x01', b'CDF\x02'))
+
+
 class StructureReader:
     """Structure data reader base class."""
     @classmethod
@@ -94,21 +400,15 @@ class StructureReader:
         ----------
         fpath : str
         structure_format : {None, str}
+            Registered structure format name. If `None`, it is guessed with
+            :func:`guess_structure_format`.
+
         """
-        if (structure_format is None and fpath.endswith('.data')) or \
-                structure_format == 'data':
-            from ._lammps_data_format import DATAReader
-            return DATAReader(fpath, **kwargs)
-        elif (structure_format is None and fpath.endswith('.dump')) or \
-                structure_format == 'dump':
-            from ._lammps_dump_format import DUMPReader
-            return DUMPReader(fpath, **kwargs)
-        elif (structure_format is None and fpath.endswith('.xyz')) or \
-                structure_format == 'xyz':
-            from ._xyz_format import XYZReader
-            return XYZReader.read(fpath)
-        else:
+        if structure_format is None:
+            structure_format = guess_structure_format(fpath)
+        if structure_format is None:
             raise StructureIOError("Unable to determine `structure_format`")
+        return get_structure_reader(structure_format)(fpath, **kwargs)
 
 
 class StructureWriter:
@@ -121,6 +421,9 @@ class StructureWriter:
         ----------
         fname : str, optional
         structure_format : {None, str}, optional
+            Registered structure format name. If `None`, it is guessed
+            from the `fname` extension, defaulting to
+            :data:`default_structure_format`.
 
         """
         if fname is None and structure_format is None:
@@ -130,19 +433,11 @@ class StructureWriter:
             fname = get_fpath(fname='structure_data', ext=structure_format,
                               add_fnum=True)
 
-        if (structure_format is None and fname.endswith('.data')) or \
-                structure_format == 'data':
-            from ._lammps_data_format import DATAWriter
-            DATAWriter.write(fname=fname, **kwargs)
-        elif (structure_format is None and fname.endswith('.dump')) or \
-                structure_format == 'dump':
-            from ._lammps_dump_format import DUMPWriter
-            DUMPWriter.write(fname=fname, **kwargs)
-        # elif (structure_format is None and fname.endswith('.xyz')) or \
-        #        structure_format == 'xyz':
-        else:
-            from ._xyz_format import XYZWriter
-            XYZWriter.write(fname=fname, **kwargs)
+        if structure_format is None:
+            structure_format = guess_structure_format(fname, sniff=False) \
+                or default_structure_format
+
+        get_structure_writer(structure_format).write(fname=fname, **kwargs)
 
 
 class StructureConverter(metaclass=ABCMeta):
@@ -181,3 +476,75 @@ class StructureFormatSpec:
 class StructureIOError(Exception):
     """Base class for `StructureIO` errors."""
     pass
+
+
+def write_columns(f, columns, fmt, chunk_size=None):
+    """Write columns of data to an open file object.
+
+    Lines are formatted a block of `chunk_size` rows at a time with a
+    single `%`-style string formatting operation and written to `f` with
+    one call per block.
+
+    Parameters
+    ----------
+    f : file object
+    columns : sequence of array_like
+        Sequence of :math:`(N,)` column arrays.
+    fmt : :class:`~python:str` or sequence of :class:`~python:str`
+        `%`-style format string for a row or a sequence of format
+        strings, one for each column.
+    chunk_size : {None, :class:`~python:int`}, optional
+        Number of rows formatted and written at a time.
+        Default is :data:`default_chunk_size`.
+
+    """
+    if not isinstance(fmt, str):
+        fmt = ''.join(fmt)
+    fmt += '\n'
+    if chunk_size is None:
+        chunk_size = default_chunk_size
+    columns = [np.asarray(column) for column in columns]
+    N = len(columns[0]) if columns else 0
+    for start in range(0, N, chunk_size):
+        chunk = [column[start:start + chunk_size].tolist()
+                 for column in columns]
+        f.write((fmt * len(chunk[0])) %
+                tuple(chain.from_iterable(zip(*chunk))))
+
+
+def iter_chunks(chunks, Natoms):
+    """Iterate over the chunks of a structure streamed to a writer.
+
+    Parameters
+    ----------
+    chunks : iterable of :class:`~python:dict`
+        Chunks of per-atom column arrays with the keys of
+        :func:`~sknano.io.structure_arrays`, e.g. as returned by
+        :meth:`~sknano.generators.GeneratorBase.generate_chunks`.
+    Natoms : :class:`~python:int`
+        Total number of atoms in `chunks`.
+
+    Yields
+    ------
+    ids : :class:`~numpy:numpy.ndarray`
+        Consecutive atom ids of the chunk atoms, continuing from the
+        previous chunk and starting at `1`.
+    chunk : :class:`~python:dict`
+
+    Raises
+    ------
+    :class:`StructureIOError`
+        If the number of atoms in `chunks` is not `Natoms`.
+
+    """
+    start = 1
+    for chunk in chunks:
+        stop = start + len(chunk['r'])
+        if stop - 1 > Natoms:
+            raise StructureIOError('Expected {:d} atoms, got more.'.format(
+                Natoms))
+        yield np.arange(start, stop), chunk
+        start = stop
+    if start - 1 != Natoms:
+        raise StructureIOError('Expected {:d} atoms, got {:d}.'.format(
+            Natoms, start - 1))
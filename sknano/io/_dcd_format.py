@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+====================================================
+DCD trajectory format (:mod:`sknano.io._dcd_format`)
+====================================================
+
+.. currentmodule:: sknano.io._dcd_format
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+import os
+
+import numpy as np
+
+from sknano.core import get_fpath
+from sknano.core.atoms import Snapshot
+
+from ._base import StructureIOError, StructureFormatSpec, TrajectoryIO, \
+    default_comment_line, _set_snapshot_box
+
+__all__ = ['DCDReader', 'DCDWriter', 'DCDFormatSpec', 'DCDIOError']
+
+
+def frame_dtype(Natoms, unit_cell=True, byteorder='<'):
+    """Return the structured :class:`~numpy:numpy.dtype` of one DCD frame.
+
+    Each Fortran record is framed by 4-byte length markers. A frame is
+    an optional 48-byte unit cell record followed by the `x`, `y`, `z`
+    coordinate records of `Natoms` single precision floats.
+
+    Parameters
+    ----------
+    Natoms : int
+    unit_cell : bool, optional
+    byteorder : {'<', '>'}, optional
+
+    Returns
+    -------
+    :class:`~numpy:numpy.dtype`
+
+    """
+    i4 = byteorder + 'i4'
+    fields = []
+    if unit_cell:
+        fields.extend([('cell_start', i4), ('cell', byteorder + 'f8', 6),
+                       ('cell_end', i4)])
+    for dim in ('x', 'y', 'z'):
+        fields.extend([(dim + '_start', i4),
+                       (dim, byteorder + 'f4', (Natoms,)),
+                       (dim + '_end', i4)])
+    return np.dtype(fields)
+
+
+def cell_matrix(cell):
+    """Return the LAMMPS box matrix of the DCD unit `cell` record.
+
+    Parameters
+    ----------
+    cell : array_like
+        :math:`(a, \\gamma, b, \\beta, \\alpha, c)` with the angles given
+        either as cosines (CHARMM/LAMMPS) or in degrees (NAMD).
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+
+    """
+    a, gamma, b, beta, alpha, c = np.asarray(cell, dtype=float)
+    angles = np.array([alpha, beta, gamma])
+    if np.all(np.abs(angles) <= 1.0):
+        cos_alpha, cos_beta, cos_gamma = angles
+    else:
+        cos_alpha, cos_beta, cos_gamma = np.cos(np.radians(angles))
+    xy = b * cos_gamma
+    xz = c * cos_beta
+    ly = np.sqrt(b ** 2 - xy ** 2)
+    yz = (b * c * cos_alpha - xy * xz) / ly
+    lz = np.sqrt(c ** 2 - xz ** 2 - yz ** 2)
+    return np.array([[a, 0.0, 0.0], [xy, ly, 0.0], [xz, yz, lz]])
+
+
+def unit_cell(cell_matrix):
+    """Return the DCD unit cell record of the LAMMPS box `cell_matrix`."""
+    a, b, c = np.linalg.norm(cell_matrix, axis=1)
+    cos_alpha = np.dot(cell_matrix[1], cell_matrix[2]) / (b * c)
+    cos_beta = np.dot(cell_matrix[0], cell_matrix[2]) / (a * c)
+    cos_gamma = np.dot(cell_matrix[0], cell_matrix[1]) / (a * b)
+    return np.array([a, cos_gamma, b, cos_beta, cos_alpha, c])
+
+
+class DCDReader(TrajectoryIO):
+    """Class for reading `DCD` binary trajectory files.
+
+    The frames are memory mapped with a fixed record layout, so any frame
+    is read by index without parsing the preceding frames.
+
+    Parameters
+    ----------
+    fpath : str
+        `DCD` file path.
+    types : {None, array_like}, optional
+        Atom types. `DCD` files only store coordinates, so the atom types
+        default to 1 and the atom ids to :math:`1, \\ldots, N`.
+
+    """
+    def __init__(self, fpath, types=None, **kwargs):
+        super().__init__(fpath=fpath, **kwargs)
+        self._read_header()
+        self.types = np.ones(self.Natoms, dtype=int) if types is None \
+            else np.asarray(types, dtype=int)
+
+        fsize = os.path.getsize(fpath) - self.header_size
+        self.Nframes = max(fsize, 0) // self.frame_dtype.itemsize
+        self.frames = np.memmap(fpath, dtype=self.frame_dtype, mode='r',
+                                offset=self.header_size,
+                                shape=(self.Nframes,)) \
+            if self.Nframes > 0 else np.empty(0, dtype=self.frame_dtype)
+        self.timesteps = self.istart + self.nsavc * np.arange(self.Nframes)
+
+    def _read_header(self):
+        with open(self.fpath, 'rb') as f:
+            header = f.read(92)
+            if len(header) < 92:
+                raise DCDIOError('{} is not a DCD file'.format(self.fpath))
+            for byteorder in ('<', '>'):
+                if np.frombuffer(header, byteorder + 'i4', 1)[0] == 84 and \
+                        header[4:8] == b'CORD':
+                    break
+            else:
+                raise DCDIOError('{} is not a DCD file'.format(self.fpath))
+            self.byteorder = byteorder
+            i4 = byteorder + 'i4'
+
+            icntrl = np.frombuffer(header, i4, 20, offset=8)
+            self.istart, self.nsavc = int(icntrl[1]), max(int(icntrl[2]), 1)
+            self.dt = float(np.frombuffer(header, byteorder + 'f4', 1,
+                                          offset=8 + 9 * 4)[0])
+            self.unit_cell = bool(icntrl[10])
+            if icntrl[8] != 0:
+                raise DCDIOError('DCD files with fixed atoms are not '
+                                 'supported.')
+
+            size = int(np.frombuffer(f.read(4), i4)[0])
+            ntitle = int(np.frombuffer(f.read(4), i4)[0])
+            titles = f.read(size - 4)
+            f.read(4)
+            self.comment_line = b'\n'.join(
+                titles[80 * i:80 * (i + 1)].rstrip(b'\0 ')
+                for i in range(ntitle)).decode('ascii', 'replace')
+            f.read(4)
+            self.Natoms = int(np.frombuffer(f.read(4), i4)[0])
+            f.read(4)
+            self.header_size = f.tell()
+
+        self.frame_dtype = frame_dtype(self.Natoms, unit_cell=self.unit_cell,
+                                       byteorder=self.byteorder)
+
+    def get_positions(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom positions.
+
+        Parameters
+        ----------
+        frames, atoms : {slice, int, array_like}, optional
+            Frame and atom index selections.
+
+        """
+        frames = self.frames[frames]
+        return np.concatenate([frames[dim][..., atoms, np.newaxis] for dim in
+                               ('x', 'y', 'z')], axis=-1).astype(float)
+
+    def get_cell_matrices(self, frames=slice(None)):
+        """Return :math:`(T, 3, 3)` array of box matrices."""
+        if not self.unit_cell:
+            raise DCDIOError('{} has no unit cell records'.format(self.fpath))
+        cells = np.atleast_2d(self.frames[frames]['cell'])
+        return np.array([cell_matrix(cell) for cell in cells])
+
+    def read_frame(self, index, trajectory=None):
+        """Read frame `index` as a :class:`~sknano.core.atoms.Snapshot`.
+
+        Parameters
+        ----------
+        index : int
+        trajectory : {None, :class:`~sknano.core.atoms.Trajectory`}
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        if index < 0:
+            index += self.Nframes
+        positions = self.get_positions(frames=index)
+
+        snapshot = Snapshot(trajectory)
+        snapshot.timestep = int(self.timesteps[index])
+        snapshot.Natoms = self.Natoms
+        snapshot.atom_selection = np.zeros(self.Natoms, dtype=bool)
+        snapshot.boxstr = 'pp pp pp'
+        snapshot.atomattrs = ['id', 'type', 'x', 'y', 'z']
+        snapshot.attr_dtypes = [int, int, float, float, float]
+        snapshot.atoms = np.column_stack((np.arange(1, self.Natoms + 1),
+                                          self.types, positions)).astype(float)
+        if self.unit_cell:
+            edges = cell_matrix(self.frames[index]['cell'])
+        else:
+            edges = np.diag(positions.max(axis=0) - positions.min(axis=0)) \
+                if self.Natoms > 0 else np.zeros((3, 3))
+        offset = np.zeros(3) if self.unit_cell or self.Natoms == 0 \
+            else positions.min(axis=0)
+        _set_snapshot_box(snapshot, edges, offset)
+        return snapshot
+
+
+class DCDWriter:
+    """Class for writing trajectories in the `DCD` file format.
+
+    The file is written with the LAMMPS `dump dcd` conventions:
+    little-endian records, a unit cell record per frame with the cell
+    angles stored as cosines, and single precision coordinates.
+
+    """
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, trajectory=None,
+              dt=1.0, comment_line=None, **kwargs):
+        """Write trajectory to file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output file.
+        trajectory : :class:`~sknano.core.atoms.Trajectory`
+            The selected snapshots of `trajectory` are written.
+            Atoms are sorted by id. The snapshot timesteps must be
+            evenly spaced.
+        dt : float, optional
+            Time per timestep stored in the header.
+        comment_line : str, optional
+            Title stored in the header.
+
+        """
+        if trajectory is None:
+            raise ValueError('Expected a `trajectory`.')
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='dcd', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        if comment_line is None:
+            comment_line = default_comment_line
+
+        snapshots = trajectory.selected_snapshots
+        if len(snapshots) == 0:
+            raise DCDIOError('No trajectory snapshots selected.')
+        Nframes = len(snapshots)
+        Natoms = len(snapshots[0].get_atoms(asarray=True))
+        timesteps = np.asarray([snapshot.timestep for snapshot in snapshots])
+        nsavc = timesteps[1] - timesteps[0] if Nframes > 1 else 1
+        if Nframes > 1 and np.any(np.diff(timesteps) != nsavc):
+            raise DCDIOError('DCD files require evenly spaced timesteps.')
+
+        icntrl = np.zeros(20, dtype='<i4')
+        icntrl[:4] = Nframes, timesteps[0], nsavc, timesteps[-1]
+        icntrl[10] = 1
+        icntrl[19] = 24
+        icntrl[9] = np.array(dt, dtype='<f4').view('<i4')
+        title = comment_line.encode('ascii', 'replace')[:80].ljust(80)
+
+        dtype = frame_dtype(Natoms)
+        frame = np.zeros(1, dtype=dtype)
+        frame['cell_start'] = frame['cell_end'] = 48
+        for dim in ('x', 'y', 'z'):
+            frame[dim + '_start'] = frame[dim + '_end'] = 4 * Natoms
+
+        with open(fpath, 'wb') as f:
+            np.array([84], dtype='<i4').tofile(f)
+            f.write(b'CORD')
+            icntrl.tofile(f)
+            np.array([84, 84, 1], dtype='<i4').tofile(f)
+            f.write(title)
+            np.array([84, 4, Natoms, 4], dtype='<i4').tofile(f)
+
+            for snapshot in snapshots:
+                if len(snapshot.get_atoms(asarray=True)) != Natoms:
+                    raise DCDIOError('DCD files require a constant number '
+                                     'of atoms.')
+                positions = snapshot.get_positions(unwrap=False)
+                frame['cell'] = unit_cell(snapshot.cell_matrix)
+                for i, dim in enumerate(('x', 'y', 'z')):
+                    frame[dim] = positions[:, i]
+                frame.tofile(f)
+
+
+class DCDIOError(StructureIOError):
+    pass
+
+
+class DCDFormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `DCD` format."""
+    pass
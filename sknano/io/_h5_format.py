@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+====================================================
+HDF5 format (:mod:`sknano.io._h5_format`)
+====================================================
+
+.. currentmodule:: sknano.io._h5_format
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+
+import numpy as np
+
+from sknano.core import get_fpath
+
+from ._base import StructureIOError, StructureFormatSpec, iter_chunks
+from ._npz_format import NPZReader, structure_arrays
+
+__all__ = ['H5Reader', 'H5Writer', 'H5Data', 'H5FormatSpec', 'H5IOError']
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError('Install h5py to read and write HDF5 files.')
+    return h5py
+
+
+class H5Reader(NPZReader):
+    """`StructureIO` class for reading HDF5 `h5` structure files.
+
+    The file layout is the same set of arrays as the `npz` format,
+    stored as datasets of the root group.
+
+    Parameters
+    ----------
+    fpath : str
+        `h5` structure file path.
+
+    """
+    def read(self):
+        """Read `h5` file."""
+        h5py = _import_h5py()
+        self._unparsed_atoms = False
+        self.structure_data.clear()
+        try:
+            with h5py.File(self.fpath, 'r') as f:
+                self.arrays = OrderedDict((key, f[key][()]) for key in f)
+                self.arrays.update(f.attrs.items())
+        except (IOError, OSError) as e:
+            raise H5IOError(str(e))
+        for key, value in self.arrays.items():
+            value = np.asarray(value)
+            if value.dtype.kind == 'S':
+                value = value.astype(str)
+            self.arrays[key] = value
+        self._parse_arrays()
+
+
+class H5Writer:
+    """`StructureWriter` class for writing HDF5 `h5` structure files."""
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, structure=None,
+              atoms=None, comment_line=None, compression=None, **kwargs):
+        """Write structure data to file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        atoms : :class:`~sknano.core.atoms.Atoms`
+            An :class:`~sknano.core.atoms.Atoms` instance.
+        comment_line : str, optional
+            A string stored with the structure data.
+        compression : {None, str}, optional
+            HDF5 dataset compression filter, e.g. `'gzip'`.
+
+        """
+        h5py = _import_h5py()
+        if structure is None and atoms is None:
+            raise ValueError('Expected either `structure` or `atoms` object.')
+
+        if structure is not None and atoms is None:
+            atoms = structure.atoms
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='h5', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        arrays = structure_arrays(atoms,
+                                  lattice=getattr(structure, 'lattice', None),
+                                  comment_line=comment_line)
+        with h5py.File(fpath, 'w') as f:
+            for key, value in arrays.items():
+                if value.dtype.kind == 'U':
+                    value = np.char.encode(value, 'utf-8')
+                if value.ndim == 0:
+                    f.attrs[key] = value
+                else:
+                    f.create_dataset(key, data=value,
+                                     compression=compression)
+
+    @classmethod
+    def write_chunks(cls, chunks, Natoms, fname=None, outpath=None,
+                     fpath=None, lattice=None, comment_line=None,
+                     compression=None, **kwargs):
+        """Write structure data to file one chunk of atoms at a time.
+
+        The datasets are created with `Natoms` rows when the first chunk
+        is written and filled one chunk at a time, so only one chunk of
+        atoms is held in memory at a time. Atom ids are assigned
+        consecutively.
+
+        Parameters
+        ----------
+        chunks : iterable of :class:`~python:dict`
+            Chunks of per-atom column arrays. See
+            :func:`~sknano.io.iter_chunks`.
+        Natoms : int
+            Total number of atoms in `chunks`.
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        lattice : {None, `Crystal3DLattice`}, optional
+            Structure
+            :class:`~sknano.core.crystallography.Crystal3DLattice`.
+        comment_line : str, optional
+            A string stored with the structure data.
+        compression : {None, str}, optional
+            HDF5 dataset compression filter, e.g. `'gzip'`.
+
+        """
+        h5py = _import_h5py()
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='h5', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        with h5py.File(fpath, 'w') as f:
+            arrays = structure_arrays([], lattice=lattice,
+                                      comment_line=comment_line)
+            for key, value in arrays.items():
+                if value.dtype.kind == 'U':
+                    value = np.char.encode(value, 'utf-8')
+                if value.ndim == 0:
+                    f.attrs[key] = value
+                else:
+                    f.create_dataset(key, data=value)
+
+            start = 0
+            for ids, chunk in iter_chunks(chunks, Natoms):
+                chunk = OrderedDict(chunk)
+                chunk['id'] = ids
+                stop = start + len(ids)
+                for key, value in chunk.items():
+                    value = np.asarray(value)
+                    if value.dtype.kind == 'U':
+                        value = np.char.encode(value, 'utf-8')
+                    if key not in f:
+                        dtype = value.dtype
+                        if dtype.kind == 'S':
+                            # element symbols of later chunks may be longer
+                            dtype = 'S{:d}'.format(max(dtype.itemsize, 3))
+                        f.create_dataset(key, shape=(Natoms,) +
+                                         value.shape[1:], dtype=dtype,
+                                         compression=compression)
+                    f[key][start:stop] = value
+                start = stop
+
+
+class H5Data(H5Reader):
+    """Class for reading and writing `StructureData` in `h5` format.
+
+    Parameters
+    ----------
+    fpath : str, optional
+
+    """
+    def __init__(self, fpath=None, **kwargs):
+        super().__init__(fpath, **kwargs)
+
+    def write(self, h5file=None, **kwargs):
+        """Write h5 file.
+
+        Parameters
+        ----------
+        h5file : {None, str}, optional
+
+        """
+        if h5file is None or h5file == '':
+            h5file = self.fpath
+        if h5file is None or h5file == '':
+            raise ValueError(
+                '`h5file` must be a string at least 1 character long.')
+
+        kwargs.update(self.kwargs)
+        H5Writer.write(fpath=h5file, structure=self,
+                       comment_line=self.comment_line, **kwargs)
+
+
+class H5IOError(StructureIOError):
+    pass
+
+
+class H5FormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `h5` format."""
+    pass
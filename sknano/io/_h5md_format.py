@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+H5MD trajectory format (:mod:`sknano.io._h5md_format`)
+===============================================================================
+
+.. currentmodule:: sknano.io._h5md_format
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+
+import numpy as np
+
+from sknano.core import get_fpath
+from sknano.core.atoms import Snapshot
+from sknano.version import version
+
+from ._base import StructureIOError, StructureFormatSpec, TrajectoryIO, \
+    _set_snapshot_box, _snapshot_box_offset
+
+__all__ = ['H5MDReader', 'H5MDWriter', 'H5MDFormatSpec', 'H5MDIOError']
+
+#: Maps the H5MD particle element groups of per-atom vectors to the
+#: corresponding :class:`~sknano.core.atoms.Snapshot` atom attributes.
+vector_elements = OrderedDict([('position', ['x', 'y', 'z']),
+                               ('image', ['ix', 'iy', 'iz']),
+                               ('velocity', ['vx', 'vy', 'vz']),
+                               ('force', ['fx', 'fy', 'fz'])])
+
+#: Maps the H5MD particle element groups of per-atom scalars to the
+#: corresponding :class:`~sknano.core.atoms.Snapshot` atom attributes.
+scalar_elements = OrderedDict([('id', 'id'), ('species', 'type'),
+                               ('mass', 'mass'), ('charge', 'q')])
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError('Install h5py to read and write H5MD files.')
+    return h5py
+
+
+class H5MDReader(TrajectoryIO):
+    """Class for reading `H5MD` trajectory files.
+
+    Frames are read on demand with HDF5 hyperslab selections, so single
+    frames or atom subsets of large trajectories are read without
+    loading the whole file.
+
+    Parameters
+    ----------
+    fpath : str
+        `H5MD` file path.
+    particles : str, optional
+        Name of the `/particles` subgroup to read.
+
+    """
+    def __init__(self, fpath, particles='all', **kwargs):
+        h5py = _import_h5py()
+        super().__init__(fpath=fpath, **kwargs)
+        self.particles = particles
+
+        try:
+            with h5py.File(self.fpath, 'r') as f:
+                group = f['particles'][particles]
+                self.elements = [name for name in group if name != 'box']
+                position = group['position']
+                self.timesteps = position['step'][()]
+                self.times = position['time'][()]
+                self.Nframes, self.Natoms = position['value'].shape[:2]
+        except (IOError, OSError, KeyError) as e:
+            raise H5MDIOError('Unable to read H5MD file {}: {}'.format(
+                fpath, e))
+
+    def get_values(self, element, frames=slice(None), atoms=slice(None)):
+        """Read a hyperslab of a particle element.
+
+        Parameters
+        ----------
+        element : str
+            Particle element name, e.g. `'position'`.
+        frames, atoms : {slice, int, array_like}, optional
+            Frame and atom index selections. Index arrays must be
+            increasing.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        h5py = _import_h5py()
+        with h5py.File(self.fpath, 'r') as f:
+            value = f['particles'][self.particles][element]['value']
+            if isinstance(frames, slice) or np.isscalar(frames):
+                return value[frames, atoms]
+            return value[list(frames)][:, atoms]
+
+    def get_positions(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom positions."""
+        return self.get_values('position', frames=frames, atoms=atoms)
+
+    def get_velocities(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom velocities."""
+        return self.get_values('velocity', frames=frames, atoms=atoms)
+
+    def get_forces(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom forces."""
+        return self.get_values('force', frames=frames, atoms=atoms)
+
+    def read_frame(self, index, trajectory=None):
+        """Read frame `index` as a :class:`~sknano.core.atoms.Snapshot`.
+
+        Parameters
+        ----------
+        index : int
+        trajectory : {None, :class:`~sknano.core.atoms.Trajectory`}
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        h5py = _import_h5py()
+        if index < 0:
+            index += self.Nframes
+        with h5py.File(self.fpath, 'r') as f:
+            group = f['particles'][self.particles]
+            atomattrs = []
+            attr_dtypes = []
+            columns = []
+            for element in self.elements:
+                value = group[element]['value'][index]
+                if element in vector_elements:
+                    attrs = vector_elements[element]
+                elif element in scalar_elements:
+                    attrs = [scalar_elements[element]]
+                else:
+                    attrs = [element]
+                value = value.reshape(self.Natoms, len(attrs))
+                atomattrs.extend(attrs)
+                attr_dtypes.extend(
+                    [int if value.dtype.kind in 'iu' else float] * len(attrs))
+                columns.append(value)
+
+            box = group['box']
+            edges = box['edges']['value'][index]
+            offset = box['offset']['value'][index] if 'offset' in box \
+                else np.zeros(3)
+
+        snapshot = Snapshot(trajectory)
+        snapshot.timestep = int(self.timesteps[index])
+        snapshot.Natoms = self.Natoms
+        snapshot.atom_selection = np.zeros(self.Natoms, dtype=bool)
+        snapshot.atomattrs = atomattrs
+        snapshot.attr_dtypes = attr_dtypes
+        snapshot.atoms = np.column_stack(columns).astype(float)
+        _set_snapshot_box(snapshot, edges, offset)
+        return snapshot
+
+
+class H5MDWriter:
+    """Class for writing trajectories in the `H5MD` file format.
+
+    Each per-atom element is stored under `/particles/all` as a
+    chunked :math:`(T, N[, 3])` `value` dataset that shares the `step` and
+    `time` datasets of the `position` element. The box `edges` matrix and
+    its `offset` (the lower box corner) are stored per frame.
+
+    """
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, trajectory=None,
+              dt=1.0, compression=None, compression_opts=None,
+              chunk_frames=1, author=None, **kwargs):
+        """Write trajectory to file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output file.
+        trajectory : :class:`~sknano.core.atoms.Trajectory`
+            The selected snapshots of `trajectory` are written.
+            Atoms are sorted by id.
+        dt : float, optional
+            Time per timestep used for the H5MD `time` datasets.
+        compression : {None, 'gzip', 'lzf'}, optional
+            Dataset compression filter.
+        compression_opts : {None, int}, optional
+            Compression level of the `gzip` filter.
+        chunk_frames : int, optional
+            Number of frames per dataset chunk. Use 1 for the fastest
+            random frame access.
+        author : {None, str}, optional
+
+        """
+        h5py = _import_h5py()
+        if trajectory is None:
+            raise ValueError('Expected a `trajectory`.')
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='h5md', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        snapshots = trajectory.selected_snapshots
+        if len(snapshots) == 0:
+            raise H5MDIOError('No trajectory snapshots selected.')
+        Nframes = len(snapshots)
+        atomattrs = list(snapshots[0].atomattrs)
+        Natoms = len(snapshots[0].get_atoms(asarray=True))
+
+        elements = OrderedDict()
+        for element, attrs in vector_elements.items():
+            if all(attr in atomattrs for attr in attrs):
+                elements[element] = attrs
+        if 'position' not in elements:
+            raise H5MDIOError('Trajectory snapshots have no positions.')
+        used = set(attr for attrs in elements.values() for attr in attrs)
+        for element, attr in scalar_elements.items():
+            if attr in atomattrs:
+                elements[element] = [attr]
+                used.add(attr)
+        for attr in atomattrs:
+            if attr not in used:
+                elements[attr] = [attr]
+        attr_dtypes = dict(zip(atomattrs, snapshots[0].attr_dtypes))
+
+        steps = np.asarray([snapshot.timestep for snapshot in snapshots])
+        kwargs = dict(compression=compression,
+                      compression_opts=compression_opts)
+        with h5py.File(fpath, 'w') as f:
+            h5md = f.create_group('h5md')
+            h5md.attrs['version'] = np.array([1, 1])
+            h5md.create_group('author').attrs['name'] = \
+                author if author is not None else 'unknown'
+            creator = h5md.create_group('creator')
+            creator.attrs['name'] = 'scikit-nano'
+            creator.attrs['version'] = version
+
+            group = f.create_group('particles').create_group('all')
+            box = group.create_group('box')
+            box.attrs['dimension'] = 3
+            boundary = getattr(snapshots[0], 'boxstr', 'pp pp pp').split()
+            box.attrs['boundary'] = \
+                np.array([b'periodic' if b.startswith('p') else b'none'
+                          for b in boundary[-3:]] if len(boundary) >= 3
+                         else [b'periodic'] * 3)
+
+            values = OrderedDict()
+            step = time = None
+            for element, attrs in elements.items():
+                shape = (Nframes, Natoms) + \
+                    ((len(attrs),) if len(attrs) > 1 else ())
+                dtype = int if all(attr_dtypes.get(attr) is int
+                                   for attr in attrs) else float
+                egroup = group.create_group(element)
+                if step is None:
+                    step = egroup.create_dataset('step', data=steps)
+                    time = egroup.create_dataset('time', data=steps * dt)
+                else:
+                    egroup['step'] = step
+                    egroup['time'] = time
+                values[element] = egroup.create_dataset(
+                    'value', shape=shape, dtype=dtype,
+                    chunks=(min(chunk_frames, Nframes),) + shape[1:],
+                    maxshape=(None,) + shape[1:], **kwargs)
+
+            for name in ('edges', 'offset'):
+                egroup = box.create_group(name)
+                egroup['step'] = step
+                egroup['time'] = time
+                values[name] = egroup.create_dataset(
+                    'value', shape=(Nframes, 3, 3) if name == 'edges' else
+                    (Nframes, 3), dtype=float)
+
+            for index, snapshot in enumerate(snapshots):
+                if len(snapshot.get_atoms(asarray=True)) != Natoms:
+                    raise H5MDIOError(
+                        'H5MD trajectories require a constant number of '
+                        'atoms.')
+                columns = snapshot.get_attrs(*atomattrs)
+                for element, attrs in elements.items():
+                    value = columns[:, [atomattrs.index(attr)
+                                        for attr in attrs]]
+                    values[element][index] = \
+                        value if len(attrs) > 1 else value[:, 0]
+
+                values['edges'][index] = snapshot.cell_matrix
+                values['offset'][index] = _snapshot_box_offset(snapshot)
+
+
+class H5MDIOError(StructureIOError):
+    pass
+
+
+class H5MDFormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `H5MD` format."""
+    pass
@@ -12,16 +12,20 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
 from collections import OrderedDict
+from itertools import islice
 import os
+import shutil
+import tempfile
 
 import numpy as np
 
 from monty.io import zopen
 from sknano.core import get_fpath
+from sknano.core.atoms import generate_topology
 # from sknano.core.crystallography import Crystal3DLattice
 from sknano.core.geometric_regions import generate_bounding_box, Cuboid
 from ._base import Atom, StructureIO, StructureIOError, StructureConverter, \
-    default_comment_line
+    default_comment_line, iter_chunks, write_columns
 
 __all__ = ['DATAReader', 'DATAWriter', 'DATAData', 'DATAFormatSpec',
            'DATAIOError', 'DATA2XYZConverter', 'LAMMPSDATAReader',
@@ -37,6 +41,9 @@ class Domain:
 class DATAReader(StructureIO):
     """`StructureIO` class for reading `LAMMPS data` file format.
 
+    Each section is read as one block and converted to typed columns
+    stored in :attr:`~DATAReader.section_data`.
+
     Parameters
     ----------
     fpath : str
@@ -44,6 +51,8 @@ class DATAReader(StructureIO):
     atom_style : {'full', 'atomic'}, optional
 
     """
+    _unparsed_atoms = False
+
     def __init__(self, fpath, atom_style='full', bond_style=None,
                  angle_style=None, dihedral_style=None, improper_style=None,
                  pair_style=None, **kwargs):
@@ -90,67 +99,42 @@ class DATAReader(StructureIO):
         """
         return self.section_data
 
+    @property
+    def atoms(self):
+        """Structure :class:`~sknano.core.atoms.StructureAtoms`.
+
+        The :class:`~sknano.core.atoms.StructureAtom` objects are created
+        from the typed section columns on first access.
+
+        """
+        if self._unparsed_atoms:
+            self._unparsed_atoms = False
+            self._parse_atoms()
+            self._parse_atom_types()
+        return self._atoms
+
     def read(self):
         """Read data file."""
+        self._unparsed_atoms = False
         self.structure_data.clear()
         try:
-            with zopen(self.fpath) as f:
+            with zopen(self.fpath, 'rt') as f:
                 self.comment_line = f.readline().strip()
-
-                while True:
-                    line = f.readline().strip()
-                    if len(line) == 0:
-                        continue
-                    found = False
-                    for header in list(header_specs.keys()):
-                        if header in line:
-                            found = True
-                            self.header_data[header] = \
-                                [header_specs[header]['dtype'](float(s))
-                                 for s in [[ss for ss in line.split()][i]
-                                           for i in range(header_specs[
-                                               header]['items'])]]
-                            if len(self.header_data[header]) == 1:
-                                # if the list contains only one element,
-                                # replace list with the first element
-                                self.header_data[header] = \
-                                    self.header_data[header][0]
-                    if not found:
-                        break
-
-                while True:
-                    found = False
-                    for section, header in list(section_header_map.items()):
-                        if section in line:
-                            found = True
-                            f.readline()
-                            n = 0
-                            data = []
-                            while n < self.header_data[header]:
-                                tmp = []
-                                line = f.readline().strip().split()
-                                for i, attrs in enumerate(
-                                    self.section_attrs_specs[
-                                        section].values()):
-                                    try:
-                                        tmp.append(
-                                            attrs['dtype'](float(line[i])))
-                                    except IndexError:
-                                        break
-                                data.append(tmp)
-                                n += 1
-                            self.section_data[section] = data[:]
-                    f.readline()
-                    line = f.readline().strip()
-                    if len(line) == 0:
-                        break
+                line = self._read_headers(f)
+                while line:
+                    section = line.split('#')[0].strip()
+                    if section not in section_header_map:
+                        raise DATAIOError(
+                            'Unknown section: {!r}'.format(section))
+                    Nrows = self.header_data[section_header_map[section]]
+                    lines = [self._next_line(f)] + \
+                        list(islice(f, Nrows - 1))
+                    self.section_data[section] = \
+                        self._parse_section(section, lines)
+                    line = self._next_line(f)
             self._parse_bounding_box()
             self._parse_domain()
-            self._parse_atoms()
-            self._parse_atom_types()
-            # self._parse_bonds()
-            # self._parse_dihedrals()
-            # self._parse_impropers()
+            self._unparsed_atoms = True
             # self._parse_ellipsoids()
             # self._parse_lines()
             # self._parse_triangles()
@@ -158,63 +142,241 @@ class DATAReader(StructureIO):
         except (IOError, OSError) as e:
             print(e)
 
+    @staticmethod
+    def _next_line(f):
+        """Return next non-blank, non-comment line or an empty string \
+            at EOF."""
+        for line in f:
+            if line.split('#')[0].strip():
+                return line.strip()
+        return ''
+
+    def _read_headers(self, f):
+        """Read header lines and return the first section keyword line."""
+        line = self._next_line(f)
+        while line:
+            values = line.split('#')[0].split()
+            for nitems in range(1, 4):
+                header = ' '.join(values[nitems:])
+                try:
+                    specs = header_specs[header]
+                except KeyError:
+                    continue
+                if specs['items'] == nitems:
+                    break
+            else:
+                return line
+
+            dtype = specs['dtype']
+            value = [dtype(float(s)) for s in values[:nitems]]
+            self.header_data[header] = value[0] if nitems == 1 else value
+            line = self._next_line(f)
+        return line
+
+    def _parse_section(self, section, lines):
+        """Convert section `lines` to typed columns.
+
+        Parameters
+        ----------
+        section : :class:`~python:str`
+        lines : :class:`~python:list`
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Structured array with one typed field per column in
+            :attr:`~DATAReader.section_attrs`, or a 2D
+            :class:`~python:float` array if the column names are unknown.
+
+        """
+        if any('#' in line for line in lines):
+            lines = [line.split('#')[0] for line in lines]
+        Nrows = len(lines)
+        Ncols = len(lines[0].split()) if Nrows > 0 else 0
+        values = ' '.join(lines).split()
+        if len(values) == Nrows * Ncols:
+            data = np.array(values, dtype=float).reshape(Nrows, Ncols)
+        else:
+            rows = [line.split() for line in lines]
+            Ncols = min(len(row) for row in rows)
+            data = np.array([row[:Ncols] for row in rows], dtype=float)
+
+        attrs = self.section_attrs.get(section, [])
+        if not attrs:
+            return data
+
+        attrs_specs = self.section_attrs_specs[section]
+        columns = np.empty(Nrows, dtype=[(attr, attrs_specs[attr]['dtype'])
+                                         for attr in attrs[:Ncols]])
+        for i, attr in enumerate(columns.dtype.names):
+            columns[attr] = data[:, i]
+        return columns
+
     def _parse_atoms(self):
         """Populate `Atoms` object with `Atom` objects"""
         try:
             atoms_section = self.section_data['Atoms']
-            atoms_section_attrs = self.section_attrs['Atoms']
         except KeyError:
-            atoms_section = []
-            atoms_section_attrs = {}
+            return
+
+        atom_attrs = set(dir(Atom()))
+        columns = OrderedDict((attr, atoms_section[attr]) for attr in
+                              atoms_section.dtype.names if attr in atom_attrs)
 
         try:
             masses_section = self.section_data['Masses']
-            masses_section_attrs = self.section_attrs['Masses']
-        except KeyError:
-            masses_section = []
-            masses_section_attrs = {}
+            types = atoms_section['type']
+        except (KeyError, ValueError):
+            pass
+        else:
+            masses = \
+                np.zeros(max(types.max(), masses_section['type'].max()) + 1)
+            masses[masses_section['type']] = masses_section['mass']
+            columns['mass'] = masses[types]
+
+        for section, section_data in self.section_data.items():
+            if section not in per_atom_sections or \
+                    section_data.dtype.names is None or \
+                    'id' not in section_data.dtype.names:
+                continue
+            aligned, found = self.align_section(section)
+            for attr in section_data.dtype.names:
+                if attr in atom_attrs and attr not in columns:
+                    columns[attr] = np.where(found, aligned[attr], 0)
+
+        attrs = list(columns.keys())
+        self.atoms.extend([Atom(**dict(zip(attrs, values))) for values in
+                           zip(*[column.tolist() for column in
+                                 columns.values()])])
+
+    def align_section(self, section):
+        """Align the rows of a per-atom `section` with the `Atoms` section.
 
+        The rows are joined on the atom id column by sorting the section ids
+        once and looking up each atom id with a binary search, so the join
+        is :math:`O(N\\log N)` for any section keyed by atom id
+        (e.g., *Velocities*).
+
+        Parameters
+        ----------
+        section : :class:`~python:str`
+            One of the per-atom sections *Velocities*, *Ellipsoids*,
+            *Lines*, *Triangles*, or *Bodies*. The `id` column of the
+            topology sections is not an atom id.
+
+        Returns
+        -------
+        aligned : :class:`~numpy:numpy.ndarray`
+            Rows of `section` in the order of the `Atoms` section.
+        found : :class:`~numpy:numpy.ndarray`
+            Boolean array which is `False` for the atoms without a row in
+            `section`. The corresponding rows of `aligned` are undefined.
+
+        Raises
+        ------
+        :class:`~python:ValueError`
+            If `section` is not a per-atom section.
+
+        """
+        if section not in per_atom_sections:
+            raise ValueError('Expected one of {}'.format(per_atom_sections))
+        atom_ids = self.section_data['Atoms']['id']
+        section_data = self.section_data[section]
+        section_ids = section_data['id']
+        if np.array_equal(atom_ids, section_ids):
+            return section_data, np.ones(len(atom_ids), dtype=bool)
+
+        order = np.argsort(section_ids, kind='mergesort')
+        indices = np.searchsorted(section_ids, atom_ids, sorter=order)
+        indices = order[np.minimum(indices, len(order) - 1)]
+        found = section_ids[indices] == atom_ids
+        return section_data[indices], found
+
+    def atom_indices(self, atom_ids):
+        """Return the `Atoms` section row indices of atoms with `atom_ids`.
+
+        Parameters
+        ----------
+        atom_ids : array_like
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        ids = self.section_data['Atoms']['id']
+        order = np.argsort(ids, kind='mergesort')
+        atom_ids = np.asarray(atom_ids)
+        indices = np.searchsorted(ids, atom_ids, sorter=order)
+        indices = order[np.minimum(indices, len(order) - 1)]
+        if not np.all(ids[indices] == atom_ids):
+            raise DATAIOError('Topology references an undefined atom id.')
+        return indices
+
+    def get_topology(self, section='Bonds'):
+        """Return the integer arrays of a topology section.
+
+        Parameters
+        ----------
+        section : {'Bonds', 'Angles', 'Dihedrals', 'Impropers'}, optional
+
+        Returns
+        -------
+        types : :class:`~numpy:numpy.ndarray`
+            :math:`(M,)` array of bond/angle/dihedral/improper types.
+        atom_ids : :class:`~numpy:numpy.ndarray`
+            :math:`(M, k)` array of the atom ids in each entry.
+
+        """
+        if section not in topology_sections:
+            raise ValueError('Expected one of {}'.format(
+                list(topology_sections)))
         try:
-            velocities_section = self.section_data['Velocities']
-            velocities_section_attrs = self.section_attrs['Velocities']
+            section_data = self.section_data[section]
         except KeyError:
-            velocities_section = []
-            velocities_section_attrs = {}
+            k = topology_sections[section]
+            return np.empty(0, dtype=int), np.empty((0, k), dtype=int)
+        names = section_data.dtype.names
+        return section_data[names[1]].copy(), \
+            np.column_stack([section_data[name] for name in names[2:]])
 
-        for line in atoms_section:
-            atom_kwargs = {}
+    def get_bonded_neighbors(self):
+        """Return the bonded neighbor list built from the `Bonds` section.
 
-            for kw in dir(Atom()):
-                if kw in atoms_section_attrs:
-                    try:
-                        atom_kwargs[kw] = \
-                            line[
-                                self.section_attrs_specs['Atoms'][kw]['index']]
-                    except IndexError:
-                        pass
-                elif kw in masses_section_attrs:
-                    type = \
-                        line[self.section_attrs_specs[
-                            'Atoms']['type']['index']]
-                    atom_kwargs[kw] = \
-                        masses_section[type - 1][
-                            self.section_attrs_specs['Masses'][kw]['index']]
-                elif kw in velocities_section_attrs and \
-                        len(velocities_section) == len(atoms_section):
-                    id = line[self.section_attrs_specs['Atoms']['id']['index']]
-                    for velocity in velocities_section:
-                        atom_id = \
-                            velocity[self.section_attrs_specs[
-                                'Velocities']['id']['index']]
-                        if atom_id == id:
-                            atom_kwargs[kw] = \
-                                velocity[self.section_attrs_specs[
-                                    'Velocities'][kw]['index']]
-                # else:
-                #     print('unknown atom keyword: {}'.format(kw))
-
-            atom = Atom(**atom_kwargs)
-            self.atoms.append(atom)
+        Returns
+        -------
+        indptr, indices : :class:`~numpy:numpy.ndarray`
+            Compressed sparse row neighbor list: the bonded neighbors of
+            the atom in row `i` of the `Atoms` section are the rows
+            ``indices[indptr[i]:indptr[i+1]]``.
+
+        """
+        Natoms = len(self.section_data['Atoms'])
+        _, atom_ids = self.get_topology('Bonds')
+        pairs = self.atom_indices(atom_ids.ravel()).reshape(-1, 2)
+        i = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        j = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        order = np.argsort(i, kind='mergesort')
+        indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(i, minlength=Natoms))))
+        return indptr, j[order]
+
+    def update_bonded_neighbors(self):
+        """Set :attr:`~sknano.core.atoms.StructureAtom.NN` of each atom \
+            from the `Bonds` section.
+
+        Atom :attr:`~sknano.core.atoms.StructureAtom.bonds` are then
+        generated on demand from the bonded neighbors, the same way as
+        for neighbors found with a distance cutoff.
+
+        """
+        atoms = self.atoms
+        indptr, indices = self.get_bonded_neighbors()
+        atoms_list = atoms.data
+        for i, atom in enumerate(atoms_list):
+            atom.NN = atoms.__class__(
+                [atoms_list[j] for j in indices[indptr[i]:indptr[i+1]]],
+                casttype=False, **atoms.kwargs)
 
     def _parse_atom_types(self):
         Ntypes = self.atoms.Ntypes
@@ -223,11 +385,12 @@ class DATAReader(StructureIO):
             for atomtype in range(1, self.header_data['atom types'] + 1):
                 if atomtype not in typemap:
                     try:
-                        mass = self.section_data['Masses'][atomtype - 1][
-                            self.section_attrs_specs['Masses']['mass']['index']
-                        ]
-                        self.atoms.add_type(Atom(type=atomtype, mass=mass))
-                    except KeyError:
+                        masses_section = self.section_data['Masses']
+                        mass = masses_section['mass'][
+                            masses_section['type'] == atomtype][0]
+                        self.atoms.add_type(Atom(type=atomtype,
+                                                 mass=float(mass)))
+                    except (KeyError, IndexError):
                         self.atoms.add_type(Atom(type=atomtype))
 
     def _parse_bounding_box(self):
@@ -284,14 +447,10 @@ class DATAReader(StructureIO):
                 print(e)
             else:
                 try:
-                    colname = section_attrs[colidx]
-                    coltype = \
-                        self.section_attrs_specs[section][colname]['dtype']
                     section_data = \
-                        np.asarray(
-                            section_data, dtype=coltype)[:, colidx].tolist()
+                        section_data[section_attrs[colidx]].tolist()
                 except TypeError:
-                    pass
+                    section_data = section_data.tolist()
         finally:
             return section_data
 
@@ -307,7 +466,8 @@ class DATAWriter:
               comment_line=None, assert_unique_ids=False,
               enforce_consecutive_ids=True, pad_box=False,
               xpad=10., ypad=10., zpad=10., pad_tol=0.01,
-              verbose=False, **kwargs):
+              topology=False, bond_cutoff=2.0, angles=True, dihedrals=False,
+              pbc=False, chunk_size=None, verbose=False, **kwargs):
         """Write structure data to file.
 
         Parameters
@@ -337,6 +497,24 @@ class DATAWriter:
         pad_box : bool, optional
         xpad, ypad, zpad : float, optional
         pad_tol : float, optional
+        topology : bool, optional
+            Generate the `Bonds`, `Angles`, and `Dihedrals` sections from
+            the atom pairs within `bond_cutoff` distance of each other.
+            Bond, angle, and dihedral types are assigned by the elements
+            of their atoms. Requires `atom_style` `'full'` or
+            `'molecular'`.
+        bond_cutoff : float, optional
+            Bond cutoff distance used if `topology` is `True`.
+        angles, dihedrals : bool, optional
+            Write `Angles` and `Dihedrals` sections if `topology` is `True`.
+        pbc : {bool, array_like}, optional
+            Periodic boundary conditions used to generate the `topology`.
+            Either a bool for all dimensions or a sequence of three bools
+            for the :math:`x, y, z` dimensions. The periodic box lengths
+            are the `bounding_box` lengths.
+        chunk_size : {None, int}, optional
+            Number of atom lines formatted and written at a time.
+            See :func:`~sknano.io.write_columns`.
         verbose : bool, optional
             verbose output
 
@@ -372,6 +550,12 @@ class DATAWriter:
                  len(set(atoms.ids)) != atoms.Natoms):
             atoms.assign_unique_ids()
 
+        if atom_style not in ('full', 'molecular'):
+            if topology:
+                raise ValueError("Bond topology requires `atom_style` "
+                                 "'full' or 'molecular'.")
+            atom_style = 'full'
+
         if bounding_box is None:
             if structure is not None and structure.lattice is not None:
                 bounding_box = \
@@ -400,6 +584,23 @@ class DATAWriter:
         if verbose:
             print('bounding_box: {}'.format(bounding_box))
 
+        if topology:
+            boxsize = None
+            if np.any(pbc):
+                boxsize = np.where(
+                    np.asarray(pbc, dtype=bool) * np.ones(3, dtype=bool),
+                    [getattr(bounding_box, dim + 'max') -
+                     getattr(bounding_box, dim + 'min')
+                     for dim in ('x', 'y', 'z')], 0.0)
+            topology = generate_topology(atoms.coords, atoms.elements,
+                                         rc=bond_cutoff, angles=angles,
+                                         dihedrals=dihedrals, boxsize=boxsize)
+            if verbose:
+                for section, (_, _, type_labels) in topology.items():
+                    print('{} types: {}'.format(section[:-1], type_labels))
+        else:
+            topology = OrderedDict()
+
         lohi_width = 0
         for dim in ('x', 'y', 'z'):
             lohi_width = \
@@ -412,8 +613,17 @@ class DATAWriter:
 
             f.write('{}atoms\n'.format(
                 '{:d}'.format(Natoms).ljust(Natoms_width)))
-            f.write('{}atom types\n\n'.format(
+            for section, (types, _, _) in topology.items():
+                f.write('{}{}\n'.format(
+                    '{:d}'.format(len(types)).ljust(Natoms_width),
+                    section.lower()))
+            f.write('{}atom types\n'.format(
                 '{:d}'.format(Ntypes).ljust(Ntypes_width)))
+            for section, (_, _, type_labels) in topology.items():
+                f.write('{}{} types\n'.format(
+                    '{:d}'.format(len(type_labels)).ljust(Ntypes_width),
+                    section.lower()[:-1]))
+            f.write('\n')
 
             for dim in ('x', 'y', 'z'):
                 f.write('{}{dim}lo {dim}hi\n'.format(
@@ -423,38 +633,211 @@ class DATAWriter:
                     dim=dim))
 
             f.write('\nMasses\n\n')
-            for atomtype, properties in list(typemap.items()):
-                f.write('{}{:.4f}\n'.format(
-                    '{:d}'.format(atomtype).ljust(Natoms_width),
-                    properties['mass']))
+            write_columns(f, [list(typemap.keys()),
+                              [properties['mass'] for properties in
+                               typemap.values()]],
+                          '%-{}d%.4f'.format(Natoms_width))
 
             f.write('\nAtoms\n\n')
-            for atom in atoms:
-                line = ''
-                line += "{:>{}}".format(atom.id, id_width)
-                line += "{:>{}}".format(atom.mol, 3)
-                line += "{:>{}}".format(atom.type, type_width)
-                line += "{:>{}}".format('{:.1f}'.format(atom.q), 4)
-                line += "{:>{}}".format('{:f}'.format(atom.x), 14)
-                line += "{:>{}}".format('{:f}'.format(atom.y), 14)
-                line += "{:>{}}".format('{:f}'.format(atom.z), 14)
-                line += "{:>{}}".format('{:d}'.format(atom.ix), 3)
-                line += "{:>{}}".format('{:d}'.format(atom.iy), 3)
-                line += "{:>{}}".format('{:d}'.format(atom.iz), 3)
-                line += '\n'
-
-                f.write(line)
+            if atom_style == 'full':
+                write_columns(f, [atoms.ids, atoms.mols, atoms.types,
+                                  atoms.charges, atoms.x, atoms.y, atoms.z,
+                                  atoms.ix, atoms.iy, atoms.iz],
+                              '%{}d%3d%{}d%4.1f%14f%14f%14f%3d%3d%3d'.format(
+                                  id_width, type_width),
+                              chunk_size=chunk_size)
+            else:
+                write_columns(f, [atoms.ids, atoms.mols, atoms.types,
+                                  atoms.x, atoms.y, atoms.z,
+                                  atoms.ix, atoms.iy, atoms.iz],
+                              '%{}d%3d%{}d%14f%14f%14f%3d%3d%3d'.format(
+                                  id_width, type_width),
+                              chunk_size=chunk_size)
 
             f.write('\nVelocities\n\n')
-            for atom in atoms:
-                line = ''
-                line += "{:>{}}".format(atom.id, id_width)
-                line += "{:>{}}".format('{:f}'.format(atom.vx), 14)
-                line += "{:>{}}".format('{:f}'.format(atom.vy), 14)
-                line += "{:>{}}".format('{:f}'.format(atom.vz), 14)
-                line += '\n'
+            write_columns(f, [atoms.ids, atoms.vx, atoms.vy, atoms.vz],
+                          '%{}d%14f%14f%14f'.format(id_width),
+                          chunk_size=chunk_size)
+
+            ids = atoms.ids
+            for section, (types, indices, type_labels) in topology.items():
+                f.write('\n{}\n\n'.format(section))
+                write_columns(f, [np.arange(1, len(types) + 1), types] +
+                              [ids[col] for col in indices.T],
+                              '%{}d%{}d'.format(
+                                  len(str(len(types))) + 1,
+                                  len(str(len(type_labels))) + 1) +
+                              '%{}d'.format(id_width) * indices.shape[1],
+                              chunk_size=chunk_size)
+
+    @classmethod
+    def write_chunks(cls, chunks, Natoms, fname=None, outpath=None,
+                     fpath=None, atom_style='full', masses=None,
+                     lattice=None, bounding_box=None, comment_line=None,
+                     chunk_size=None, verbose=False, topology=False,
+                     pad_box=False, **kwargs):
+        """Write structure data to file one chunk of atoms at a time.
+
+        Only one chunk of atoms is held in memory at a time. The `Atoms`
+        and `Velocities` sections are spooled to temporary files in the
+        output directory while the atom types and bounding box are
+        collected, and copied to the output file after the header.
+        Atom ids are assigned consecutively and atom types are assigned
+        by element. The `topology` and `pad_box` options of
+        :meth:`~DATAWriter.write` are not supported and raise a
+        :class:`~python:ValueError` if set.
+
+        Parameters
+        ----------
+        chunks : iterable of :class:`~python:dict`
+            Chunks of per-atom column arrays. See
+            :func:`~sknano.io.iter_chunks`.
+        Natoms : int
+            Total number of atoms in `chunks`.
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        atom_style : {'full', 'molecular', 'atomic'}, optional
+        masses : {None, :class:`~python:collections.OrderedDict`}, optional
+            Map of the elements in `chunks` to their masses, in atom type
+            order. If `None`, types are assigned to the elements in the
+            order they first appear in `chunks`.
+        lattice : {None, `Crystal3DLattice`}, optional
+            If not `None`, the bounding box is generated from the
+            :class:`~sknano.core.crystallography.Crystal3DLattice`,
+            centered on the atom centroid.
+        bounding_box : dict, optional
+            If `None`, determined from the `lattice` or the atom
+            coordinates.
+        comment_line : str, optional
+            A string written to the first line of `data` file.
+        chunk_size : {None, int}, optional
+            Number of atom lines formatted and written at a time.
+            See :func:`~sknano.io.write_columns`.
+        verbose : bool, optional
+            verbose output
 
-                f.write(line)
+        Raises
+        ------
+        :class:`~python:ValueError`
+            If `topology` or `pad_box` is set or if `atom_style` is not
+            supported.
+
+        """
+        if topology or pad_box:
+            raise ValueError('`topology` and `pad_box` are not supported '
+                             'when writing chunks.')
+        if atom_style not in _chunk_atoms_formats:
+            raise ValueError('Expected `atom_style` in {}.'.format(
+                list(_chunk_atoms_formats)))
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='data', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+        if comment_line is None:
+            comment_line = default_comment_line
+
+        typemap = OrderedDict()
+        if masses is not None:
+            for element, mass in masses.items():
+                typemap[element] = (len(typemap) + 1, mass)
+
+        Natoms_width = \
+            8 if len(str(Natoms)) <= 12 else len(str(Natoms)) + 4
+        id_width = len(str(Natoms)) + 1
+        type_width = len(str(Natoms if masses is None else len(masses))) + 1
+        atoms_fmt = \
+            _chunk_atoms_formats[atom_style].format(id_width, type_width)
+
+        rmin = np.full(3, np.inf)
+        rmax = np.full(3, -np.inf)
+        rsum = np.zeros(3)
+
+        outdir = os.path.dirname(os.path.abspath(fpath))
+        with tempfile.TemporaryFile('w+t', dir=outdir) as atoms_file, \
+                tempfile.TemporaryFile('w+t', dir=outdir) as velocities_file:
+            for ids, chunk in iter_chunks(chunks, Natoms):
+                elements = chunk['element']
+                _, first = np.unique(elements, return_index=True)
+                for i in np.sort(first).tolist():
+                    if elements[i] not in typemap:
+                        if masses is not None:
+                            raise DATAIOError(
+                                'No mass given for {}.'.format(elements[i]))
+                        typemap[elements[i]] = \
+                            (len(typemap) + 1, chunk['mass'][i].item())
+                types = np.empty(len(ids), dtype=int)
+                for element, (atomtype, _) in typemap.items():
+                    types[elements == element] = atomtype
+
+                r = np.where(np.abs(chunk['r']) < 1.0e-10, 0.0, chunk['r'])
+                v = np.where(np.abs(chunk['v']) < 1.0e-10, 0.0, chunk['v'])
+                if len(r) > 0:
+                    rmin = np.minimum(rmin, r.min(axis=0))
+                    rmax = np.maximum(rmax, r.max(axis=0))
+                    rsum += r.sum(axis=0)
+
+                columns = [ids, chunk['mol'], types, chunk['q']]
+                if atom_style == 'molecular':
+                    columns = columns[:-1]
+                elif atom_style == 'atomic':
+                    columns = [ids, types]
+                write_columns(atoms_file, columns + list(r.T) +
+                              list(chunk['image'].T), atoms_fmt,
+                              chunk_size=chunk_size)
+                write_columns(velocities_file, [ids] + list(v.T),
+                              '%{}d%14f%14f%14f'.format(id_width),
+                              chunk_size=chunk_size)
+
+            if bounding_box is None:
+                if lattice is not None:
+                    bounding_box = \
+                        generate_bounding_box(from_lattice=lattice,
+                                              center=rsum / max(Natoms, 1))
+                else:
+                    bounding_box = \
+                        generate_bounding_box(from_array=np.array([rmin,
+                                                                   rmax]))
+            if verbose:
+                print('bounding_box: {}'.format(bounding_box))
+
+            lohi_width = 0
+            for dim in ('x', 'y', 'z'):
+                lohi_width = \
+                    max(lohi_width, len('{:.6f} {:.6f}'.format(
+                        getattr(bounding_box, dim + 'min'),
+                        getattr(bounding_box, dim + 'max'))) + 4)
+
+            with zopen(fpath, 'wt') as f:
+                f.write('# {}\n\n'.format(comment_line.lstrip('#').strip()))
+                f.write('{}atoms\n'.format(
+                    '{:d}'.format(Natoms).ljust(Natoms_width)))
+                f.write('{}atom types\n\n'.format(
+                    '{:d}'.format(len(typemap)).ljust(Natoms_width)))
+
+                for dim in ('x', 'y', 'z'):
+                    f.write('{}{dim}lo {dim}hi\n'.format(
+                        '{:.6f} {:.6f}'.format(
+                            getattr(bounding_box, dim + 'min'),
+                            getattr(bounding_box, dim + 'max')).ljust(
+                                lohi_width), dim=dim))
+
+                f.write('\nMasses\n\n')
+                write_columns(f, [[atomtype for atomtype, _ in
+                                   typemap.values()],
+                                  [mass for _, mass in typemap.values()]],
+                              '%-{}d%.4f'.format(Natoms_width))
+
+                f.write('\nAtoms\n\n')
+                atoms_file.seek(0)
+                shutil.copyfileobj(atoms_file, f)
+
+                f.write('\nVelocities\n\n')
+                velocities_file.seek(0)
+                shutil.copyfileobj(velocities_file, f)
 
 LAMMPSDATAWriter = DATAWriter
 
@@ -534,10 +917,42 @@ class DATAData(DATAReader):
         attr_dtype = self.section_attrs_specs[section][attr_name]['dtype']
         new_data = np.asarray(new_data, dtype=attr_dtype)
 
-        for i, atom in enumerate(self.atoms):
-            self.section_data[section][i][colidx] = \
-                attr_dtype(float(new_data[i]))
-            setattr(atom, attr_name, attr_dtype(float(new_data[i])))
+        self.section_data[section][attr_name] = new_data
+        for atom, value in zip(self.atoms, new_data.tolist()):
+            setattr(atom, attr_name, value)
+
+    def set_topology(self, section, types, atom_ids):
+        """Set a topology section from integer arrays.
+
+        Parameters
+        ----------
+        section : {'Bonds', 'Angles', 'Dihedrals', 'Impropers'}
+        types : array_like
+            :math:`(M,)` array of bond/angle/dihedral/improper types.
+        atom_ids : array_like
+            :math:`(M, k)` array of the atom ids in each entry.
+
+        """
+        if section not in topology_sections:
+            raise ValueError('Expected one of {}'.format(
+                list(topology_sections)))
+        types = np.asarray(types, dtype=int)
+        atom_ids = np.asarray(atom_ids, dtype=int).reshape(
+            len(types), topology_sections[section])
+        names = self.section_attrs[section]
+        section_data = np.empty(len(types), dtype=[
+            (name, self.section_attrs_specs[section][name]['dtype'])
+            for name in names])
+        section_data[names[0]] = np.arange(1, len(types) + 1)
+        section_data[names[1]] = types
+        for i, name in enumerate(names[2:]):
+            section_data[name] = atom_ids[:, i]
+        self.section_data[section] = section_data
+
+        header = section_header_map[section]
+        self.header_data[header] = len(types)
+        self.header_data[header[:-1] + ' types'] = \
+            int(types.max()) if len(types) > 0 else 0
 
     def viz(self, isnap):
         pass
@@ -549,98 +964,98 @@ class DATAData(DATAReader):
         ----------
         datafile : {None, str}, optional
 
-        """
-        try:
-            kwargs.update(self.kwargs)
-
-            if (datafile is None or datafile == '') and \
-                    (self.fpath is None or self.fpath == ''):
-                error_msg = \
-                    '`datafile` must be a string at least 1 character long.'
-                if datafile is None:
-                    raise TypeError(error_msg)
-                else:
-                    raise ValueError(error_msg)
-            elif datafile is None or datafile == '':
-                datafile = self.fpath
+        Raises
+        ------
+        :class:`~python:TypeError`, :class:`~python:ValueError`
+            If neither `datafile` nor :attr:`fpath` is a non-empty
+            string.
 
-            # DATAWriter.write(fname=datafile, atoms=self.atoms,
-            #                  comment_line=self.comment_line, **kwargs)
+        """
+        kwargs.update(self.kwargs)
 
-            self.atoms.rezero()
-            self.atoms.assign_unique_types()
-            self.atoms.assign_unique_ids()
+        if (datafile is None or datafile == '') and \
+                (self.fpath is None or self.fpath == ''):
+            error_msg = \
+                '`datafile` must be a string at least 1 character long.'
+            if datafile is None:
+                raise TypeError(error_msg)
+            else:
+                raise ValueError(error_msg)
+        elif datafile is None or datafile == '':
+            datafile = self.fpath
 
-            self._update_attr_fmtstr_widths()
+        # DATAWriter.write(fname=datafile, atoms=self.atoms,
+        #                  comment_line=self.comment_line, **kwargs)
 
-            try:
-                with zopen(datafile, 'wt') as fp:
-                    self._write_header(fp)
-                    self._write_bounding_box(fp)
-                    [getattr(self, '_write_' + section.lower())(fp)
-                     for section in self.sections.keys()]
-            except OSError as e:
-                print(e)
-
-        except (TypeError, ValueError) as e:
-            print(e)
+        if 'Masses' not in self.section_data:
+            self.atoms.assign_unique_types()
+            if 'Atoms' in self.section_data:
+                self.section_data['Atoms']['type'] = self.atoms.types
+        self._assign_unique_ids()
+
+        with zopen(datafile, 'wt') as fp:
+            self._write_header(fp)
+            self._write_bounding_box(fp)
+            for section in self.sections.keys():
+                writer = getattr(self, '_write_' + '_'.join(
+                    section.lower().split()), None)
+                if writer is not None:
+                    writer(fp)
+                else:
+                    self._write_section(fp, section)
+
+    def _assign_unique_ids(self):
+        """Assign unique atom ids and update the topology and per-atom \
+            section atom ids."""
+        topology = [(section, self.get_topology(section)) for section in
+                    topology_sections if section in self.section_data]
+        if topology:
+            indices = [self.atom_indices(atom_ids) for _, (_, atom_ids) in
+                       topology]
+        per_atom = [(section,) + self.align_section(section)
+                    for section in per_atom_sections
+                    if section in self.section_data and
+                    'Atoms' in self.section_data]
+        self.atoms.assign_unique_ids()
+        if 'Atoms' in self.section_data:
+            self.section_data['Atoms']['id'] = self.atoms.ids
+        if topology:
+            for (section, (types, _)), atom_indices in zip(topology, indices):
+                self.set_topology(section, types, atom_indices + 1)
+        for section, aligned, found in per_atom:
+            aligned = aligned[found]
+            aligned['id'] = self.section_data['Atoms']['id'][found]
+            self.section_data[section] = aligned
+
+    def _section_columns(self, section, epsilon=1.0e-10):
+        """Return the `section` column arrays and row format string.
+
+        The columns are the parsed `section` arrays. Columns missing from
+        the parsed section (e.g., image flags) are written as zeros and
+        values with absolute value less than `epsilon` are written as zero.
 
-    def _update_attr_fmtstr_widths(self):
-        attr_fmtstr_width['id'] = len(str(self.atoms.Natoms)) + 1
-        attr_fmtstr_width['type'] = len(str(self.atoms.Ntypes)) + 1
-        attr_fmtstr_width['mol'] = len(str(np.max(self.atoms.mols))) + 1
-        attr_fmtstr_width['q'] = \
-            len('{:f}'.format(np.max(self.atoms.charges))) + 2
-        attr_fmtstr_width['mass'] = \
-            len('{:f}'.format(np.max(self.atoms.masses))) + 4
-        attr_fmtstr_width['x'] = len('{:f}'.format(np.max(self.atoms.x))) + 2
-        attr_fmtstr_width['y'] = len('{:f}'.format(np.max(self.atoms.y))) + 2
-        attr_fmtstr_width['z'] = len('{:f}'.format(np.max(self.atoms.z))) + 2
-        attr_fmtstr_width['ix'] = len(str(np.max(self.atoms.ix))) + 2
-        attr_fmtstr_width['iy'] = len(str(np.max(self.atoms.iy))) + 2
-        attr_fmtstr_width['iz'] = len(str(np.max(self.atoms.iz))) + 2
-        attr_fmtstr_width['vx'] = len('{:f}'.format(np.max(self.atoms.vx))) + 2
-        attr_fmtstr_width['vy'] = len('{:f}'.format(np.max(self.atoms.vy))) + 2
-        attr_fmtstr_width['vz'] = len('{:f}'.format(np.max(self.atoms.vz))) + 2
-
-        # attr_fmtstr_width['lx'] = \
-        #     len('{:f}'.format(np.max(self.atoms.lx))) + 2
-        # attr_fmtstr_width['ly'] = \
-        #     len('{:f}'.format(np.max(self.atoms.ly))) + 2
-        # attr_fmtstr_width['lz'] = \
-        #     len('{:f}'.format(np.max(self.atoms.lz))) + 2
-        # attr_fmtstr_width['wx'] = \
-        #     len('{:f}'.format(np.max(self.atoms.wx))) + 2
-        # attr_fmtstr_width['wy'] = \
-        #     len('{:f}'.format(np.max(self.atoms.wy))) + 2
-        # attr_fmtstr_width['wz'] = \
-        #     len('{:f}'.format(np.max(self.atoms.wz))) + 2
-
-        # attr_fmtstr_width['ervel'] = \
-        #     len('{:f}'.format(np.max(self.atoms.ervel))) + 2
-        # attr_fmtstr_width['shapex'] = \
-        #     len('{:f}'.format(np.max(self.atoms.shapex))) + 2
-        # attr_fmtstr_width['shapey'] = \
-        #     len('{:f}'.format(np.max(self.atoms.shapey))) + 2
-        # attr_fmtstr_width['shapez'] = \
-        #     len('{:f}'.format(np.max(self.atoms.shapez))) + 2
-
-        # attr_fmtstr_width['quatw'] = \
-        #     len('{:f}'.format(np.max(self.atoms.quatw))) + 2
-        # attr_fmtstr_width['quati'] = \
-        #     len('{:f}'.format(np.max(self.atoms.quati))) + 2
-        # attr_fmtstr_width['quatj'] = \
-        #     len('{:f}'.format(np.max(self.atoms.quatj))) + 2
-        # attr_fmtstr_width['quatk'] = \
-        #     len('{:f}'.format(np.max(self.atoms.quatk))) + 2
-
-        attr_fmtstr_width['atom1'] = attr_fmtstr_width['atom2'] = \
-            attr_fmtstr_width['atom3'] = attr_fmtstr_width['atom4'] = \
-            attr_fmtstr_width['id']
-
-        for attr_specs in self.section_attrs_specs.values():
-            for attr, specs in attr_specs.items():
-                specs['width'] = attr_fmtstr_width[attr]
+        """
+        section_data = self.section_data[section]
+        names = section_data.dtype.names or ()
+        columns = []
+        fmt = []
+        for attr, specs in self.section_attrs_specs[section].items():
+            if attr in names:
+                column = section_data[attr]
+            else:
+                column = np.zeros(len(section_data), dtype=specs['dtype'])
+            if specs['dtype'] is int:
+                column = column.astype(int)
+                colfmt = '%d'
+            else:
+                column = np.where(np.abs(column) < epsilon, 0.0, column)
+                colfmt = '%f'
+            width = max(len(colfmt % column.min()),
+                        len(colfmt % column.max())) + \
+                (1 if specs['dtype'] is int else 2) if len(column) > 0 else 1
+            columns.append(column)
+            fmt.append(colfmt.replace('%', '%{}'.format(width)))
+        return columns, ''.join(fmt)
 
     def _write_header(self, fp):
         fp.write('# {}\n\n'.format(default_comment_line))
@@ -676,46 +1091,54 @@ class DATAData(DATAReader):
                      xy=self.domain.xy, xz=self.domain.xz, yz=self.domain.yz))
 
     def _write_masses(self, fp):
-        type_width = self.section_attrs_specs['Masses']['type']['width']
+        masses = self.sections['Masses']
         fp.write('\nMasses\n\n')
-        for type, mass in self.sections['Masses']:
-            fp.write('{}{:.4f}\n'.format(
-                     '{:d}'.format(type).ljust(type_width), mass))
+        write_columns(fp, [masses['type'], masses['mass']],
+                      '%-{}d%.4f'.format(len(str(masses['type'].max())) + 1))
 
     def _write_atoms(self, fp):
         fp.write('\nAtoms # {}\n\n'.format(self.atom_style))
-        for atom in self.atoms:
-            line = ''
-            for attr, specs in self.section_attrs_specs['Atoms'].items():
-                line += "{:>{}}".format(specs['fmtstr'].format(
-                                        getattr(atom, attr)), specs['width'])
-            line += '\n'
-            fp.write(line)
+        write_columns(fp, *self._section_columns('Atoms'))
 
     def _write_velocities(self, fp):
         fp.write('\nVelocities\n\n')
-        for atom in self.atoms:
-            line = ''
-            for attr, specs in self.section_attrs_specs['Velocities'].items():
-                line += "{:>{}}".format(specs['fmtstr'].format(
-                                        getattr(atom, attr)), specs['width'])
-            line += '\n'
-            fp.write(line)
+        write_columns(fp, *self._section_columns('Velocities'))
 
     def _write_force_fields(self, fp):
         pass
 
+    def _write_section(self, fp, section):
+        """Write `section` data columns."""
+        section_data = self.section_data[section]
+        fp.write('\n{}\n\n'.format(section))
+        if section_data.dtype.names is None:
+            fmt = ['%d'] + ['%.10g'] * (section_data.shape[1] - 1)
+            write_columns(fp, [section_data[:, 0].astype(int)] +
+                          list(section_data[:, 1:].T), ' '.join(fmt))
+            return
+
+        fmt = []
+        for attr in section_data.dtype.names:
+            column = section_data[attr]
+            if np.issubdtype(column.dtype, np.integer):
+                width = len(str(column.max())) + 1 if len(column) > 0 else 1
+                fmt.append('%{}d'.format(width))
+            else:
+                fmt.append(' %.10g')
+        write_columns(fp, [section_data[attr] for attr in
+                           section_data.dtype.names], fmt)
+
     def _write_bonds(self, fp):
-        pass
+        self._write_section(fp, 'Bonds')
 
     def _write_angles(self, fp):
-        pass
+        self._write_section(fp, 'Angles')
 
     def _write_dihedrals(self, fp):
-        pass
+        self._write_section(fp, 'Dihedrals')
 
     def _write_impropers(self, fp):
-        pass
+        self._write_section(fp, 'Impropers')
 
     @classmethod
     def format_spec(cls, atom_style='full', **kwargs):
@@ -936,6 +1359,13 @@ attr_fmtstr = {key: '{:d}' if dtype == int else '{:f}'
 attr_fmtstr_width = {key: 5 if dtype == int else 16
                      for key, dtype in attr_dtypes.items()}
 
+topology_sections = OrderedDict([('Bonds', 2), ('Angles', 3),
+                                 ('Dihedrals', 4), ('Impropers', 4)])
+
+# Sections other than `Atoms` with one row per atom keyed by the atom id.
+per_atom_sections = ['Velocities', 'Ellipsoids', 'Lines', 'Triangles',
+                     'Bodies']
+
 atoms_section_attrs = OrderedDict()
 
 atoms_section_attrs['angle'] = ['id', 'mol', 'type', 'x', 'y', 'z']
@@ -980,6 +1410,13 @@ velocities_section_attrs['ellipsoid'].extend(['lx', 'ly', 'lz'])
 velocities_section_attrs['sphere'].extend(['wx', 'wy', 'wz'])
 # velocities_section_attrs['hybrid'].append('...')
 
+# `Atoms` section line formats of the atom styles supported by
+# `DATAWriter.write_chunks`, with the id and type widths left open.
+_chunk_atoms_formats = OrderedDict()
+_chunk_atoms_formats['full'] = '%{}d%3d%{}d%4.1f%14f%14f%14f%3d%3d%3d'
+_chunk_atoms_formats['molecular'] = '%{}d%3d%{}d%14f%14f%14f%3d%3d%3d'
+_chunk_atoms_formats['atomic'] = '%{}d%{}d%14f%14f%14f%3d%3d%3d'
+
 bonds_section_attrs = ['bond_id', 'bond_type', 'atom1', 'atom2']
 angles_section_attrs = ['angle_id', 'angle_type', 'atom1', 'atom2', 'atom3']
 dihedrals_section_attrs = ['dihedral_id', 'dihedral_type',
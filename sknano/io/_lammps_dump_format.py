@@ -27,8 +27,8 @@ from sknano.core.geometric_regions import Cuboid
 from ._base import StructureIO, StructureIOError, StructureFormatSpec, \
     default_comment_line
 
-__all__ = ['DUMPData', 'DUMPReader', 'DUMPWriter', 'DUMPIOError',
-           'DUMPFormatSpec']
+__all__ = ['DUMPData', 'DUMPReader', 'BinaryDUMPReader', 'DUMPWriter',
+           'DUMPIOError', 'DUMPFormatSpec']
 
 attr_dtypes = {'id': int, 'type': int, 'mol': int, 'q': float, 'mass': float,
                'x': float, 'y': float, 'z': float,
@@ -41,6 +41,9 @@ attr_dtypes = {'id': int, 'type': int, 'mol': int, 'q': float, 'mass': float,
                'quatw': float, 'quati': float, 'quatj': float, 'quatk': float,
                'atom1': int, 'atom2': int, 'atom3': int, 'atom4': int}
 
+#: LAMMPS boundary style flags of the binary dump header.
+boundary_styles = {0: 'p', 1: 'f', 2: 's', 3: 'm'}
+
 
 # class LAMMPSBOX(Crystal3DLattice):
 #     """LAMMPS 3D simulation box.
@@ -109,6 +112,8 @@ class DUMPReader(StructureIO):
     'id mol type x y z vx vy vz ke pe CN'
 
     """
+    file_mode = 'r'
+
     def __init__(self, *args, attrmap=None, **kwargs):
         super().__init__(**kwargs)
 
@@ -137,7 +142,7 @@ class DUMPReader(StructureIO):
     def read(self):
         """Read all snapshots from each dump file."""
         for dumpfile in self.dumpfiles:
-            with zopen(dumpfile) as f:
+            with zopen(dumpfile, self.file_mode) as f:
                 snapshot = self.read_snapshot(f)
                 while snapshot is not None:
                     self.trajectory.append(snapshot)
@@ -205,51 +210,7 @@ class DUMPReader(StructureIO):
                     setattr(snapshot, tilt_factor, 0.0)
 
             if not self.dumpattrs:
-                xflag = yflag = zflag = None
-                attrs = f.readline().strip().split()[2:]
-                for i, attr in enumerate(attrs):
-                    if attr in ('x', 'xu', 'xs', 'xsu'):
-                        self.dumpattrs['x'] = i
-                        if attr in ('x', 'xu'):
-                            xflag = False
-                        else:
-                            xflag = True
-                    elif attr in ('y', 'yu', 'ys', 'ysu'):
-                        self.dumpattrs['y'] = i
-                        if attr in ('y', 'yu'):
-                            yflag = False
-                        else:
-                            yflag = True
-                    elif attr in ('z', 'zu', 'zs', 'zsu'):
-                        self.dumpattrs['z'] = i
-                        if attr in ('z', 'zu'):
-                            zflag = False
-                        else:
-                            zflag = True
-                    else:
-                        self.dumpattrs[attr] = i
-
-                self.scale_original = None
-                if all([flag is False for flag in (xflag, yflag, zflag)]):
-                    self.scale_original = False
-                if all([flag for flag in (xflag, yflag, zflag)]):
-                    self.scale_original = True
-
-                self.atomattrs = \
-                    sorted(self.dumpattrs, key=self.dumpattrs.__getitem__)
-
-                self.attr_dtypes = [attr_dtypes[attr] if attr in attr_dtypes
-                                    else float for attr in self.atomattrs]
-
-                if self.attrmap is not None:
-                    self.remap_atomattr_names(self.attrmap)
-                    self.attrmap = None
-
-                self.unknown_attrs = \
-                    {attr: self.atomattrs.index(attr) for
-                     attr in set(self.atomattrs) - set(dir(Atom()))}
-
-                [self.atomattrs.remove(attr) for attr in self.unknown_attrs]
+                self._parse_dumpattrs(f.readline().strip().split()[2:])
             else:
                 f.readline()
 
@@ -270,6 +231,54 @@ class DUMPReader(StructureIO):
         except IndexError:
             return None
 
+    def _parse_dumpattrs(self, attrs):
+        """Set the dumped and parsed atom attributes from the dump \
+            column names `attrs`."""
+        xflag = yflag = zflag = None
+        for i, attr in enumerate(attrs):
+            if attr in ('x', 'xu', 'xs', 'xsu'):
+                self.dumpattrs['x'] = i
+                if attr in ('x', 'xu'):
+                    xflag = False
+                else:
+                    xflag = True
+            elif attr in ('y', 'yu', 'ys', 'ysu'):
+                self.dumpattrs['y'] = i
+                if attr in ('y', 'yu'):
+                    yflag = False
+                else:
+                    yflag = True
+            elif attr in ('z', 'zu', 'zs', 'zsu'):
+                self.dumpattrs['z'] = i
+                if attr in ('z', 'zu'):
+                    zflag = False
+                else:
+                    zflag = True
+            else:
+                self.dumpattrs[attr] = i
+
+        self.scale_original = None
+        if all([flag is False for flag in (xflag, yflag, zflag)]):
+            self.scale_original = False
+        if all([flag for flag in (xflag, yflag, zflag)]):
+            self.scale_original = True
+
+        self.atomattrs = \
+            sorted(self.dumpattrs, key=self.dumpattrs.__getitem__)
+
+        self.attr_dtypes = [attr_dtypes[attr] if attr in attr_dtypes
+                            else float for attr in self.atomattrs]
+
+        if self.attrmap is not None:
+            self.remap_atomattr_names(self.attrmap)
+            self.attrmap = None
+
+        self.unknown_attrs = \
+            {attr: self.atomattrs.index(attr) for
+             attr in set(self.atomattrs) - set(dir(Atom()))}
+
+        [self.atomattrs.remove(attr) for attr in self.unknown_attrs]
+
     def remap_atomattr_names(self, attrmap):
         """Rename attributes in the :attr:`DUMPReader.atomattrs` list.
 
@@ -376,6 +385,121 @@ class DUMPReader(StructureIO):
         return ' '.join(sorted(self.dumpattrs, key=self.dumpattrs.__getitem__))
 
 
+class BinaryDUMPReader(DUMPReader):
+    """Class for reading LAMMPS binary `dump custom` files.
+
+    The per-atom values of each snapshot are read directly into an array
+    with :func:`~numpy:numpy.frombuffer`. Files written by LAMMPS versions
+    that store the dump column names in the snapshot header are read
+    as is. For older files, the column names must be given with
+    `columns`.
+
+    Parameters
+    ----------
+    *args : :class:`~python:list`
+        :class:`~python:list` of one or more LAMMPS binary dump files.
+    attrmap : class:`~python:dict`
+        Python :class:`~python:dict` mapping custom dump attributes
+        to :class:`~sknano.core.atoms.Atom` attributes.
+    columns : {None, str, :class:`~python:list`}, optional
+        Dump column names, e.g. `'id type x y z'`.
+
+    """
+    file_mode = 'rb'
+
+    def __init__(self, *args, columns=None, **kwargs):
+        if isinstance(columns, str):
+            columns = columns.split()
+        self.columns = columns
+        super().__init__(*args, **kwargs)
+
+    def read_snapshot(self, f):
+        def read(dtype, count=1):
+            dtype = np.dtype(dtype)
+            buf = f.read(dtype.itemsize * count)
+            if len(buf) < dtype.itemsize * count:
+                raise EOFError
+            return np.frombuffer(buf, dtype=dtype, count=count)
+
+        def read_str():
+            return f.read(int(read('<i4')[0])).decode('ascii')
+
+        try:
+            timestep = int(read('<i8')[0])
+        except EOFError:
+            return None
+
+        try:
+            revision = 1
+            if timestep < 0:
+                f.read(-timestep)
+                endian, revision = read('<i4', 2).tolist()
+                if endian != 1:
+                    raise DUMPIOError('Big-endian binary dumps are not '
+                                      'supported.')
+                timestep = int(read('<i8')[0])
+
+            snapshot = Snapshot(self.trajectory)
+            snapshot.timestep = timestep
+            snapshot.Natoms = int(read('<i8')[0])
+            snapshot.atom_selection = np.zeros(snapshot.Natoms, dtype=bool)
+
+            snapshot.triclinic = bool(read('<i4')[0])
+            boundary = read('<i4', 6).reshape(3, 2)
+            snapshot.boxstr = ' '.join(
+                boundary_styles[lo] + boundary_styles[hi] for lo, hi in
+                boundary.tolist())
+            if snapshot.triclinic:
+                snapshot.boxstr = 'xy xz yz ' + snapshot.boxstr
+
+            bounds = read('<f8', 6).reshape(3, 2)
+            tilts = read('<f8', 3) if snapshot.triclinic else np.zeros(3)
+            snapshot.bounding_box = Cuboid()
+            for (dim, tilt_factor), (lo, hi), tilt in \
+                    zip(zip(('x', 'y', 'z'), ('xy', 'xz', 'yz')),
+                        bounds.tolist(), tilts.tolist()):
+                setattr(snapshot, dim + 'lo', lo)
+                setattr(snapshot, dim + 'hi', hi)
+                setattr(snapshot.bounding_box, dim + 'min', lo)
+                setattr(snapshot.bounding_box, dim + 'max', hi)
+                setattr(snapshot, tilt_factor, tilt)
+
+            size_one = int(read('<i4')[0])
+            columns = self.columns
+            if revision > 1:
+                read_str()
+                if read('<i1')[0]:
+                    read('<f8')
+                columns = read_str().split()
+
+            if not self.dumpattrs:
+                if columns is None:
+                    raise DUMPIOError('Binary dump has no column names. '
+                                      'Specify the dump `columns`.')
+                if len(columns) != size_one:
+                    raise DUMPIOError(
+                        'Expected {} dump columns, not {}'.format(
+                            size_one, len(columns)))
+                self._parse_dumpattrs(columns)
+                self.columns = columns
+
+            snapshot.atomattrs = self.atomattrs
+            snapshot.attr_dtypes = self.attr_dtypes
+
+            nchunk = int(read('<i4')[0])
+            chunks = [read('<f8', int(read('<i4')[0])) for _ in range(nchunk)]
+            atoms = np.concatenate(chunks) if chunks else np.zeros(0)
+            atoms = atoms.reshape(snapshot.Natoms, size_one)
+            if self.unknown_attrs:
+                atoms = np.delete(atoms, list(self.unknown_attrs.values()),
+                                  axis=1)
+            snapshot.atoms = np.array(atoms)
+            return snapshot
+
+        except EOFError:
+            raise DUMPIOError('Unexpected end of binary dump file.')
+
+
 class DUMPWriter:
     """Class for writing LAMMPS dump chemical file format."""
 
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+NetCDF trajectory format (:mod:`sknano.io._netcdf_format`)
+===============================================================================
+
+.. currentmodule:: sknano.io._netcdf_format
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+
+import numpy as np
+try:
+    from scipy.io import netcdf_file
+except ImportError:
+    from scipy.io.netcdf import netcdf_file
+
+from sknano.core import get_fpath
+from sknano.core.atoms import Snapshot
+from sknano.version import version
+
+from ._base import StructureIOError, StructureFormatSpec, TrajectoryIO, \
+    default_comment_line, _set_snapshot_box, _snapshot_box_offset
+from ._dcd_format import cell_matrix, unit_cell
+
+__all__ = ['NetCDFReader', 'NetCDFWriter', 'NetCDFFormatSpec',
+           'NetCDFIOError']
+
+#: Maps the AMBER convention per-atom vector variables to the
+#: corresponding :class:`~sknano.core.atoms.Snapshot` atom attributes
+#: and units.
+vector_variables = OrderedDict([
+    ('coordinates', (['x', 'y', 'z'], 'angstrom')),
+    ('velocities', (['vx', 'vy', 'vz'], 'angstrom/picosecond')),
+    ('forces', (['fx', 'fy', 'fz'], 'kilocalorie/mole/angstrom'))])
+
+
+class NetCDFReader(TrajectoryIO):
+    """Class for reading AMBER convention `NetCDF` trajectory files.
+
+    The file is memory mapped with :class:`~scipy:scipy.io.netcdf_file`,
+    so frames and atom subsets are read by slicing the variables without
+    loading the whole trajectory. Use :meth:`close` or a `with` block to
+    release the memory map.
+
+    Parameters
+    ----------
+    fpath : str
+        `NetCDF` file path.
+
+    """
+    def __init__(self, fpath, **kwargs):
+        super().__init__(fpath=fpath, **kwargs)
+        try:
+            self._netcdf = netcdf_file(fpath, 'r', mmap=True)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            raise NetCDFIOError('Unable to read NetCDF file {}: {}'.format(
+                fpath, e))
+
+        variables = self.variables
+        if getattr(self._netcdf, 'Conventions', b'') != b'AMBER' or \
+                'coordinates' not in variables:
+            self.close()
+            raise NetCDFIOError('{} is not an AMBER NetCDF trajectory'.format(
+                fpath))
+
+        self.Nframes, self.Natoms = variables['coordinates'].shape[:2]
+        self.times = np.array(variables['time'][:]) \
+            if 'time' in variables else np.zeros(self.Nframes)
+        self.timesteps = np.array(variables['step'][:]).astype(np.int64) \
+            if 'step' in variables else np.arange(self.Nframes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def variables(self):
+        """:class:`~python:dict` of the `NetCDF` variables."""
+        return self._netcdf.variables
+
+    def close(self):
+        """Close the `NetCDF` file."""
+        self._netcdf.close()
+
+    def get_values(self, variable, frames=slice(None), atoms=slice(None)):
+        """Read a slice of a per-atom variable.
+
+        Parameters
+        ----------
+        variable : str
+            Variable name, e.g. `'coordinates'`.
+        frames, atoms : {slice, int, array_like}, optional
+            Frame and atom index selections.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        variable = self.variables[variable]
+        values = np.array(variable[frames][..., atoms, :]
+                          if len(variable.dimensions) == 3 else
+                          variable[frames][..., atoms])
+        scale_factor = getattr(variable, 'scale_factor', None)
+        if scale_factor is not None:
+            values = values * scale_factor
+        return values
+
+    def get_positions(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom positions."""
+        return self.get_values('coordinates', frames=frames, atoms=atoms)
+
+    def get_velocities(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom velocities."""
+        return self.get_values('velocities', frames=frames, atoms=atoms)
+
+    def get_forces(self, frames=slice(None), atoms=slice(None)):
+        """Return :math:`(T, N, 3)` array of atom forces."""
+        return self.get_values('forces', frames=frames, atoms=atoms)
+
+    def read_frame(self, index, trajectory=None):
+        """Read frame `index` as a :class:`~sknano.core.atoms.Snapshot`.
+
+        Parameters
+        ----------
+        index : int
+        trajectory : {None, :class:`~sknano.core.atoms.Trajectory`}
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        if index < 0:
+            index += self.Nframes
+        variables = self.variables
+        atomattrs = []
+        attr_dtypes = []
+        columns = []
+        for name, variable in variables.items():
+            if variable.dimensions[:2] != ('frame', 'atom'):
+                continue
+            attrs = vector_variables[name][0] if name in vector_variables \
+                else [name]
+            value = self.get_values(name, frames=index)
+            atomattrs.extend(attrs)
+            attr_dtypes.extend(
+                [int if value.dtype.kind in 'iu' else float] * len(attrs))
+            columns.append(value.reshape(self.Natoms, len(attrs)))
+
+        snapshot = Snapshot(trajectory)
+        snapshot.timestep = int(self.timesteps[index])
+        snapshot.Natoms = self.Natoms
+        snapshot.atom_selection = np.zeros(self.Natoms, dtype=bool)
+        snapshot.boxstr = 'pp pp pp'
+        snapshot.atomattrs = atomattrs
+        snapshot.attr_dtypes = attr_dtypes
+        snapshot.atoms = np.column_stack(columns).astype(float)
+
+        if 'cell_lengths' in variables:
+            a, b, c = variables['cell_lengths'][index]
+            cos_alpha, cos_beta, cos_gamma = \
+                np.cos(np.radians(variables['cell_angles'][index]))
+            edges = cell_matrix([a, cos_gamma, b, cos_beta, cos_alpha, c])
+        else:
+            edges = np.zeros((3, 3))
+        offset = np.array(variables['cell_origin'][index]) \
+            if 'cell_origin' in variables else np.zeros(3)
+        _set_snapshot_box(snapshot, edges, offset)
+        return snapshot
+
+
+class NetCDFWriter:
+    """Class for writing trajectories in the AMBER `NetCDF` convention.
+
+    Positions, velocities and forces are stored in the AMBER
+    `coordinates`, `velocities` and `forces` variables and the box in the
+    `cell_lengths`, `cell_angles` and `cell_origin` variables. Any other
+    per-atom attributes and the snapshot timesteps are stored as
+    additional `(frame, atom)` and `step` variables, as written by
+    LAMMPS `dump netcdf`.
+
+    """
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, trajectory=None,
+              dt=1.0, comment_line=None, **kwargs):
+        """Write trajectory to file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output file.
+        trajectory : :class:`~sknano.core.atoms.Trajectory`
+            The selected snapshots of `trajectory` are written.
+            Atoms are sorted by id.
+        dt : float, optional
+            Time per timestep used for the `time` variable.
+        comment_line : str, optional
+            Title stored in the file.
+
+        """
+        if trajectory is None:
+            raise ValueError('Expected a `trajectory`.')
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='nc', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        if comment_line is None:
+            comment_line = default_comment_line
+
+        snapshots = trajectory.selected_snapshots
+        if len(snapshots) == 0:
+            raise NetCDFIOError('No trajectory snapshots selected.')
+        atomattrs = list(snapshots[0].atomattrs)
+        attr_dtypes = dict(zip(atomattrs, snapshots[0].attr_dtypes))
+        Natoms = len(snapshots[0].get_atoms(asarray=True))
+
+        f = netcdf_file(fpath, 'w', version=2)
+        try:
+            f.Conventions = 'AMBER'
+            f.ConventionVersion = '1.0'
+            f.program = 'scikit-nano'
+            f.programVersion = version
+            f.title = comment_line
+
+            f.createDimension('frame', None)
+            f.createDimension('spatial', 3)
+            f.createDimension('atom', Natoms)
+            f.createDimension('cell_spatial', 3)
+            f.createDimension('cell_angular', 3)
+            f.createDimension('label', 5)
+
+            f.createVariable('spatial', 'c', ('spatial',))[:] = \
+                np.array(list('xyz'), dtype='S1')
+            f.createVariable('cell_spatial', 'c', ('cell_spatial',))[:] = \
+                np.array(list('abc'), dtype='S1')
+            f.createVariable('cell_angular', 'c',
+                             ('cell_angular', 'label'))[:] = \
+                np.array([list(label.ljust(5)) for label in
+                          ('alpha', 'beta', 'gamma')], dtype='S1')
+
+            variables = OrderedDict()
+            time = f.createVariable('time', 'f', ('frame',))
+            time.units = 'picosecond'
+            # NetCDF classic files have no 64-bit integer type, so the
+            # timesteps are stored as doubles, which are exact up to 2**53.
+            step = f.createVariable('step', 'd', ('frame',))
+            for name, units in (('cell_origin', 'angstrom'),
+                                ('cell_lengths', 'angstrom'),
+                                ('cell_angles', 'degree')):
+                variables[name] = f.createVariable(
+                    name, 'd', ('frame', 'cell_angular' if name ==
+                                'cell_angles' else 'cell_spatial'))
+                variables[name].units = units
+
+            used = set()
+            for name, (attrs, units) in vector_variables.items():
+                if all(attr in atomattrs for attr in attrs):
+                    variables[name] = f.createVariable(
+                        name, 'f', ('frame', 'atom', 'spatial'))
+                    variables[name].units = units
+                    used.update(attrs)
+            if 'x' not in used:
+                raise NetCDFIOError('Trajectory snapshots have no positions.')
+            for attr in atomattrs:
+                if attr not in used:
+                    variables[attr] = f.createVariable(
+                        attr, 'i' if attr_dtypes[attr] is int else 'd',
+                        ('frame', 'atom'))
+
+            for index, snapshot in enumerate(snapshots):
+                if len(snapshot.get_atoms(asarray=True)) != Natoms:
+                    raise NetCDFIOError('NetCDF trajectories require a '
+                                        'constant number of atoms.')
+                step[index] = snapshot.timestep
+                time[index] = snapshot.timestep * dt
+                a, cos_gamma, b, cos_beta, cos_alpha, c = \
+                    unit_cell(snapshot.cell_matrix)
+                variables['cell_origin'][index] = \
+                    _snapshot_box_offset(snapshot)
+                variables['cell_lengths'][index] = [a, b, c]
+                variables['cell_angles'][index] = np.degrees(
+                    np.arccos([cos_alpha, cos_beta, cos_gamma]))
+
+                columns = snapshot.get_attrs(*atomattrs)
+                for name, variable in variables.items():
+                    if name in vector_variables:
+                        attrs = vector_variables[name][0]
+                    elif name in atomattrs:
+                        attrs = [name]
+                    else:
+                        continue
+                    value = columns[:, [atomattrs.index(attr)
+                                        for attr in attrs]]
+                    variable[index] = value if len(attrs) > 1 \
+                        else value[:, 0]
+        finally:
+            f.close()
+
+
+class NetCDFIOError(StructureIOError):
+    pass
+
+
+class NetCDFFormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `NetCDF` \
+        format."""
+    pass
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+====================================================
+NumPy npz format (:mod:`sknano.io._npz_format`)
+====================================================
+
+.. currentmodule:: sknano.io._npz_format
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from collections import OrderedDict
+
+import numpy as np
+
+from sknano.core import get_fpath
+from sknano.core.crystallography import Crystal3DLattice
+from sknano.version import version
+
+from ._base import Atom, Atoms, StructureIO, StructureIOError, \
+    StructureFormatSpec, default_comment_line
+
+__all__ = ['NPZReader', 'NPZWriter', 'NPZData', 'NPZFormatSpec',
+           'NPZIOError', 'structure_arrays', 'structure_atoms']
+
+#: Version of the array layout written by :class:`NPZWriter`.
+format_version = 1
+
+#: Maps stored per-atom column arrays to the `Atoms` attributes they are
+#: read from and the `Atom` attributes they are loaded into.
+atom_columns = OrderedDict([('element', ('elements', ['element'])),
+                            ('id', ('ids', ['id'])),
+                            ('mol', ('mols', ['mol'])),
+                            ('type', ('types', ['type'])),
+                            ('q', ('charges', ['q'])),
+                            ('mass', ('masses', ['mass'])),
+                            ('r', ('coords', ['x', 'y', 'z'])),
+                            ('v', ('velocities', ['vx', 'vy', 'vz'])),
+                            ('image', ('images', ['ix', 'iy', 'iz']))])
+
+
+def structure_arrays(atoms, lattice=None, comment_line=None):
+    """Return the :class:`~python:collections.OrderedDict` of arrays \
+        stored for `atoms`.
+
+    Parameters
+    ----------
+    atoms : :class:`~sknano.core.atoms.Atoms`
+    lattice : {None, :class:`~sknano.core.crystallography.Crystal3DLattice`}
+    comment_line : {None, str}
+
+    """
+    if comment_line is None:
+        comment_line = default_comment_line
+    arrays = OrderedDict()
+    arrays['format_version'] = np.array(format_version)
+    arrays['version'] = np.array(version)
+    arrays['comment_line'] = np.array(comment_line)
+    for key, (attr, _) in atom_columns.items():
+        try:
+            arrays[key] = np.asarray(getattr(atoms, attr))
+        except AttributeError:
+            continue
+    if 'element' in arrays:
+        arrays['element'] = arrays['element'].astype(str)
+    if 'image' in arrays:
+        arrays['image'] = arrays['image'].astype(int)
+
+    if lattice is not None:
+        parameters = lattice.todict()
+        arrays['lattice_parameters'] = \
+            np.array([parameters[p] for p in
+                      ('a', 'b', 'c', 'alpha', 'beta', 'gamma')])
+        arrays['orientation_matrix'] = \
+            np.asarray(lattice.orientation_matrix, dtype=float)
+        arrays['offset'] = np.asarray(lattice.offset, dtype=float)
+    return arrays
+
+
+def structure_atoms(arrays):
+    """Return the :class:`~sknano.core.atoms.StructureAtoms` stored in \
+        `arrays`.
+
+    Inverse of :func:`structure_arrays`.
+
+    Parameters
+    ----------
+    arrays : :class:`~python:dict`
+        Column arrays as returned by :func:`structure_arrays`.
+
+    """
+    attrs = []
+    columns = []
+    for key, (_, names) in atom_columns.items():
+        if key == 'mass' or key not in arrays:
+            continue
+        values = arrays[key].reshape(len(arrays[key]), -1)
+        attrs.extend(names)
+        columns.extend(values.T.tolist())
+    atoms = Atoms([Atom(**dict(zip(attrs, values)))
+                   for values in zip(*columns)], casttype=False)
+
+    if 'mass' in arrays:
+        masses = arrays['mass']
+        for i in np.flatnonzero(atoms.masses != masses).tolist():
+            atoms[i].mass = masses[i].item()
+    return atoms
+
+
+def _load_arrays(fpath):
+    """Return the arrays stored in the `npz` file `fpath`.
+
+    Object arrays are not unpickled, except on numpy < 1.10, whose
+    :func:`~numpy:numpy.load` has no `allow_pickle` argument.
+
+    """
+    try:
+        npz = np.load(fpath, allow_pickle=False)
+    except TypeError:
+        npz = np.load(fpath)
+    try:
+        return OrderedDict((key, npz[key]) for key in npz.files)
+    finally:
+        npz.close()
+
+
+class NPZReader(StructureIO):
+    """`StructureIO` class for reading NumPy `npz` structure files.
+
+    Parameters
+    ----------
+    fpath : str
+        `npz` structure file path.
+
+    """
+    _unparsed_atoms = False
+
+    def __init__(self, fpath, **kwargs):
+        super().__init__(fpath=fpath, **kwargs)
+        self.arrays = OrderedDict()
+
+        if self.fpath is not None:
+            self.read()
+
+    @property
+    def atoms(self):
+        """Structure :class:`~sknano.core.atoms.StructureAtoms`.
+
+        The :class:`~sknano.core.atoms.StructureAtom` objects are created
+        from the stored column arrays on first access.
+
+        """
+        if self._unparsed_atoms:
+            self._unparsed_atoms = False
+            self._parse_atoms()
+        return self._atoms
+
+    def read(self):
+        """Read `npz` file."""
+        self._unparsed_atoms = False
+        self.structure_data.clear()
+        try:
+            self.arrays = _load_arrays(self.fpath)
+        except (IOError, OSError, ValueError) as e:
+            raise NPZIOError(str(e))
+        self._parse_arrays()
+
+    def _parse_arrays(self):
+        arrays = self.arrays
+        if 'element' not in arrays or 'r' not in arrays:
+            raise NPZIOError('{} is not a structure file'.format(self.fpath))
+        self.comment_line = str(arrays.get('comment_line', ''))
+        if 'lattice_parameters' in arrays:
+            self.crystal_cell.lattice = Crystal3DLattice(
+                orientation_matrix=arrays['orientation_matrix'],
+                offset=arrays['offset'],
+                **dict(zip(('a', 'b', 'c', 'alpha', 'beta', 'gamma'),
+                           arrays['lattice_parameters'].tolist())))
+        self._unparsed_atoms = True
+
+    def _parse_atoms(self):
+        self._atoms.extend(structure_atoms(self.arrays))
+        if self.lattice is not None:
+            self._atoms.lattice = self.lattice
+
+
+class NPZWriter:
+    """`StructureWriter` class for writing NumPy `npz` structure files.
+
+    Per-atom attributes are stored as column arrays, so no text
+    formatting or parsing is involved in a save/load round trip.
+
+    """
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, structure=None,
+              atoms=None, comment_line=None, compressed=False, **kwargs):
+        """Write structure data to file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        atoms : :class:`~sknano.core.atoms.Atoms`
+            An :class:`~sknano.core.atoms.Atoms` instance.
+        comment_line : str, optional
+            A string stored with the structure data.
+        compressed : bool, optional
+            Write a compressed `npz` file.
+
+        """
+        if structure is None and atoms is None:
+            raise ValueError('Expected either `structure` or `atoms` object.')
+
+        if structure is not None and atoms is None:
+            atoms = structure.atoms
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='npz', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+
+        lattice = getattr(structure, 'lattice', None)
+        arrays = structure_arrays(atoms, lattice=lattice,
+                                  comment_line=comment_line)
+        savez = np.savez_compressed if compressed else np.savez
+        with open(fpath, 'wb') as f:
+            savez(f, **arrays)
+
+
+class NPZData(NPZReader):
+    """Class for reading and writing `StructureData` in `npz` format.
+
+    Parameters
+    ----------
+    fpath : str, optional
+
+    """
+    def __init__(self, fpath=None, **kwargs):
+        super().__init__(fpath, **kwargs)
+
+    def write(self, npzfile=None, **kwargs):
+        """Write npz file.
+
+        Parameters
+        ----------
+        npzfile : {None, str}, optional
+
+        """
+        if npzfile is None or npzfile == '':
+            npzfile = self.fpath
+        if npzfile is None or npzfile == '':
+            raise ValueError(
+                '`npzfile` must be a string at least 1 character long.')
+
+        kwargs.update(self.kwargs)
+        NPZWriter.write(fpath=npzfile, structure=self,
+                        comment_line=self.comment_line, **kwargs)
+
+
+class NPZIOError(StructureIOError):
+    pass
+
+
+class NPZFormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `npz` format."""
+    pass
@@ -13,43 +13,361 @@ __docformat__ = 'restructuredtext en'
 
 from collections import OrderedDict
 
+import numpy as np
+
+from monty.io import zopen
 from sknano.core import get_fpath
+from sknano.core.atoms import Trajectory, Snapshot
+from sknano.core.crystallography import Crystal3DLattice
+from sknano.core.refdata import element_symbols
+
+from ._base import Atom, StructureIO, StructureIOError, StructureFormatSpec, \
+    default_comment_line, write_columns, _set_snapshot_box
+from ._dcd_format import cell_matrix
+
+__all__ = ['PDBReader', 'PDBWriter', 'PDBData', 'PDBFormatSpec',
+           'PDBIOError']
+
+#: Fixed width `(start, stop)` columns of the PDB `ATOM` and `HETATM`
+#: record fields.
+atom_record_columns = OrderedDict([
+    ('record', (0, 6)), ('serial', (6, 11)), ('name', (12, 16)),
+    ('altLoc', (16, 17)), ('resName', (17, 20)), ('chainID', (21, 22)),
+    ('resSeq', (22, 26)), ('iCode', (26, 27)), ('x', (30, 38)),
+    ('y', (38, 46)), ('z', (46, 54)), ('occupancy', (54, 60)),
+    ('tempFactor', (60, 66)), ('element', (76, 78)), ('charge', (78, 80))])
+
+#: Fixed width `(start, stop)` columns of the PDB `CRYST1` record fields.
+cryst1_record_columns = OrderedDict([
+    ('a', (6, 15)), ('b', (15, 24)), ('c', (24, 33)), ('alpha', (33, 40)),
+    ('beta', (40, 47)), ('gamma', (47, 54))])
+
+#: Default values of the PDB `ATOM` record fields that are not
+#: :class:`~sknano.core.atoms.Atom` attributes.
+default_atom_records = OrderedDict([
+    ('record', 'ATOM'), ('altLoc', ''), ('resName', 'UNK'), ('chainID', ''),
+    ('iCode', ''), ('occupancy', 1.0), ('tempFactor', 0.0)])
+
+atom_record_fmt = '%-6s%5d %4s%1s%3s %1s%4d%1s   %8.3f%8.3f%8.3f' + \
+    '%6.2f%6.2f          %2s%2s'
+
 
-from ._base import StructureIO, StructureIOError, StructureFormat, \
-    default_comment_line
+def _fixed_columns(chars, start, stop):
+    """Return column slice `start:stop` of the `(N, 80)` character array \
+        `chars` as an :math:`(N,)` array of stripped strings.
 
-__all__ = ['PDBData', 'PDBReader', 'PDBWriter', 'PDBFormat']
+    Only the unique values are stripped and decoded.
+
+    """
+    values, inverse = np.unique(np.ascontiguousarray(
+        chars[:, start:stop]).view('S{}'.format(stop - start)).ravel(),
+        return_inverse=True)
+    return np.char.strip(values.astype(str))[inverse]
+
+
+def _fixed_numbers(chars, *columns, dtype=float):
+    """Parse the `(start, stop)` `columns` of the `(N, 80)` character \
+        array `chars` as numbers.
+
+    The fields are copied into one space separated buffer that is parsed
+    with a single :func:`~numpy:numpy.fromstring` call. Blank fields
+    are read as zero.
+
+    Returns
+    -------
+    :class:`~numpy:numpy.ndarray`
+        :math:`(N,)` array for one column, otherwise an
+        :math:`(N, len(columns))` array.
+
+    """
+    fields = np.concatenate(
+        [np.column_stack((chars[:, start:stop],
+                          np.full(len(chars), 32, dtype=np.uint8)))
+         for start, stop in columns], axis=1)
+    fields[fields == 0] = 32
+    offset = 0
+    for start, stop in columns:
+        blank = np.all(fields[:, offset:offset + stop - start] == 32, axis=1)
+        fields[blank, offset] = ord('0')
+        offset += stop - start + 1
+    values = np.fromstring(fields.tobytes(), sep=' ')
+    if len(values) != len(chars) * len(columns):
+        raise ValueError('Invalid numeric PDB columns')
+    values = values.astype(dtype)
+    return values if len(columns) == 1 else \
+        values.reshape(len(chars), len(columns))
+
+
+def _element_symbol(element, name):
+    """Return the element symbol of a PDB `element` field and unstripped \
+        atom `name` field."""
+    symbol = element.strip().capitalize()
+    if symbol in element_symbols:
+        return symbol
+    name = name.ljust(4)
+    if name[0] == ' ' or name[0].isdigit():
+        return name[1].upper()
+    symbol = name[:2].capitalize()
+    return symbol if symbol in element_symbols else name[0].upper()
+
+
+def _charge(charge):
+    """Convert a PDB `charge` field, e.g. `'2-'`, to a number."""
+    if not charge:
+        return 0.0
+    sign = -1.0 if charge.endswith('-') else 1.0
+    return sign * float(charge.strip('+-') or 1)
 
 
 class PDBReader(StructureIO):
-    """Class for reading pdb chemical file format.
+    """`StructureIO` class for reading `pdb` chemical file format.
+
+    The `ATOM`, `HETATM`, `CRYST1` and `MODEL` records are parsed by
+    slicing the fixed width record columns of all lines at once. The
+    model selected by `model` is read into :attr:`~PDBReader.atoms` and
+    all models of multi-model files are available through
+    :meth:`~PDBReader.read_model` and :attr:`~PDBReader.trajectory`.
 
     Parameters
     ----------
     fpath : str
-        pdb structure file
+        `pdb` structure file path.
+    model : int, optional
+        Index of the model to read into :attr:`~PDBReader.atoms`.
 
     """
-    def __init__(self, fpath):
-        super(PDBReader, self).__init__(fpath=fpath)
+    _unparsed_atoms = False
+
+    def __init__(self, fpath, model=0, **kwargs):
+        super().__init__(fpath=fpath, **kwargs)
+        self.model = model
+        self.columns = OrderedDict()
+        self.model_bounds = []
+        self.model_serials = []
+        self._trajectory = None
 
-        if fpath is not None:
+        if self.fpath is not None:
             self.read()
 
+    @property
+    def atoms(self):
+        """Structure :class:`~sknano.core.atoms.StructureAtoms`.
+
+        The :class:`~sknano.core.atoms.StructureAtom` objects are created
+        from the record columns of the selected model on first access.
+
+        """
+        if self._unparsed_atoms:
+            self._unparsed_atoms = False
+            self._parse_atoms()
+        return self._atoms
+
+    @property
+    def Nmodels(self):
+        """Number of models in the `pdb` file."""
+        return len(self.model_bounds)
+
+    @property
+    def trajectory(self):
+        """:class:`~sknano.core.atoms.Trajectory` of all models.
+
+        Each :class:`~sknano.core.atoms.Snapshot` has the per-atom
+        attributes *id*, *type*, *mol*, *q*, *x*, *y*, *z*. The snapshot
+        timestep is the `MODEL` serial number and atom types are numbered
+        by order of appearance of each element.
+
+        """
+        if self._trajectory is None:
+            self._trajectory = self._read_trajectory()
+        return self._trajectory
+
     def read(self):
-        """Read PDB file."""
-        with open(self.fpath, 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                print(line)
+        """Read `pdb` file."""
+        self._unparsed_atoms = False
+        self.structure_data.clear()
+        self._trajectory = None
+        with zopen(self.fpath, 'rb') as f:
+            lines = np.array(f.read().splitlines(), dtype='S80')
+
+        chars = lines.view(np.uint8).reshape(len(lines), 80)
+        records = np.ascontiguousarray(chars[:, :6]).view('S6').ravel()
+        atom_lines = (records == b'ATOM  ') | (records == b'HETATM')
+        model_lines = records == b'MODEL '
+        if not np.any(atom_lines):
+            raise PDBIOError('No `ATOM` records in {}'.format(self.fpath))
+
+        models = np.cumsum(model_lines)[atom_lines]
+        serials = [1]
+        if np.any(model_lines):
+            models -= 1
+            serials = _fixed_numbers(chars[model_lines], (10, 14),
+                                     dtype=int).tolist()
+        starts = np.searchsorted(models, np.arange(len(serials) + 1))
+        self.model_bounds = []
+        self.model_serials = []
+        for serial, start, stop in zip(serials, starts[:-1].tolist(),
+                                       starts[1:].tolist()):
+            if stop > start:
+                self.model_bounds.append((start, stop))
+                self.model_serials.append(serial)
+
+        self._parse_columns(chars[atom_lines])
+
+        cryst1 = np.flatnonzero(records == b'CRYST1')
+        if len(cryst1) > 0:
+            self.crystal_cell.lattice = Crystal3DLattice(**dict(zip(
+                cryst1_record_columns, _fixed_numbers(
+                    chars[cryst1[:1]], *cryst1_record_columns.values())[0])))
+
+        remarks = np.flatnonzero((records == b'TITLE ') |
+                                 (records == b'REMARK'))
+        if len(remarks) > 0:
+            self.comment_line = \
+                lines[remarks[0]][6:].decode('ascii', 'replace').strip()
+
+        if self.model >= self.Nmodels:
+            raise PDBIOError('No model {} in {}'.format(self.model,
+                                                        self.fpath))
+        self._unparsed_atoms = True
+
+    def _parse_columns(self, chars):
+        columns = self.columns = OrderedDict()
+        numbers = ('x', 'y', 'z', 'occupancy', 'tempFactor')
+        values = _fixed_numbers(chars, *[atom_record_columns[field]
+                                         for field in numbers])
+        for field in atom_record_columns:
+            start, stop = atom_record_columns[field]
+            if field in numbers:
+                columns[field] = values[:, numbers.index(field)]
+            elif field == 'resSeq':
+                try:
+                    columns[field] = _fixed_numbers(chars, (start, stop),
+                                                    dtype=int)
+                except ValueError:
+                    columns[field] = self._number_residues(chars)
+            elif field == 'serial':
+                ids = np.empty(len(chars), dtype=int)
+                for first, last in self.model_bounds:
+                    try:
+                        ids[first:last] = _fixed_numbers(
+                            chars[first:last], (start, stop), dtype=int)
+                    except ValueError:
+                        ids[first:last] = np.arange(1, last - first + 1)
+                columns['id'] = ids
+            elif field == 'element':
+                pairs, inverse = np.unique(np.ascontiguousarray(
+                    chars[:, np.r_[76:78, 12:16]]).view('S6').ravel(),
+                    return_inverse=True)
+                columns[field] = np.asarray(
+                    [_element_symbol(pair[:2], pair[2:]) for pair in
+                     np.char.ljust(pairs.astype(str), 6).tolist()])[inverse]
+            elif field == 'charge':
+                charges, inverse = np.unique(
+                    _fixed_columns(chars, start, stop), return_inverse=True)
+                columns[field] = np.asarray(
+                    [_charge(charge) for charge in charges.tolist()],
+                    dtype=float)[inverse]
+            else:
+                columns[field] = _fixed_columns(chars, start, stop)
+
+    def _number_residues(self, chars):
+        """Number the residues of each model consecutively from 1.
+
+        Used when the `resSeq` field is not a decimal number, e.g. when
+        residue numbers over 9999 were written in hybrid-36 or spill into
+        the `iCode` column. A new residue starts wherever the
+        `resSeq` and `iCode` columns change.
+
+        """
+        fields = _fixed_columns(chars, 22, 27)
+        mols = np.ones(len(chars), dtype=int)
+        for first, last in self.model_bounds:
+            mols[first + 1:last] += np.cumsum(
+                fields[first + 1:last] != fields[first:last - 1])
+        return mols
+
+    def read_model(self, index):
+        """Return the record columns of model `index`.
+
+        Parameters
+        ----------
+        index : int
+
+        Returns
+        -------
+        :class:`~python:collections.OrderedDict`
+            :class:`~python:collections.OrderedDict` mapping the `ATOM`
+            record fields to :math:`(N,)` arrays.
+
+        """
+        start, stop = self.model_bounds[index]
+        return OrderedDict((field, values[start:stop]) for field, values in
+                           self.columns.items())
+
+    def _parse_atoms(self):
+        columns = self.read_model(self.model)
+        self._atoms.extend([
+            Atom(element=element, id=id_, mol=mol, q=q, x=x, y=y, z=z)
+            for element, id_, mol, q, x, y, z in
+            zip(*[columns[field].tolist() for field in
+                  ('element', 'id', 'resSeq', 'charge', 'x', 'y', 'z')])])
+        if len(set(columns['element'].tolist())) > 1:
+            self._atoms.assign_unique_types()
+        if self.lattice is not None:
+            self._atoms.lattice = self.lattice
+
+    def _read_trajectory(self):
+        trajectory = Trajectory()
+        typemap = {}
+        for element in self.columns['element'].tolist():
+            typemap.setdefault(element, len(typemap) + 1)
+        for index, serial in enumerate(self.model_serials):
+            columns = self.read_model(index)
+            coords = np.column_stack([columns[dim] for dim in 'xyz'])
+            Natoms = len(coords)
+            symbols, inverse = np.unique(columns['element'],
+                                         return_inverse=True)
+            types = np.asarray([typemap[symbol] for symbol in
+                                symbols.tolist()], dtype=int)[inverse]
+
+            snapshot = Snapshot(trajectory)
+            snapshot.timestep = serial
+            snapshot.Natoms = Natoms
+            snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+            snapshot.atomattrs = ['id', 'type', 'mol', 'q', 'x', 'y', 'z']
+            snapshot.attr_dtypes = [int, int, int, float, float, float,
+                                    float]
+            snapshot.atoms = np.column_stack(
+                (columns['id'], types, columns['resSeq'], columns['charge'],
+                 coords)).astype(float)
+            if self.lattice is not None:
+                lattice = self.lattice
+                snapshot.boxstr = 'pp pp pp'
+                edges = cell_matrix(
+                    [lattice.a, lattice.cos_gamma, lattice.b,
+                     lattice.cos_beta, lattice.cos_alpha, lattice.c])
+                offset = np.zeros(3)
+            else:
+                snapshot.boxstr = 'ff ff ff'
+                lo = coords.min(axis=0) if Natoms > 0 else np.zeros(3)
+                hi = coords.max(axis=0) if Natoms > 0 else np.zeros(3)
+                edges, offset = np.diag(hi - lo), lo
+            _set_snapshot_box(snapshot, edges, offset)
+            trajectory.append(snapshot)
+
+        if trajectory.Nsnaps > 0:
+            trajectory.time_selection.all()
+            trajectory.t0_snapshot = trajectory[0]
+        return trajectory
 
 
 class PDBWriter:
-    """Class for writing pdb chemical file format."""
+    """`StructureWriter` class for writing `pdb` chemical file format."""
 
     @classmethod
-    def write(cls, fname=None, outpath=None, fpath=None, atoms=None,
-              comment_line=None):
+    def write(cls, fname=None, outpath=None, fpath=None, structure=None,
+              atoms=None, comment_line=None, records=None, chunk_size=None,
+              **kwargs):
         """Write structure data to file.
 
         Parameters
@@ -60,85 +378,133 @@ class PDBWriter:
             Output file path.
         fpath : str, optional
             Full path (directory path + file name) to output data file.
-        atoms : :py:class:`~sknano.io.atoms.Atoms`
-            An :py:class:`~sknano.io.atoms.Atoms` instance.
+        atoms : :class:`~sknano.core.atoms.Atoms`
+            An :class:`~sknano.core.atoms.Atoms` instance.
         comment_line : str, optional
+            A string written to the `TITLE` record, truncated to 70
+            characters.
+        records : {None, dict}, optional
+            :class:`~python:dict` mapping `ATOM` record fields that are
+            not :class:`~sknano.core.atoms.Atom` attributes, e.g.
+            `'name'`, `'resName'`, `'chainID'`, or `'tempFactor'`, to
+            a value or an :math:`(N,)` array of values.
+            See :data:`default_atom_records`.
+        chunk_size : {None, int}, optional
+            Number of atom lines formatted and written at a time.
+            See :func:`~sknano.io.write_columns`.
+
+        Notes
+        -----
+        Atom ids and `mol` ids that overflow the 5 digit `serial` and 4
+        digit `resSeq` fields are written modulo 100000 and 10000.
+        :class:`PDBReader` falls back to numbering the atoms and
+        residues consecutively when these fields cannot be parsed.
 
         """
+        if structure is None and atoms is None:
+            raise ValueError('Expected either `structure` or `atoms` object.')
+
+        if structure is not None and atoms is None:
+            atoms = structure.atoms
+
         if fpath is None:
             fpath = get_fpath(fname=fname, ext='pdb', outpath=outpath,
                               overwrite=True, add_fnum=False)
         if comment_line is None:
             comment_line = default_comment_line
 
-        atoms.rezero_coords()
+        Natoms = atoms.Natoms
+        columns = default_atom_records.copy()
+        if records is not None:
+            columns.update(records)
+        columns = OrderedDict(
+            (field, np.repeat(value, Natoms) if np.ndim(value) == 0 else
+             np.asarray(value)) for field, value in columns.items())
+
+        symbols = np.asarray(atoms.symbols, dtype=str)
+        names = columns.get('name', symbols)
+        pairs, inverse = np.unique(
+            np.char.add(np.char.add(symbols, ':'), names),
+            return_inverse=True)
+        names = np.asarray(
+            [' ' + name.ljust(3) if len(element) == 1 and len(name) < 4
+             else name.ljust(4)[:4] for element, name in
+             (pair.split(':', 1) for pair in pairs.tolist())])[inverse]
+
+        charges, inverse = np.unique(np.rint(atoms.charges).astype(int),
+                                     return_inverse=True)
+        charges = np.asarray(
+            ['{:d}{}'.format(abs(q), '+' if q > 0 else '-') if q else ''
+             for q in charges.tolist()])[inverse]
 
-        with open(fpath, 'w') as f:
-            for atom in atoms:
-                f.write(PDBFormatter.format(atom))
+        try:
+            mols = np.asarray(atoms.mols, dtype=int)
+        except AttributeError:
+            mols = np.ones(Natoms, dtype=int)
+
+        lattice = getattr(structure, 'lattice', None)
+        coords = atoms.coords
+        with zopen(fpath, 'wt') as f:
+            f.write('TITLE     {}\n'.format(comment_line[:70]))
+            if lattice is not None:
+                f.write('CRYST1{:9.3f}{:9.3f}{:9.3f}{:7.2f}{:7.2f}{:7.2f} '
+                        'P 1           1\n'.format(
+                            lattice.a, lattice.b, lattice.c, lattice.alpha,
+                            lattice.beta, lattice.gamma))
+            write_columns(f, [columns['record'], atoms.ids % 100000, names,
+                              columns['altLoc'], columns['resName'],
+                              columns['chainID'], mols % 10000,
+                              columns['iCode'], coords[:, 0], coords[:, 1],
+                              coords[:, 2], columns['occupancy'],
+                              columns['tempFactor'], symbols, charges],
+                          atom_record_fmt, chunk_size=chunk_size)
+            f.write('END\n')
 
 
 class PDBData(PDBReader):
-    """Class for reading and writing structure data in PDB data format.
+    """Class for reading and writing `StructureData` in `pdb` format.
 
     Parameters
     ----------
     fpath : str, optional
 
     """
-    def __init__(self, fpath=None):
-        try:
-            super(PDBData, self).__init__(fpath=fpath)
-        except StructureIOError:
-            pass
-
-    def write(self, pdbfile=None):
-        pass
-
-
-class PDBFormat(StructureFormat):
-    """Class defining the structure file format for PDB data.
-
-    Parameters
-    ----------
-
-    """
-    def __init__(self):
-        super(PDBFormat, self).__init__()
-
-        self._records = OrderedDict()
-
-        self._records['HEADER'] = header = {}
-        header['format'] = ''
-
-        self._records['TITLE'] = title = {}
-        title['format'] = ''
-
-        self._records['ATOM'] = atom = {}
-        atom['format'] = \
-            '{:6}{:>5} {:>4}{:1}{:>3} {:1}{:>4}{:1}' + \
-            '{:3}'.format('') + \
-            '{:>8.3f}{:>8.3f}{:>8.3f}' + \
-            '{:>6.2f}{:>6.2f}' + \
-            '{:10}'.format('') + \
-            '{:2}{:2}'
-
-        self._records['CONECT'] = {}
+    def __init__(self, fpath=None, **kwargs):
+        super().__init__(fpath, **kwargs)
 
-        self._records['MASTER'] = {}
+    def write(self, pdbfile=None, **kwargs):
+        """Write pdb file.
 
-        self._records['END'] = None
+        The `ATOM` record fields read from the file, such as the atom
+        and residue names, are written with the atoms of the selected
+        model.
 
-        self._properties['RECORDS'] = self._records
-
-    @property
-    def records(self):
-        return self._records
-
-
-class PDBFormatter:
-    """Formatter class to convert a `PDBAtom` to a formatted string."""
+        Parameters
+        ----------
+        pdbfile : {None, str}, optional
 
-    @classmethod
-    def format(cls):
-        pass
+        """
+        if pdbfile is None or pdbfile == '':
+            pdbfile = self.fpath
+        if pdbfile is None or pdbfile == '':
+            raise ValueError(
+                '`pdbfile` must be a string at least 1 character long.')
+
+        kwargs.update(self.kwargs)
+        records = None
+        if self.columns and len(self.atoms) == \
+                np.diff(self.model_bounds[self.model])[0]:
+            columns = self.read_model(self.model)
+            records = OrderedDict((field, columns[field]) for field in
+                                  list(default_atom_records) + ['name'])
+        PDBWriter.write(fpath=pdbfile, structure=self, records=records,
+                        comment_line=self.comment_line, **kwargs)
+
+
+class PDBIOError(StructureIOError):
+    pass
+
+
+class PDBFormatSpec(StructureFormatSpec):
+    """`StructureFormatSpec` class defining properties for `pdb` format."""
+    pass
@@ -11,13 +11,19 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from itertools import islice
 import os
 
+import numpy as np
+
 from monty.io import zopen
 from sknano.core import get_fpath
+from sknano.core.atoms import Trajectory, Snapshot
+from sknano.core.geometric_regions import Cuboid
+from sknano.core.refdata import element_symbols
 
 from ._base import Atom, StructureIO, StructureIOError, StructureConverter, \
-    StructureFormatSpec, default_comment_line
+    StructureFormatSpec, default_comment_line, iter_chunks, write_columns
 
 __all__ = ['XYZReader', 'XYZWriter', 'XYZData', 'XYZFormatSpec', 'XYZIOError',
            'XYZ2DATAConverter']
@@ -26,40 +32,245 @@ __all__ = ['XYZReader', 'XYZWriter', 'XYZData', 'XYZFormatSpec', 'XYZIOError',
 class XYZReader(StructureIO):
     """`StructureIO` class for reading `xyz` chemical file format.
 
+    Multi-frame `xyz` files are supported. The frame selected by `frame`
+    is read into :attr:`~XYZReader.atoms` and all frames are available
+    through :meth:`~XYZReader.read_frame`, :meth:`~XYZReader.iter_frames`,
+    and :attr:`~XYZReader.trajectory`.
+
     Parameters
     ----------
     fpath : str
         `xyz` structure file path.
+    frame : int, optional
+        Index of the frame to read into :attr:`~XYZReader.atoms`.
 
     """
-    def __init__(self, fpath, **kwargs):
+    _unparsed_atoms = False
+
+    def __init__(self, fpath, frame=0, **kwargs):
         super().__init__(fpath=fpath, **kwargs)
+        self.frame = frame
+        self.elements = None
+        self.coords = None
+        self._frame_offsets = None
+        self._trajectory = None
+        self._typemap = {}
 
         if self.fpath is not None:
             self.read()
 
+    @property
+    def atoms(self):
+        """Structure :class:`~sknano.core.atoms.StructureAtoms`.
+
+        The :class:`~sknano.core.atoms.StructureAtom` objects are created
+        from the :attr:`~XYZReader.elements` and
+        :attr:`~XYZReader.coords` arrays on first access.
+
+        """
+        if self._unparsed_atoms:
+            self._unparsed_atoms = False
+            self._parse_atoms()
+        return self._atoms
+
+    @property
+    def frame_offsets(self):
+        """:class:`~python:list` of the file offsets of each frame."""
+        if self._frame_offsets is None:
+            self._frame_offsets = self._index_frames()
+        return self._frame_offsets
+
+    @property
+    def Nframes(self):
+        """Number of frames in the `xyz` file."""
+        return len(self.frame_offsets)
+
+    @property
+    def trajectory(self):
+        """:class:`~sknano.core.atoms.Trajectory` of all frames.
+
+        Each :class:`~sknano.core.atoms.Snapshot` has the per-atom
+        attributes *id*, *type*, *x*, *y*, *z*. The snapshot timestep is the
+        frame index and atom types are numbered by order of appearance
+        of each element.
+
+        """
+        if self._trajectory is None:
+            self._trajectory = self._read_trajectory()
+        return self._trajectory
+
     def read(self):
         """Read `xyz` file."""
+        self._unparsed_atoms = False
         self.structure_data.clear()
-        with zopen(self.fpath) as f:
-            Natoms = int(f.readline().strip())
-            self.comment_line = f.readline().strip()
-            lines = f.readlines()
-            for line in lines:
-                s = line.strip().split()
-                if len(s) != 0:
-                    atom = \
-                        Atom(element=s[0],
-                             x=float(s[1]), y=float(s[2]), z=float(s[3]))
-                    self.atoms.append(atom)
-            if self.atoms.Natoms != Natoms:
-                error_msg = '`xyz` data contained {} atoms '.format(
-                    self.atoms.Natoms) + 'but should contain ' + \
-                    '{}'.format(Natoms)
-                raise XYZIOError(error_msg)
-
-        if len(set(self.atoms.elements)) > 1:
-            self.assign_unique_types()
+        self._frame_offsets = None
+        self._trajectory = None
+        self._typemap = {}
+        with zopen(self.fpath, 'rb') as f:
+            if self.frame != 0:
+                f.seek(self.frame_offsets[self.frame])
+            frame = self._read_frame(f)
+        if frame is None:
+            raise XYZIOError('No `xyz` frame {} in {}'.format(
+                self.frame, self.fpath))
+        self.comment_line, self.elements, self.coords = frame
+        self._unparsed_atoms = True
+
+    def read_frame(self, index, trajectory=None):
+        """Read frame `index` as a :class:`~sknano.core.atoms.Snapshot`.
+
+        The snapshot has the per-atom attributes *id*, *type*, *x*, *y*,
+        *z*, and the frame :attr:`comment_line` and :attr:`elements`.
+        Its timestep is the frame index. Atom types are numbered by order
+        of first appearance of each element in the frames read.
+
+        Parameters
+        ----------
+        index : int
+        trajectory : {None, :class:`~sknano.core.atoms.Trajectory`}
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        with zopen(self.fpath, 'rb') as f:
+            f.seek(self.frame_offsets[index])
+            return self._frame_snapshot(index, self._read_frame(f),
+                                        trajectory)
+
+    def iter_frames(self, trajectory=None):
+        """Generate the :class:`~sknano.core.atoms.Snapshot` of each \
+            frame without holding more than one frame in memory.
+
+        See :meth:`~XYZReader.read_frame`.
+
+        """
+        with zopen(self.fpath, 'rb') as f:
+            index = 0
+            frame = self._read_frame(f)
+            while frame is not None:
+                yield self._frame_snapshot(index, frame, trajectory)
+                index += 1
+                frame = self._read_frame(f)
+
+    def _index_frames(self):
+        offsets = []
+        with zopen(self.fpath, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                offsets.append(offset)
+                Natoms = int(line.split()[0])
+                if len(list(islice(f, Natoms + 1))) != Natoms + 1:
+                    raise XYZIOError('`xyz` frame {} is truncated'.format(
+                        len(offsets) - 1))
+        return offsets
+
+    @staticmethod
+    def _read_frame(f):
+        """Read the next frame from the binary file object `f`.
+
+        The coordinate block is split and converted with single NumPy
+        calls and the element column is normalized once per unique
+        symbol.
+
+        """
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+        if not line:
+            return None
+
+        Natoms = int(line.split()[0])
+        comment_line = f.readline().decode().strip()
+        lines = [line for line in islice(f, Natoms) if line.strip()]
+        if len(lines) != Natoms:
+            error_msg = '`xyz` data contained {} atoms '.format(
+                len(lines)) + 'but should contain ' + '{}'.format(Natoms)
+            raise XYZIOError(error_msg)
+        if Natoms == 0:
+            return comment_line, np.empty(0, dtype=str), np.empty((0, 3))
+
+        tokens = b''.join(lines).split()
+        ncols = len(lines[0].split())
+        if len(tokens) == Natoms * ncols and ncols >= 4:
+            data = np.array(tokens).reshape(Natoms, ncols)[:, :4]
+        else:
+            data = np.array([line.split()[:4] for line in lines])
+            if data.shape != (Natoms, 4):
+                raise XYZIOError('Invalid `xyz` atom lines.')
+
+        symbols, inverse = np.unique(data[:, 0], return_inverse=True)
+        symbols = np.asarray([_element_symbol(symbol.decode())
+                              for symbol in symbols.tolist()])
+        return comment_line, symbols[inverse], data[:, 1:].astype(float)
+
+    def _parse_atoms(self):
+        self._atoms.extend([
+            Atom(element=element, x=x, y=y, z=z) for element, (x, y, z) in
+            zip(self.elements.tolist(), self.coords.tolist())])
+        if len(set(self.elements.tolist())) > 1:
+            self._atoms.assign_unique_types()
+
+    def _frame_snapshot(self, index, frame, trajectory=None):
+        comment_line, elements, coords = frame
+        typemap = self._typemap
+        for element in elements[np.sort(np.unique(
+                elements, return_index=True)[1])].tolist():
+            typemap.setdefault(element, len(typemap) + 1)
+
+        Natoms = len(coords)
+        snapshot = Snapshot(trajectory)
+        snapshot.timestep = index
+        snapshot.Natoms = Natoms
+        snapshot.comment_line = comment_line
+        snapshot.elements = elements
+        snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+        snapshot.triclinic = False
+        snapshot.bounding_box = Cuboid()
+        for i, dim in enumerate(('x', 'y', 'z')):
+            lo, hi = (coords[:, i].min(), coords[:, i].max()) \
+                if Natoms > 0 else (0.0, 0.0)
+            setattr(snapshot, dim + 'lo', lo)
+            setattr(snapshot, dim + 'hi', hi)
+            setattr(snapshot.bounding_box, dim + 'min', lo)
+            setattr(snapshot.bounding_box, dim + 'max', hi)
+        snapshot.xy = snapshot.xz = snapshot.yz = 0.0
+        snapshot.atomattrs = ['id', 'type', 'x', 'y', 'z']
+        snapshot.attr_dtypes = [int, int, float, float, float]
+        symbols, inverse = np.unique(elements, return_inverse=True)
+        types = np.asarray([typemap[symbol] for symbol in
+                            symbols.tolist()], dtype=int)[inverse]
+        snapshot.atoms = np.column_stack(
+            (np.arange(1, Natoms + 1), types, coords)).astype(float)
+        return snapshot
+
+    def _read_trajectory(self):
+        trajectory = Trajectory()
+        for snapshot in self.iter_frames(trajectory):
+            trajectory.append(snapshot)
+
+        if trajectory.Nsnaps > 0:
+            trajectory.time_selection.all()
+            trajectory.t0_snapshot = trajectory[0]
+        return trajectory
+
+
+def _element_symbol(symbol):
+    """Return the element symbol of an `xyz` element column entry."""
+    if symbol.isdigit():
+        Z = int(symbol)
+        return element_symbols[Z - 1] if 0 < Z <= len(element_symbols) \
+            else symbol
+    if symbol not in element_symbols and \
+            symbol.capitalize() in element_symbols:
+        return symbol.capitalize()
+    return symbol
 
 
 class XYZWriter:
@@ -67,7 +278,7 @@ class XYZWriter:
 
     @classmethod
     def write(cls, fname=None, outpath=None, fpath=None, structure=None,
-              atoms=None, comment_line=None, **kwargs):
+              atoms=None, comment_line=None, chunk_size=None, **kwargs):
         """Write structure data to file.
 
         Parameters
@@ -83,6 +294,9 @@ class XYZWriter:
         comment_line : str, optional
             A string written to the first line of `xyz` file. If `None`,
             then it is set to the full path of the output `xyz` file.
+        chunk_size : {None, int}, optional
+            Number of atom lines formatted and written at a time.
+            See :func:`~sknano.io.write_columns`.
 
         """
         if structure is None and atoms is None:
@@ -102,9 +316,54 @@ class XYZWriter:
         with zopen(fpath, 'wt') as f:
             f.write('{:d}\n'.format(atoms.Natoms))
             f.write('{}\n'.format(comment_line))
-            for atom in atoms:
-                f.write('{:>3s}{:15.8f}{:15.8f}{:15.8f}\n'.format(
-                    atom.symbol, atom.x, atom.y, atom.z))
+            coords = atoms.coords
+            write_columns(f, [atoms.symbols, coords[:, 0], coords[:, 1],
+                              coords[:, 2]], '%3s%15.8f%15.8f%15.8f',
+                          chunk_size=chunk_size)
+
+    @classmethod
+    def write_chunks(cls, chunks, Natoms, fname=None, outpath=None,
+                     fpath=None, comment_line=None, chunk_size=None,
+                     **kwargs):
+        """Write structure data to file one chunk of atoms at a time.
+
+        Only one chunk of atoms is held in memory at a time.
+
+        Parameters
+        ----------
+        chunks : iterable of :class:`~python:dict`
+            Chunks of per-atom column arrays. See
+            :func:`~sknano.io.iter_chunks`.
+        Natoms : int
+            Total number of atoms in `chunks`.
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        comment_line : str, optional
+            A string written to the first line of `xyz` file.
+        chunk_size : {None, int}, optional
+            Number of atom lines formatted and written at a time.
+            See :func:`~sknano.io.write_columns`.
+
+        """
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='xyz', outpath=outpath,
+                              overwrite=True, add_fnum=False)
+        if comment_line is None:
+            comment_line = default_comment_line
+
+        with zopen(fpath, 'wt') as f:
+            f.write('{:d}\n'.format(Natoms))
+            f.write('{}\n'.format(comment_line))
+            for _, chunk in iter_chunks(chunks, Natoms):
+                coords = np.where(np.abs(chunk['r']) < 1.0e-10, 0.0,
+                                  chunk['r'])
+                write_columns(f, [chunk['element'], coords[:, 0],
+                                  coords[:, 1], coords[:, 2]],
+                              '%3s%15.8f%15.8f%15.8f', chunk_size=chunk_size)
 
 
 class XYZData(XYZReader):
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_is, assert_is_none, assert_true
+from pkg_resources import resource_filename
+import os
+import shutil
+import tempfile
+
+from sknano.io import StructureReader, StructureWriter, XYZReader, \
+    XYZWriter, get_structure_reader, get_structure_writer, \
+    guess_structure_format, register_structure_format, structure_formats
+
+
+def test1():
+    assert_equal(guess_structure_format('structure.xyz'), 'xyz')
+    assert_equal(guess_structure_format('structure.data.gz'), 'data')
+    assert_equal(guess_structure_format('dump.lammpstrj'), 'dump')
+    assert_is_none(guess_structure_format('structure.unknown'))
+    assert_is(get_structure_reader('xyz'), XYZReader)
+    assert_is(get_structure_writer('xyz'), XYZWriter)
+
+
+def test2():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for fname, structure_format in \
+                (('data/nanotubes/1010_1cell.xyz', 'xyz'),
+                 ('data/nanotubes/1010_1cell.data', 'data'),
+                 ('data/lammps_data/data.peptide', 'data')):
+            fpath = os.path.join(tmpdir, 'structure')
+            shutil.copy(resource_filename('sknano', fname), fpath)
+            assert_equal(guess_structure_format(fpath), structure_format)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test3():
+    infile = resource_filename('sknano', 'data/nanotubes/1010_1cell.xyz')
+    reader = StructureReader.read(infile)
+    assert_true(isinstance(reader, XYZReader))
+    assert_equal(reader.atoms.Natoms, 40)
+
+
+def test4():
+    register_structure_format('test_xyz', reader='._xyz_format:XYZReader',
+                              writer='._xyz_format:XYZWriter',
+                              extensions='txyz')
+    tmpdir = tempfile.mkdtemp()
+    try:
+        infile = \
+            resource_filename('sknano', 'data/nanotubes/1010_1cell.xyz')
+        atoms = XYZReader(infile).atoms
+        fpath = os.path.join(tmpdir, 'structure.txyz')
+        StructureWriter.write(fname=fpath, fpath=fpath, atoms=atoms)
+        assert_equal(guess_structure_format(fpath), 'test_xyz')
+        assert_equal(StructureReader.read(fpath).atoms.Natoms, 40)
+    finally:
+        del structure_formats['test_xyz']
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    nose.runmodule()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_true
+from pkg_resources import resource_filename
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sknano.io import DCDReader, DCDWriter, DUMPReader, StructureReader
+from sknano.io._dcd_format import cell_matrix, unit_cell
+
+
+def setup_module():
+    global tmpdir, dump
+    tmpdir = tempfile.mkdtemp()
+    dump = DUMPReader(
+        resource_filename('sknano', 'data/lammpstrj/0500_29cells.dump'))
+
+
+def teardown_module():
+    shutil.rmtree(tmpdir)
+
+
+def test1():
+    fpath = os.path.join(tmpdir, 'dump.dcd')
+    DCDWriter.write(fpath=fpath, trajectory=dump.trajectory)
+    reader = StructureReader.read(fpath)
+    assert_true(isinstance(reader, DCDReader))
+    assert_equal(reader.Nframes, dump.trajectory.Nsnaps)
+    assert_equal(reader.Natoms, 565)
+    assert_equal(reader.timesteps.tolist(), dump.timesteps.tolist())
+    positions = dump.trajectory.get_positions(unwrap=False)
+    assert_true(np.allclose(reader.get_positions(), positions, atol=1e-4))
+    assert_true(np.allclose(reader.get_positions(frames=[3, 7], atoms=[0, 5]),
+                            positions[[3, 7]][:, [0, 5]], atol=1e-4))
+
+    snapshot = reader[-1]
+    assert_equal(snapshot.timestep, dump[-1].timestep)
+    assert_true(np.allclose(snapshot.cell_matrix, dump[-1].cell_matrix))
+
+
+def test2():
+    cell = np.array([[10.0, 0.0, 0.0], [2.0, 9.0, 0.0], [1.0, -1.5, 8.0]])
+    assert_true(np.allclose(cell_matrix(unit_cell(cell)), cell))
+    a, cos_gamma, b, cos_beta, cos_alpha, c = unit_cell(cell)
+    angles = np.degrees(np.arccos([cos_gamma, cos_beta, cos_alpha]))
+    assert_true(np.allclose(
+        cell_matrix([a, angles[0], b, angles[1], angles[2], c]), cell))
+
+
+if __name__ == '__main__':
+    nose.runmodule()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_true
+from pkg_resources import resource_filename
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sknano.io import DUMPReader, H5MDReader, H5MDWriter, StructureReader
+
+
+def setup_module():
+    global tmpdir, dump
+    try:
+        import h5py  # noqa
+    except ImportError:
+        raise nose.SkipTest('h5py is not installed')
+    tmpdir = tempfile.mkdtemp()
+    dump = DUMPReader(
+        resource_filename('sknano', 'data/lammpstrj/0500_29cells.dump'),
+        attrmap={'c_peratom_pe': 'pe', 'c_peratom_ke': 'ke'})
+
+
+def teardown_module():
+    shutil.rmtree(tmpdir)
+
+
+def test1():
+    fpath = os.path.join(tmpdir, 'dump.h5md')
+    H5MDWriter.write(fpath=fpath, trajectory=dump.trajectory,
+                     compression='gzip')
+    reader = StructureReader.read(fpath)
+    assert_true(isinstance(reader, H5MDReader))
+    assert_equal(reader.Nframes, dump.trajectory.Nsnaps)
+    assert_equal(reader.timesteps.tolist(), dump.timesteps.tolist())
+    assert_true(np.allclose(reader.get_positions(),
+                            dump.trajectory.get_positions(unwrap=False)))
+    assert_true(np.allclose(reader.get_velocities(),
+                            dump.trajectory.get_velocities()))
+
+    snapshot = reader.read_frame(-1)
+    dump_snapshot = dump[-1]
+    assert_equal(snapshot.timestep, dump_snapshot.timestep)
+    assert_true(np.allclose(snapshot.cell_matrix, dump_snapshot.cell_matrix))
+    assert_true(np.allclose(snapshot.get_attrs('fx', 'fy', 'fz', 'pe'),
+                            dump_snapshot.get_attrs('fx', 'fy', 'fz', 'pe')))
+
+
+def test2():
+    fpath = os.path.join(tmpdir, 'dump_lzf.h5md')
+    H5MDWriter.write(fpath=fpath, trajectory=dump.trajectory,
+                     compression='lzf', chunk_frames=4)
+    reader = H5MDReader(fpath)
+    frames = [1, 5, 10]
+    positions = reader.get_positions(frames=frames, atoms=slice(0, 10))
+    assert_equal(positions.shape, (3, 10, 3))
+    assert_true(np.allclose(
+        positions, dump.trajectory.get_positions(unwrap=False)[frames, :10]))
+
+    trajectory = reader.trajectory
+    assert_equal(trajectory.Nsnaps, dump.trajectory.Nsnaps)
+    assert_true(np.allclose(trajectory.msd(unwrap=False),
+                            dump.trajectory.msd(unwrap=False)))
+
+
+if __name__ == '__main__':
+    nose.runmodule()
@@ -4,9 +4,16 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
 import nose
-from nose.tools import assert_equal, assert_not_equal
+from nose.tools import assert_equal, assert_not_equal, \
+    assert_raises, assert_true
 from pkg_resources import resource_filename
-from sknano.io import DATAData, DATAReader, DATAFormatSpec, atom_styles
+import os
+import tempfile
+
+import numpy as np
+from sknano.generators import SWNTGenerator
+from sknano.io import DATAData, DATAReader, DATAWriter, DATAFormatSpec, \
+    atom_styles
 
 
 def test1():
@@ -37,5 +44,132 @@ def test3():
     assert_equal(atoms.Natoms, 40)
 
 
+def test4():
+    datafile = resource_filename('sknano', 'data/lammps_data/data.peptide')
+    reader = DATAReader(datafile, atom_style='full')
+    assert_equal(reader.headers['atoms'], 2004)
+    assert_equal(reader.headers['xlo xhi'], [36.840194, 64.211560])
+    atoms_section = reader.sections['Atoms']
+    assert_equal(len(atoms_section), 2004)
+    assert_equal(atoms_section.dtype.names,
+                 ('id', 'mol', 'type', 'q', 'x', 'y', 'z', 'ix', 'iy', 'iz'))
+    assert_true(np.issubdtype(atoms_section['id'].dtype, np.integer))
+    assert_true(np.issubdtype(atoms_section['x'].dtype, np.floating))
+    assert_equal(reader.get('Atoms', colname='type'),
+                 atoms_section['type'].tolist())
+    atoms = reader.atoms
+    assert_equal(atoms.Natoms, 2004)
+    assert_equal(atoms[0].type, atoms_section['type'][0])
+    assert_true(np.allclose(atoms.coords, np.column_stack(
+        [atoms_section[dim] for dim in ('x', 'y', 'z')])))
+
+
+def test5():
+    datafile = resource_filename('sknano',
+                                 'data/lammps_data/data.comb3-OHCCu')
+    reader = DATAReader(datafile, atom_style='charge')
+    assert_true(reader.domain.triclinic)
+    assert_equal(reader.atoms.Natoms, 682)
+    assert_equal(reader.atoms.Ntypes, 5)
+
+
+def test6():
+    datafile = resource_filename('sknano', 'data/nanotubes/1010_1cell.data')
+    reader = DATAReader(datafile)
+    lines = open(datafile).read().split('Velocities')
+    velocities = np.random.RandomState(0).permutation(
+        ['{:d} {:d}.0 0.5 -{:d}.0\n'.format(i, i, i) for i in range(1, 41)])
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.data',
+                                     delete=False) as f:
+        f.write(lines[0] + 'Velocities\n\n' + ''.join(velocities))
+    try:
+        reader = DATAReader(f.name)
+        aligned, found = reader.align_section('Velocities')
+        assert_true(np.all(found))
+        assert_true(np.all(aligned['id'] == reader.sections['Atoms']['id']))
+        for atom in reader.atoms:
+            assert_equal((atom.vx, atom.vy, atom.vz),
+                         (atom.id, 0.5, -atom.id))
+
+        data = DATAData(f.name)
+        data.write(datafile=f.name)
+        for atom in DATAReader(f.name).atoms:
+            assert_equal((atom.vx, atom.vy, atom.vz),
+                         (atom.id, 0.5, -atom.id))
+    finally:
+        os.remove(f.name)
+
+
+def test7():
+    datafile = resource_filename('sknano', 'data/lammps_data/data.peptide')
+    reader = DATAReader(datafile, atom_style='full')
+    bond_types, bonds = reader.get_topology('Bonds')
+    assert_equal(bonds.shape, (reader.headers['bonds'], 2))
+    assert_raises(ValueError, reader.align_section, 'Bonds')
+    assert_true(np.issubdtype(bonds.dtype, np.integer))
+    angle_types, angles = reader.get_topology('Angles')
+    assert_equal(angles.shape, (reader.headers['angles'], 3))
+
+    indptr, indices = reader.get_bonded_neighbors()
+    assert_equal(indptr[-1], 2 * len(bonds))
+    i = reader.atom_indices(bonds[0, 0])
+    assert_true(reader.atom_indices(bonds[0, 1]) in
+                indices[indptr[i]:indptr[i+1]])
+
+    reader.update_bonded_neighbors()
+    atom = reader.atoms[int(i)]
+    assert_equal(atom.NN.Natoms, indptr[i+1] - indptr[i])
+    assert_equal(atom.bonds.Nbonds, atom.NN.Natoms)
+
+    data = DATAData(datafile, atom_style='full')
+    with tempfile.NamedTemporaryFile(suffix='.data', delete=False) as f:
+        pass
+    try:
+        data.write(datafile=f.name)
+        new_data = DATAData(f.name, atom_style='full')
+        for section in ('Bonds', 'Angles', 'Dihedrals', 'Impropers'):
+            types, atom_ids = data.get_topology(section)
+            new_types, new_atom_ids = new_data.get_topology(section)
+            assert_true(np.all(types == new_types))
+            assert_true(np.all(atom_ids == new_atom_ids))
+        for section in ('Pair Coeffs', 'Bond Coeffs', 'Dihedral Coeffs'):
+            assert_true(np.allclose(new_data.section_data[section],
+                                    data.section_data[section]))
+    finally:
+        os.remove(f.name)
+
+    data.fpath = None
+    assert_raises(TypeError, data.write)
+
+
+def test8():
+    atoms = SWNTGenerator(n=5, m=5, nz=2).atoms
+    with tempfile.NamedTemporaryFile(suffix='.data', delete=False) as f:
+        pass
+    try:
+        DATAWriter.write(fpath=f.name, atoms=atoms, atom_style='molecular',
+                         topology=True, dihedrals=True)
+        reader = DATAReader(f.name, atom_style='molecular')
+        assert_equal(reader.headers['bond types'], 1)
+        assert_equal(reader.headers['angle types'], 1)
+        assert_equal(reader.headers['dihedral types'], 1)
+        types, bonds = reader.get_topology('Bonds')
+        assert_equal(len(bonds), reader.headers['bonds'])
+        indptr, _ = reader.get_bonded_neighbors()
+        CN = np.diff(indptr)
+        assert_true(np.all((CN == 2) | (CN == 3)))
+        _, angles = reader.get_topology('Angles')
+        assert_equal(len(angles), (CN * (CN - 1) // 2).sum())
+        assert_equal(reader.atoms.Natoms, atoms.Natoms)
+
+        swnt = SWNTGenerator(n=5, m=5, nz=2)
+        DATAWriter.write(fpath=f.name, structure=swnt, topology=True,
+                         pbc=[False, False, True])
+        indptr, _ = DATAReader(f.name).get_bonded_neighbors()
+        assert_true(np.all(np.diff(indptr) == 3))
+    finally:
+        os.remove(f.name)
+
+
 if __name__ == '__main__':
     nose.runmodule()
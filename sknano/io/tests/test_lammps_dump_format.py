@@ -4,11 +4,14 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
 from pkg_resources import resource_filename
+import os
+import tempfile
 import unittest
 
 import nose
-from nose.tools import assert_equal
-from sknano.io import DUMPReader  # , DUMPData, DUMPWriter
+from nose.tools import assert_equal, assert_true
+import numpy as np
+from sknano.io import BinaryDUMPReader, DUMPReader  # , DUMPData, DUMPWriter
 
 
 # def test_reader():
@@ -42,5 +45,66 @@ class TestCase(DUMPTestFixture):
         print(self.dump.atomattrs)
 
 
+def write_binary_dump(dumpfile, binfile, revision=2):
+    """Convert text `dumpfile` to a LAMMPS binary dump."""
+    with open(dumpfile) as f:
+        lines = f.read().splitlines()
+    with open(binfile, 'wb') as f:
+        i = 0
+        while i < len(lines):
+            timestep = int(lines[i + 1])
+            Natoms = int(lines[i + 3])
+            bounds = [float(v) for line in lines[i + 5:i + 8]
+                      for v in line.split()[:2]]
+            columns = lines[i + 8].split()[2:]
+            atoms = np.loadtxt(lines[i + 9:i + 9 + Natoms], ndmin=2)
+            if revision > 1:
+                np.array([-10], dtype='<i8').tofile(f)
+                f.write(b'DUMPCUSTOM')
+                np.array([1, revision], dtype='<i4').tofile(f)
+            np.array([timestep, Natoms], dtype='<i8').tofile(f)
+            np.array([0, 0, 0, 0, 0, 1, 1], dtype='<i4').tofile(f)
+            np.array(bounds, dtype='<f8').tofile(f)
+            np.array([len(columns)], dtype='<i4').tofile(f)
+            if revision > 1:
+                np.array([0], dtype='<i4').tofile(f)
+                np.array([0], dtype='<i1').tofile(f)
+                columns = ' '.join(columns).encode('ascii')
+                np.array([len(columns)], dtype='<i4').tofile(f)
+                f.write(columns)
+            chunks = np.array_split(atoms.ravel(), 2)
+            np.array([len(chunks)], dtype='<i4').tofile(f)
+            for chunk in chunks:
+                np.array([len(chunk)], dtype='<i4').tofile(f)
+                chunk.astype('<f8').tofile(f)
+            i += 9 + Natoms
+
+
+def test2():
+    dumpfile = \
+        resource_filename('sknano', 'data/lammpstrj/0500_29cells.dump')
+    attrmap = {'c_peratom_pe': 'pe', 'c_peratom_ke': 'ke'}
+    dump = DUMPReader(dumpfile, attrmap=attrmap)
+    columns = 'id type x y z vx vy vz fx fy fz c_peratom_pe ' + \
+        'c_peratom_ke v_speed'
+    fd, binfile = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        for revision, kwargs in ((2, {}), (0, {'columns': columns})):
+            write_binary_dump(dumpfile, binfile, revision=revision)
+            bindump = BinaryDUMPReader(binfile, attrmap=attrmap, **kwargs)
+            assert_equal(bindump.atomattrs, dump.atomattrs)
+            assert_equal(bindump.timesteps.tolist(), dump.timesteps.tolist())
+            for snapshot, bin_snapshot in zip(dump, bindump):
+                assert_equal(bin_snapshot.boxstr, 'pp pp ff')
+                assert_true(np.allclose(bin_snapshot.cell_matrix,
+                                        snapshot.cell_matrix))
+                assert_true(np.allclose(
+                    bin_snapshot.get_atoms(asarray=True),
+                    snapshot.get_atoms(asarray=True)))
+    finally:
+        os.remove(binfile)
+
+
 if __name__ == '__main__':
     nose.runmodule()
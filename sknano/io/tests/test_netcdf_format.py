@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_true
+from pkg_resources import resource_filename
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sknano.io import DUMPReader, NetCDFReader, NetCDFWriter, \
+    StructureReader
+
+
+def setup_module():
+    global tmpdir, dump
+    tmpdir = tempfile.mkdtemp()
+    dump = DUMPReader(
+        resource_filename('sknano', 'data/lammpstrj/0500_29cells.dump'),
+        attrmap={'c_peratom_pe': 'pe', 'c_peratom_ke': 'ke'})
+
+
+def teardown_module():
+    shutil.rmtree(tmpdir)
+
+
+def test1():
+    fpath = os.path.join(tmpdir, 'dump.nc')
+    NetCDFWriter.write(fpath=fpath, trajectory=dump.trajectory)
+    with StructureReader.read(fpath) as reader:
+        assert_true(isinstance(reader, NetCDFReader))
+        assert_equal(reader.Nframes, dump.trajectory.Nsnaps)
+        assert_equal(reader.timesteps.tolist(), dump.timesteps.tolist())
+        positions = dump.trajectory.get_positions(unwrap=False)
+        assert_true(np.allclose(reader.get_positions(), positions,
+                                atol=1e-4))
+        assert_true(np.allclose(reader.get_positions(frames=slice(2, 5),
+                                                     atoms=[1, 3]),
+                                positions[2:5, [1, 3]], atol=1e-4))
+        assert_true(np.allclose(reader.get_velocities(),
+                                dump.trajectory.get_velocities(),
+                                atol=1e-4))
+
+        snapshot = reader[-1]
+        dump_snapshot = dump[-1]
+        assert_equal(snapshot.timestep, dump_snapshot.timestep)
+        for attr in ('xlo', 'xhi', 'ylo', 'yhi', 'zlo', 'zhi'):
+            assert_true(np.allclose(getattr(snapshot, attr),
+                                    getattr(dump_snapshot, attr)))
+        assert_true(np.allclose(snapshot.get_attrs('id', 'type', 'pe'),
+                                dump_snapshot.get_attrs('id', 'type', 'pe')))
+        assert_equal(reader.trajectory.Nsnaps, dump.trajectory.Nsnaps)
+
+
+def test2():
+    trajectory = DUMPReader(
+        resource_filename('sknano', 'data/lammpstrj/0500_29cells.dump'),
+        attrmap={'c_peratom_pe': 'pe', 'c_peratom_ke': 'ke'}).trajectory
+    trajectory[-1].timestep = 2 ** 40 + 1
+    fpath = os.path.join(tmpdir, 'long_run.nc')
+    NetCDFWriter.write(fpath=fpath, trajectory=trajectory)
+    with NetCDFReader(fpath) as reader:
+        assert_equal(reader.timesteps[-1], 2 ** 40 + 1)
+        assert_equal(reader[-1].timestep, 2 ** 40 + 1)
+
+
+if __name__ == '__main__':
+    nose.runmodule()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_true
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sknano.generators import SWNTGenerator
+from sknano.io import NPZData, NPZReader, StructureReader, StructureWriter
+
+
+def setup_module():
+    global tmpdir
+    tmpdir = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(tmpdir)
+
+
+def check_round_trip(structure_format):
+    swnt = SWNTGenerator(n=5, m=5, nz=2)
+    atoms = swnt.atoms
+    atoms[0].vx = 0.5
+    atoms[1].mass = 13.0
+    fpath = os.path.join(tmpdir, 'swnt.' + structure_format)
+    StructureWriter.write(fname=fpath, structure=swnt)
+
+    reader = StructureReader.read(fpath)
+    new_atoms = reader.atoms
+    assert_equal(new_atoms.Natoms, atoms.Natoms)
+    assert_equal(new_atoms.elements.tolist(), atoms.elements.tolist())
+    assert_equal(new_atoms.ids.tolist(), atoms.ids.tolist())
+    assert_true(np.allclose(new_atoms.coords, atoms.coords))
+    assert_true(np.allclose(new_atoms.velocities, atoms.velocities))
+    assert_true(np.allclose(new_atoms.masses, atoms.masses))
+    assert_true(np.allclose(reader.lattice.matrix, swnt.lattice.matrix))
+
+
+def test1():
+    check_round_trip('npz')
+
+
+def test2():
+    try:
+        import h5py  # noqa
+    except ImportError:
+        raise nose.SkipTest('h5py is not installed')
+    check_round_trip('h5')
+
+
+def test3():
+    swnt = SWNTGenerator(n=5, m=5, nz=2)
+    fpath = os.path.join(tmpdir, 'swnt_save')
+    swnt.save(fname=fpath, structure_format='npz')
+    data = NPZData(fpath + '.npz')
+    assert_equal(data.atoms.Natoms, swnt.atoms.Natoms)
+    data.atoms[0].x = 100.0
+    data.write()
+    assert_equal(NPZReader(fpath + '.npz').atoms[0].x, 100.0)
+
+
+if __name__ == '__main__':
+    nose.runmodule()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_true
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from sknano.generators import SWNTGenerator
+from sknano.io import PDBData, PDBReader, PDBWriter, StructureReader
+
+pdb_models = """\
+TITLE     test models
+CRYST1   20.000   20.000   30.000  90.00  90.00  90.00 P 1           1
+MODEL        1
+ATOM      1  N   GLY A   1       1.000   2.000   3.000  1.00  0.00           N
+ATOM      2  CA  GLY A   1       2.000   2.500   3.000  1.00  0.00           C
+HETATM    3 CA    CA B   2       5.000   5.000   5.000  1.00  0.00          CA2+
+ENDMDL
+MODEL        2
+ATOM      1  N   GLY A   1       1.100   2.000   3.000  1.00  0.00
+ATOM      2  CA  GLY A   1       2.100   2.500   3.000  1.00  0.00
+HETATM    3 CA    CA B   2       5.100   5.000   5.000  1.00  0.00          CA2+
+ENDMDL
+END
+"""
+
+
+def setup_module():
+    global tmpdir
+    tmpdir = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(tmpdir)
+
+
+def test1():
+    fpath = os.path.join(tmpdir, 'models.pdb')
+    with open(fpath, 'w') as f:
+        f.write(pdb_models)
+    reader = StructureReader.read(fpath)
+    assert_true(isinstance(reader, PDBReader))
+    assert_equal(reader.Nmodels, 2)
+    assert_equal(reader.comment_line, 'test models')
+    atoms = reader.atoms
+    assert_equal(atoms.Natoms, 3)
+    assert_equal(atoms.elements.tolist(), ['N', 'C', 'Ca'])
+    assert_equal(atoms.ids.tolist(), [1, 2, 3])
+    assert_equal(atoms.mols.tolist(), [1, 1, 2])
+    assert_equal(atoms.charges.tolist(), [0.0, 0.0, 2.0])
+    assert_true(np.allclose(atoms.coords[0], [1.0, 2.0, 3.0]))
+    assert_true(np.allclose(reader.lattice.lengths, [20.0, 20.0, 30.0]))
+    assert_equal(reader.read_model(1)['resName'].tolist(),
+                 ['GLY', 'GLY', 'CA'])
+
+    trajectory = reader.trajectory
+    assert_equal(trajectory.Nsnaps, 2)
+    assert_equal(trajectory.timesteps.tolist(), [1, 2])
+    assert_true(np.allclose(trajectory.get_positions()[:, 0, 0],
+                            [1.0, 1.1]))
+    assert_true(np.allclose(trajectory[0].cell_matrix,
+                            np.diag([20.0, 20.0, 30.0])))
+
+
+def test2():
+    swnt = SWNTGenerator(n=5, m=5, nz=2)
+    atoms = swnt.atoms
+    fpath = os.path.join(tmpdir, 'swnt.pdb')
+    swnt.save(fname=fpath, structure_format='pdb')
+    data = PDBData(fpath)
+    new_atoms = data.atoms
+    assert_equal(new_atoms.Natoms, atoms.Natoms)
+    assert_equal(new_atoms.elements.tolist(), atoms.elements.tolist())
+    assert_true(np.allclose(new_atoms.coords, atoms.coords, atol=1e-3))
+    assert_true(np.allclose(data.lattice.lengths, swnt.lattice.lengths,
+                            atol=1e-3))
+
+    data.write()
+    with open(fpath) as f:
+        lines = [line for line in f if line.startswith('ATOM')]
+    assert_equal(len(lines), atoms.Natoms)
+    assert_equal(lines[0][12:16], ' C  ')
+    assert_equal(lines[0][17:20], 'UNK')
+
+
+def test3():
+    swnt = SWNTGenerator(n=5, m=5, nz=2)
+    fpath = os.path.join(tmpdir, 'title.pdb')
+    PDBWriter.write(fpath=fpath, structure=swnt, comment_line='x' * 75)
+    reader = PDBReader(fpath)
+    assert_equal(reader.comment_line, 'x' * 70)
+    assert_true(reader.lattice is not None)
+    assert_equal(reader.atoms.Natoms, swnt.atoms.Natoms)
+
+    with open(fpath) as f:
+        lines = f.readlines()
+    with open(fpath, 'w') as f:
+        atom = 0
+        for line in lines:
+            if line.startswith('ATOM'):
+                line = line[:22] + 'A{:03d}'.format(atom // 10) + line[26:]
+                atom += 1
+            f.write(line)
+    assert_equal(PDBReader(fpath).atoms.mols.tolist(),
+                 (np.arange(atom) // 10 + 1).tolist())
+
+
+if __name__ == '__main__':
+    nose.runmodule()
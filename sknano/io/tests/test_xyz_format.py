@@ -4,9 +4,15 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
 import nose
-from nose.tools import assert_equal, assert_not_equal
+from nose.tools import assert_equal, assert_not_equal, assert_true
 from pkg_resources import resource_filename
-from sknano.io import XYZData, XYZReader  # , XYZWriter, XYZ2DATAConverter
+import io
+import os
+import tempfile
+
+import numpy as np
+from sknano.io import XYZData, XYZReader, XYZWriter, write_columns
+# from sknano.io import XYZ2DATAConverter
 
 
 def test1():
@@ -41,5 +47,61 @@ def test3():
     assert_equal(list(set(atoms.atom_ids)), list(range(1, 41)))
 
 
+def test4():
+    f = io.StringIO()
+    write_columns(f, [['C', 'N', 'O'], np.arange(3), np.linspace(0, 1, 3)],
+                  ['%3s', '%3d', '%6.2f'], chunk_size=2)
+    assert_equal(f.getvalue(),
+                 '  C  0  0.00\n  N  1  0.50\n  O  2  1.00\n')
+
+
+def test5():
+    infile = resource_filename('sknano', 'data/nanotubes/1010_1cell.xyz')
+    atoms = XYZReader(infile).atoms
+    with tempfile.NamedTemporaryFile(suffix='.xyz', delete=False) as f:
+        pass
+    try:
+        XYZWriter.write(fpath=f.name, atoms=atoms, chunk_size=7)
+        new_atoms = XYZReader(f.name).atoms
+        assert_equal(new_atoms.Natoms, atoms.Natoms)
+        assert_equal(new_atoms.symbols.tolist(), atoms.symbols.tolist())
+        assert_true(np.allclose(new_atoms.coords, atoms.coords))
+    finally:
+        os.remove(f.name)
+
+
+def test6():
+    frames = [np.random.RandomState(t).rand(3, 3) + t for t in range(4)]
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.xyz',
+                                     delete=False) as f:
+        for t, coords in enumerate(frames):
+            f.write('3\nframe {}\n'.format(t))
+            for element, (x, y, z) in zip(['C', '7', 'c'], coords):
+                f.write('{} {:.8f} {:.8f} {:.8f} 0.0\n'.format(
+                    element, x, y, z))
+    try:
+        reader = XYZReader(f.name)
+        assert_equal(reader.Nframes, 4)
+        assert_equal(reader.comment_line, 'frame 0')
+        assert_equal(reader.atoms.Natoms, 3)
+        assert_equal(reader.atoms.elements.tolist(), ['C', 'N', 'C'])
+        assert_true(np.allclose(reader.atoms.coords, frames[0]))
+
+        snapshot = reader.read_frame(2)
+        assert_equal(snapshot.comment_line, 'frame 2')
+        assert_equal(snapshot.timestep, 2)
+        assert_true(np.allclose(snapshot.get_positions(), frames[2]))
+        assert_equal(XYZReader(f.name, frame=3).comment_line, 'frame 3')
+        assert_equal(len(list(reader.iter_frames())), 4)
+
+        trajectory = reader.trajectory
+        assert_equal(trajectory.Nsnaps, 4)
+        assert_true(np.allclose(trajectory.get_positions(), frames))
+        assert_equal(trajectory[1].get_attrs('type')[:, 0].tolist(),
+                     [1, 2, 1])
+    finally:
+        os.remove(f.name)
+
+
 if __name__ == '__main__':
     nose.runmodule()
@@ -52,7 +52,9 @@ Base/Mixin Classes
 Compute Functions
 ------------------
 
-Nanotube compute functions:
+Nanotube compute functions. The chiral indices :math:`n` and :math:`m`
+may also be given as integer arrays, in which case the functions are
+evaluated elementwise:
 
 .. autosummary::
    :toctree: generated/
@@ -95,6 +97,7 @@ Helper functions for working with :math:`(n, m)` chirality data
    generate_Ch_property_grid
    get_Ch_indices
    get_Ch_type
+   get_chirality_table
    map_Ch
 
 """
@@ -111,6 +114,7 @@ from ._graphene import *
 from ._bilayer_graphene import *
 
 from ._swnt import *
+from ._chirality_table import *
 from ._swnt_bundle import *
 from ._mwnt import *
 from ._mwnt_bundle import *
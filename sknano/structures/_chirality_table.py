@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+==============================================================================
+Nanotube chirality table (:mod:`sknano.structures._chirality_table`)
+==============================================================================
+
+.. currentmodule:: sknano.structures._chirality_table
+
+"""
+from __future__ import absolute_import, division, print_function, \
+    unicode_literals
+__docformat__ = 'restructuredtext en'
+
+import os
+import tempfile
+
+import numpy as np
+
+from sknano.version import version
+from ._swnt import compute_chiral_angle, compute_dt, compute_electronic_type, \
+    compute_N, compute_T
+
+__all__ = ['get_chirality_table', 'CHIRALITY_TABLE_DTYPE',
+           'CHIRALITY_TABLE_DIR']
+
+#: :class:`~numpy:numpy.dtype` of the :func:`get_chirality_table` array.
+CHIRALITY_TABLE_DTYPE = np.dtype([('n', int), ('m', int), ('dt', float),
+                                  ('chiral_angle', float),
+                                  ('chiral_type', 'U8'),
+                                  ('electronic_type', 'U22'),
+                                  ('N', int), ('T', float)])
+
+#: Default directory of the persisted chirality tables.
+CHIRALITY_TABLE_DIR = os.path.join(os.path.expanduser('~'), '.scikit-nano')
+
+_chirality_tables = {}
+
+
+def _table_fpath(imax, cache_dir):
+    return os.path.join(cache_dir,
+                        'chirality_table_imax{}_v{}.npy'.format(imax, version))
+
+
+def _generate_chirality_table(imax):
+    n, m = np.indices((imax + 1, imax + 1))
+    n, m = n.ravel()[1:], m.ravel()[1:]
+    table = np.empty(n.size, dtype=CHIRALITY_TABLE_DTYPE)
+    table['n'] = n
+    table['m'] = m
+    table['dt'] = compute_dt(n, m)
+    table['chiral_angle'] = compute_chiral_angle(n, m)
+    table['chiral_type'] = 'chiral'
+    table['chiral_type'][(n == 0) | (m == 0)] = 'zigzag'
+    table['chiral_type'][n == m] = 'armchair'
+    table['electronic_type'] = compute_electronic_type(n, m)
+    table['N'] = compute_N(n, m)
+    table['T'] = compute_T(n, m)
+    return table[np.argsort(table['dt'], kind='mergesort')]
+
+
+def _save_chirality_table(table, fpath):
+    fd, tmpfile = tempfile.mkstemp(suffix='.npy',
+                                   dir=os.path.dirname(fpath))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, table)
+        os.replace(tmpfile, fpath)
+    except BaseException:
+        os.remove(tmpfile)
+        raise
+
+
+def get_chirality_table(imax=100, cache_dir=None):
+    """Return a table of the :math:`(n, m)` chiralities and their \
+        properties, sorted by nanotube diameter.
+
+    The table covers all chiralities with
+    :math:`0\\le n\\le i_{\\mathrm{max}}` and
+    :math:`0\\le m\\le i_{\\mathrm{max}}`, except :math:`(0, 0)`.
+    It is built on first use, kept in memory, and saved to `cache_dir`
+    so that later sessions can load it instead of recomputing it.
+    Properties are computed for the default carbon-carbon bond length
+    :data:`~sknano.core.refdata.aCC`. The lengths `dt` and `T` scale
+    linearly with the bond length.
+
+    Parameters
+    ----------
+    imax : int, optional
+        maximum chiral index :math:`n = m = i_{max}`.
+    cache_dir : {None, str}, optional
+        Directory of the persisted tables. Defaults to
+        :data:`CHIRALITY_TABLE_DIR`. The table is only kept in memory
+        if the directory cannot be written.
+
+    Returns
+    -------
+    table : :class:`~numpy:numpy.ndarray`
+        Read-only structured array of :data:`CHIRALITY_TABLE_DTYPE`
+        with fields `n`, `m`, `dt`, `chiral_angle`, `chiral_type`,
+        `electronic_type`, `N`, and `T`, sorted by `dt`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sknano.structures import get_chirality_table
+    >>> table = get_chirality_table(imax=20)
+    >>> table.size
+    440
+    >>> i = np.searchsorted(table['dt'], 10.0)
+    >>> table['dt'][i - 1] < 10.0 <= table['dt'][i]
+    True
+
+    """
+    if cache_dir is None:
+        cache_dir = CHIRALITY_TABLE_DIR
+    imax = int(imax)
+
+    table = _chirality_tables.get(imax)
+    if table is not None:
+        return table
+
+    fpath = _table_fpath(imax, cache_dir)
+    try:
+        try:
+            table = np.load(fpath, allow_pickle=False)
+        except TypeError:
+            # numpy < 1.10 has no `allow_pickle` argument
+            table = np.load(fpath)
+        if table.dtype != CHIRALITY_TABLE_DTYPE:
+            table = None
+    except (IOError, OSError, ValueError):
+        table = None
+
+    if table is None:
+        table = _generate_chirality_table(imax)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            _save_chirality_table(table, fpath)
+        except (IOError, OSError):
+            pass
+
+    table.flags.writeable = False
+    _chirality_tables[imax] = table
+    return table
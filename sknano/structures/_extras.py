@@ -405,7 +405,9 @@ def generate_Ch_property_grid(compute=str, imax=10, **kwargs):
 
     The property grid is indexed by :math:`(n, m)` chiralities
     for :math:`0\\le n\\le i_{\\mathrm{max}}` and
-    :math:`0\\le m\\le i_{\\mathrm{max}}`.
+    :math:`0\\le m\\le i_{\\mathrm{max}}`. The grid is computed in a
+    single call of the `compute` function with arrays of the chiral
+    indices.
 
     Parameters
     ----------
@@ -421,9 +423,8 @@ def generate_Ch_property_grid(compute=str, imax=10, **kwargs):
         compute_func = \
             getattr(importlib.import_module('sknano.structures'), compute)
         grid = np.zeros((imax + 1, imax + 1)) - 1
-        for n in range(imax + 1):
-            for m in range(imax + 1):
-                grid[n, m] = compute_func(n, m, **kwargs)
+        n, m = np.indices(grid.shape)
+        grid[:] = compute_func(n, m, **kwargs)
         return grid
     except AttributeError as e:
         print(e)
@@ -509,6 +510,10 @@ def get_chiral_indices(*args, check_type=True, **kwargs):
                 del kwargs['n']
                 m = kwargs['m']
                 del kwargs['m']
+    if not np.isscalar(n):
+        n = np.asarray(n)
+    if not np.isscalar(m):
+        m = np.asarray(m)
     if check_type:
         type_check_chiral_indices((n, m))
     return n, m, kwargs
@@ -561,7 +566,7 @@ def type_check_chiral_indices(*Ch):
         except IndexError:
             raise ValueError('Expected an (n, m) tuple of chiral indices')
 
-    if not (isinstance(n, numbers.Real) or n >= 0):
+    if not (isinstance(n, numbers.Real) or np.all(n >= 0)):
         raise TypeError('Expected an integer')
-    if not (isinstance(m, numbers.Real) or m >= 0):
+    if not (isinstance(m, numbers.Real) or np.all(m >= 0)):
         raise TypeError('Expected an integer')
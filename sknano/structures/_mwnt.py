@@ -17,12 +17,24 @@ import numpy as np
 from sknano.core.refdata import aCC, element_data
 
 from ._base import NanoStructureBase, r_CC_vdw
-from ._swnt import SWNT, compute_dt  # , compute_T
-from ._extras import generate_Ch_list
+from ._swnt import SWNT
+from ._chirality_table import get_chirality_table
+from ._extras import CHIRAL_TYPES
 
 __all__ = ['MWNTMixin', 'MWNT']
 
 
+def _wall_Natoms(swnt):
+    """Return the number of atoms generated for the `MWNT` wall `swnt`.
+
+    The wall is generated from its length :attr:`~SWNT.Lz` with
+    :math:`n_z` rounded up to a whole number of unit cells.
+
+    """
+    nz = int(np.ceil(10 * float(swnt.Lz) / swnt.T))
+    return swnt.Natoms_per_unit_cell * nz
+
+
 class MWNTMixin:
     """Mixin class for MWNTs."""
     @property
@@ -76,7 +88,7 @@ class MWNTMixin:
            N_{\\mathrm{atoms}} = \\sum_{\\mathrm{walls}}
 
         """
-        return np.asarray(self.Natoms_per_wall).sum()
+        return np.asarray([_wall_Natoms(swnt) for swnt in self.walls]).sum()
 
     @property
     def Natoms_per_tube(self):
@@ -153,8 +165,13 @@ class MWNTMixin:
     @property
     def Natoms_list(self):
         """List of `MWNT` `SWNT` wall's number of atoms \
-        :attr:`~SWNT.Natoms`."""
-        return [swnt.Natoms for swnt in self.walls]
+        :attr:`~SWNT.Natoms`.
+
+        The walls are generated with a whole number of unit cells, so
+        the fractional :attr:`~SWNT.nz` of each wall is rounded up.
+
+        """
+        return [_wall_Natoms(swnt) for swnt in self.walls]
 
     @property
     def nz_list(self):
@@ -220,12 +237,24 @@ class MWNTMixin:
         dt_mask : :class:`~numpy:numpy.ndarray`
 
         """
-        dt_mask = np.abs(self._dt_pool - dt) <= max_dt_diff
-        while not np.any(dt_mask):
-            max_dt_diff += max_dt_diff
-            dt_mask = np.abs(self._dt_pool - dt) <= max_dt_diff
+        dt_mask = np.zeros(len(self._dt_pool), dtype=bool)
+        dt_mask[slice(*self._dt_pool_range(dt, max_dt_diff=max_dt_diff))] = \
+            True
         return dt_mask
 
+    def _dt_pool_range(self, dt, max_dt_diff=0.5):
+        """Return the index range of the :attr:`~SWNT.dt` sorted \
+            chirality pool within `max_dt_diff` of `dt`, doubling \
+            `max_dt_diff` until the range is not empty."""
+        while True:
+            start = np.searchsorted(self._dt_pool, dt - max_dt_diff,
+                                    side='left')
+            stop = np.searchsorted(self._dt_pool, dt + max_dt_diff,
+                                   side='right')
+            if start < stop:
+                return start, stop
+            max_dt_diff += max_dt_diff
+
     def generate_Ch_list(self, Nwalls=None, max_walls=None,
                          min_wall_diameter=None, max_wall_diameter=None,
                          chiral_types=None, wall_spacing=None):
@@ -246,19 +275,25 @@ class MWNTMixin:
 
         delta_dt = 2 * wall_spacing
 
-        imax = 100
-
-        self._Ch_pool = \
-            np.asarray(generate_Ch_list(imax=imax,
-                                        chiral_types=chiral_types))
-        self._dt_pool = np.asarray([compute_dt(_Ch, bond=self.bond) for _Ch
-                                   in self._Ch_pool])
-
-        dt_mask = np.logical_and(self._dt_pool >= min_wall_diameter,
-                                 self._dt_pool <= max_wall_diameter)
-
-        self._Ch_pool = self._Ch_pool[dt_mask]
-        self._dt_pool = self._dt_pool[dt_mask]
+        table = get_chirality_table(imax=100)
+        if chiral_types is not None:
+            if not isinstance(chiral_types, list):
+                chiral_types = [chiral_types]
+            chiral_types = chiral_types[:]
+            if any([chiral_type in CHIRAL_TYPES for chiral_type in
+                    chiral_types]):
+                if 'achiral' in chiral_types or 'aCh' in chiral_types:
+                    chiral_types.extend(['armchair', 'zigzag'])
+                table = table[np.in1d(table['chiral_type'], chiral_types)]
+
+        # the table is sorted by diameter, which scales linearly with the
+        # bond length
+        dt_pool = table['dt'] * self.bond / aCC
+        start = np.searchsorted(dt_pool, min_wall_diameter, side='left')
+        stop = np.searchsorted(dt_pool, max_wall_diameter, side='right')
+
+        self._Ch_pool = np.column_stack((table['n'], table['m']))[start:stop]
+        self._dt_pool = dt_pool[start:stop]
 
         if max_wall_diameter < np.inf:
             dt_list = []
@@ -270,11 +305,8 @@ class MWNTMixin:
             dt_list = [self._dt_pool.min() + i * delta_dt
                        for i in range(max_walls)]
 
-        dt_masks = [self.generate_dt_mask(_dt) for _dt in dt_list]
-
-        return [tuple(self._Ch_pool[_mask][np.random.choice(
-            list(range(len(self._Ch_pool[_mask]))))].tolist())
-            for _mask in dt_masks]
+        return [tuple(self._Ch_pool[np.random.randint(
+            *self._dt_pool_range(_dt))].tolist()) for _dt in dt_list]
 
     def update_Ch_list(self, Nwalls=None, min_wall_diameter=None,
                        max_wall_diameter=None, wall_spacing=None,
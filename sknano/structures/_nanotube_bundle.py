@@ -180,7 +180,15 @@ class NanotubeBundleMixin:
 
     @property
     def Natoms_list(self):
-        return [nanotube.Natoms for nanotube in self.bundle_list]
+        """List of the number of atoms in each nanotube in the bundle.
+
+        Before the bundle is generated, the list is computed from the
+        number of atoms in the bundle nanotube.
+
+        """
+        if self.bundle_list:
+            return [nanotube.Natoms for nanotube in self.bundle_list]
+        return self.Ntubes * [super().Natoms]
 
     @property
     def Ntubes(self):
@@ -192,10 +200,14 @@ class NanotubeBundleMixin:
         return self.Natoms_list
 
     def generate_bundle_coords(self):
-        """Generate coordinates of bundle tubes."""
+        """Generate coordinates of bundle tubes.
+
+        Sets :attr:`bundle_coords` to an :math:`N_{\\mathrm{tubes}}\\times 3`
+        array of the tube offsets.
+
+        """
         self.r1 = Vector()
         self.r2 = Vector()
-        self.bundle_coords = []
 
         self.r1.x = self.dt + 2 * self.vdw_radius
         if self.bundle_packing in ('cubic', 'ccp'):
@@ -206,6 +218,10 @@ class NanotubeBundleMixin:
             if self.bundle_packing is None:
                 self._bundle_packing = 'hcp'
 
+        r1 = np.asarray(self.r1)
+        r2 = np.asarray(self.r2)
+        bundle_coords = [np.zeros((0, 3))]
+
         if self.bundle_geometry == 'hexagon':
             nrows = max(self.nx, self.ny, 3)
             if nrows % 2 != 1:
@@ -213,42 +229,27 @@ class NanotubeBundleMixin:
 
             ntubes_per_end_rows = int((nrows + 1) / 2)
 
-            row = 0
-            ntubes_per_row = nrows
-            while ntubes_per_row >= ntubes_per_end_rows:
-                if row == 0:
-                    for n in range(ntubes_per_row):
-                        dr = n * self.r1
-                        self.bundle_coords.append(dr)
-                else:
-                    for nx in range(ntubes_per_row):
-                        for ny in (-row, row):
-                            dr = Vector()
-                            dr.x = abs(ny * self.r2.x)
-                            dr.y = ny * self.r2.y
-                            dr = nx * self.r1 + dr
-                            self.bundle_coords.append(dr)
-                row += 1
-                ntubes_per_row = nrows - row
-
-        elif self.bundle_geometry == 'rectangle':
-            Lx = 10 * self.Lx
-            for nx in range(self.nx):
-                for ny in range(self.ny):
-                    dr = nx * self.r1 + ny * self.r2
-                    while dr.x < 0:
-                        dr.x += Lx
-                    self.bundle_coords.append(dr)
-
-        elif self.bundle_geometry == 'square':
-            pass
-        elif self.bundle_geometry == 'triangle':
+            bundle_coords.append(np.arange(nrows)[:, np.newaxis] * r1)
+            for row in range(1, nrows - ntubes_per_end_rows + 1):
+                nx = np.arange(nrows - row)[:, np.newaxis, np.newaxis]
+                ny = np.array([-row, row])[np.newaxis, :, np.newaxis]
+                dr = ny * r2
+                dr[..., 0] = np.abs(dr[..., 0])
+                bundle_coords.append((nx * r1 + dr).reshape((-1, 3)))
+
+        elif self.bundle_geometry in ('square', 'triangle'):
             pass
+
         else:
-            for nx in range(self.nx):
-                for ny in range(self.ny):
-                    dr = nx * self.r1 + ny * self.r2
-                    self.bundle_coords.append(dr)
+            nx, ny = np.indices((self.nx, self.ny))
+            dr = nx.reshape((-1, 1)) * r1 + ny.reshape((-1, 1)) * r2
+            if self.bundle_geometry == 'rectangle':
+                Lx = 10 * self.Lx
+                x = dr[:, 0]
+                dr[:, 0] = np.where(x < 0, x + Lx * np.ceil(-x / Lx), x)
+            bundle_coords.append(dr)
+
+        self.bundle_coords = np.vstack(bundle_coords)
 
 
 class NanotubeBundleBase(NanotubeBundleMixin):
@@ -35,6 +35,54 @@ __all__ = ['compute_d', 'compute_dR', 'compute_N', 'compute_t1', 'compute_t2',
            'SWNTMixin', 'NanotubeMixin', 'SWNT', 'Nanotube']
 
 
+def _isscalar(*args):
+    return all(np.ndim(arg) == 0 for arg in args)
+
+
+def _gcd(a, b):
+    if _isscalar(a, b):
+        return gcd(a, b)
+    return np.abs(_extended_gcd(a, b)[0])
+
+
+def _int_divide(a, b):
+    """Return the integer quotient `a / b` or `0` where `b == 0`."""
+    if _isscalar(a, b):
+        return int(a / b) if b != 0 else 0
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=int),
+                               np.asarray(b, dtype=int))
+    q = np.zeros(a.shape, dtype=int)
+    np.floor_divide(a, b, out=q, where=b != 0)
+    return q
+
+
+def _divide(a, b):
+    """Return `a / b` or `0` where `b == 0`."""
+    if _isscalar(a, b):
+        return a / b if b != 0 else 0
+    a, b = np.broadcast_arrays(a, b)
+    q = np.zeros(a.shape)
+    np.true_divide(a, b, out=q, where=b != 0)
+    return q
+
+
+def _extended_gcd(a, b):
+    """Return integer arrays `(g, x, y)` with `a * x + b * y = g`, where \
+        `g = gcd(a, b)`, computed elementwise with the extended Euclidean \
+        algorithm."""
+    a, b = np.broadcast_arrays(np.array(a, dtype=int), np.array(b, dtype=int))
+    x0, x1 = np.ones_like(a), np.zeros_like(a)
+    y0, y1 = np.zeros_like(a), np.ones_like(a)
+    while np.any(b != 0):
+        nonzero = b != 0
+        q = np.zeros_like(a)
+        np.floor_divide(a, b, out=q, where=nonzero)
+        a, b = np.where(nonzero, b, a), np.where(nonzero, a - q * b, b)
+        x0, x1 = np.where(nonzero, x1, x0), np.where(nonzero, x0 - q * x1, x1)
+        y0, y1 = np.where(nonzero, y1, y0), np.where(nonzero, y0 - q * y1, y1)
+    return a, x0, y0
+
+
 def compute_d(*Ch):
     """Compute :math:`d=\\gcd{(n, m)}`
 
@@ -56,7 +104,7 @@ def compute_d(*Ch):
     """
     n, m, _ = get_chiral_indices(*Ch)
 
-    return gcd(n, m)
+    return _gcd(n, m)
 
 
 def compute_dR(*Ch):
@@ -80,7 +128,7 @@ def compute_dR(*Ch):
     """
     n, m, _ = get_chiral_indices(*Ch)
 
-    return gcd(2 * m + n, 2 * n + m)
+    return _gcd(2 * m + n, 2 * n + m)
 
 
 def compute_N(*Ch):
@@ -106,10 +154,7 @@ def compute_N(*Ch):
     n, m, _ = get_chiral_indices(*Ch)
 
     dR = compute_dR(n, m)
-    try:
-        return int(2 * (n ** 2 + m ** 2 + n * m) / dR)
-    except ZeroDivisionError:
-        return 0
+    return _int_divide(2 * (n ** 2 + m ** 2 + n * m), dR)
 
 
 def compute_t1(*Ch):
@@ -140,10 +185,7 @@ def compute_t1(*Ch):
     n, m, _ = get_chiral_indices(*Ch)
 
     dR = compute_dR(n, m)
-    try:
-        return int((2 * m + n) / dR)
-    except ZeroDivisionError:
-        return 0
+    return _int_divide(2 * m + n, dR)
 
 
 def compute_t2(*Ch):
@@ -174,10 +216,7 @@ def compute_t2(*Ch):
     n, m, _ = get_chiral_indices(*Ch)
 
     dR = compute_dR(n, m)
-    try:
-        return -int((2 * n + m) / dR)
-    except ZeroDivisionError:
-        return 0
+    return -_int_divide(2 * n + m, dR)
 
 
 def compute_Ch(*Ch, bond=None, **kwargs):
@@ -291,11 +330,7 @@ def compute_T(*Ch, bond=None, length=True, **kwargs):
 
         Ch = compute_Ch(n, m, bond=bond)
         dR = compute_dR(n, m)
-
-        try:
-            return np.sqrt(3) * Ch / dR
-        except (FloatingPointError, ZeroDivisionError):
-            return 0
+        return _divide(np.sqrt(3) * Ch, dR)
     else:
         t1 = compute_t1(n, m)
         t2 = compute_t2(n, m)
@@ -437,19 +472,22 @@ def compute_R(*Ch, bond=None, length=False, **kwargs):
     """
     n, m, _ = get_chiral_indices(*Ch)
 
-    N = compute_N(n, m)
-    t1 = compute_t1(n, m)
-    t2 = compute_t2(n, m)
-
-    p = q = 0
-    for i in range(0, t1 + n + 1):
-        for j in range(t2, m + 1):
-            R = t1 * j - t2 * i
-            if R == 1:
-                M = m * i - n * j
-                if M > 0 and M <= N:
-                    p = i
-                    q = j
+    N = np.asarray(compute_N(n, m))
+    t1 = np.asarray(compute_t1(n, m))
+    t2 = np.asarray(compute_t2(n, m))
+
+    # t1 and t2 are coprime, so extended Euclid gives a solution of
+    # t1 * q - t2 * p = 1. All other solutions differ by multiples of
+    # (t1, t2), which change M = m * p - n * q by multiples of N, so
+    # there is exactly one solution with 0 < M <= N.
+    _, q, p = _extended_gcd(t1, -t2)
+    M = np.asarray(m * p - n * q, dtype=int)
+    k = np.zeros_like(N)
+    np.floor_divide(M - 1, N, out=k, where=N != 0)
+    p = np.where(N != 0, p - k * t1, 0)
+    q = np.where(N != 0, q - k * t2, 0)
+    if _isscalar(n, m):
+        p, q = int(p), int(q)
 
     if length:
         if bond is None:
@@ -558,10 +596,7 @@ def compute_psi(*Ch):
     n, m, _ = get_chiral_indices(*Ch)
 
     N = compute_N(n, m)
-    try:
-        return 2 * np.pi / N
-    except (FloatingPointError, ZeroDivisionError):
-        return 0
+    return _divide(2 * np.pi, N)
 
 
 def compute_tau(*Ch, bond=None, **kwargs):
@@ -596,10 +631,7 @@ def compute_tau(*Ch, bond=None, **kwargs):
     M = compute_M(n, m)
     N = compute_N(n, m)
     T = compute_T(n, m, bond=bond)
-    try:
-        return M * T / N
-    except ZeroDivisionError:
-        return 0
+    return _divide(M * T, N)
 
 
 def compute_electronic_type(*Ch):
@@ -657,12 +689,12 @@ def compute_electronic_type(*Ch):
     """
     n, m, _ = get_chiral_indices(*Ch)
 
-    if (2 * n + m) % 3 == 1:
-        return 'semiconducting, type 1'
-    elif (2 * n + m) % 3 == 2:
-        return 'semiconducting, type 2'
-    else:
-        return 'metallic'
+    electronic_types = np.array(['metallic', 'semiconducting, type 1',
+                                 'semiconducting, type 2'])
+    electronic_type = electronic_types[np.asarray(2 * n + m, dtype=int) % 3]
+    if _isscalar(n, m):
+        return str(electronic_type)
+    return electronic_type
 
 
 def compute_Natoms(*Ch, nz=1):
@@ -689,8 +721,10 @@ def compute_Natoms(*Ch, nz=1):
     """
     n, m, _ = get_chiral_indices(*Ch)
 
-    Natoms_per_unit_cell = compute_Natoms_per_unit_cell(n, m)
-    return int(Natoms_per_unit_cell * nz)
+    Natoms = compute_Natoms_per_unit_cell(n, m) * nz
+    if _isscalar(Natoms):
+        return int(Natoms)
+    return Natoms.astype(int)
 
 
 def compute_Natoms_per_tube(*Ch, nz=1):
@@ -822,13 +856,8 @@ def compute_linear_mass_density(*Ch, bond=None, element1=None, element2=None,
                                   **kwargs)
     T = compute_T(n, m, bond=bond, length=True, **kwargs)
 
-    try:
-        linear_mass_density = mass / T
-        # there are 1.6605e-24 grams / Da and 10 angstroms / nm
-        linear_mass_density *= 10 * grams_per_Da
-        return linear_mass_density
-    except ZeroDivisionError:
-        return 0
+    # there are 1.6605e-24 grams / Da and 10 angstroms / nm
+    return _divide(mass, T) * 10 * grams_per_Da
 
 
 def compute_Lx(*Ch, nx=1, bond=None, gutter=r_CC_vdw):
@@ -1524,49 +1553,37 @@ class SWNT(SWNTMixin, NanoStructureBase):
             print('dpsi: {}'.format(dpsi))
             print('dtau: {}\n'.format(dtau))
 
-        for i in range(N):
-            for j, element in enumerate((e1, e2), start=1):
-                theta = i * psi
-                h = i * tau
+        # helical coordinates of the N hexagons x 2 basis atoms, with the
+        # second basis atom of each hexagon offset by (dpsi, -dtau)
+        i = np.arange(N)
+        theta = np.column_stack((i * psi, i * psi + dpsi)).ravel()
+        h = np.column_stack((i * tau, i * tau - dtau)).ravel()
+        elements = [e1, e2] * N
 
-                if j == 2:
-                    theta += dpsi
-                    h -= dtau
+        x = rt * np.cos(theta)
+        y = rt * np.sin(theta)
+        z = h - T * np.maximum(np.ceil((h - T + eps) / T), 0)
+        z[z < 0] += T
 
-                x = rt * np.cos(theta)
-                y = rt * np.sin(theta)
-                z = h
+        rs = lattice.cartesian_to_fractional(np.column_stack((x, y, z)))
+        if self.wrap_coords:
+            rs = np.asarray(lattice.wrap_fractional_coordinate(rs))
 
-                while z > T - eps:
-                    z -= T
+        r = lattice.fractional_to_cartesian(rs)
+        r[np.abs(r) < 1e-10] = 0.0
 
-                if z < 0:
-                    z += T
+        if self.debug:
+            for k, (xyz, xyzs) in enumerate(zip(r.tolist(), rs.tolist())):
+                print('i={}: x, y, z = ({:.6f}, {:.6f}, {:.6f})'.format(
+                    k // 2, *xyz))
+                print('xs, ys, zs = ({:.6f}, {:.6f}, {:.6f})'.format(*xyzs))
 
-                xs, ys, zs = \
-                    lattice.cartesian_to_fractional([x, y, z])
+        basis.extend([BasisAtom(element, x=x, y=y, z=z)
+                      for element, (x, y, z) in zip(elements, r.tolist())])
 
-                if self.wrap_coords:
-                    xs, ys, zs = \
-                        lattice.wrap_fractional_coordinate([xs, ys, zs])
-
-                if self.debug:
-                    print('i={}: x, y, z = ({:.6f}, {:.6f}, {:.6f})'.format(
-                        i, x, y, z))
-
-                    print('xs, ys, zs = ({:.6f}, {:.6f}, {:.6f})'.format(
-                        xs, ys, zs))
-
-                # atom = BasisAtom(element, lattice=lattice, x=x, y=y, z=z)
-                # print('i={}: x, y, z = ({:.6f}, {:.6f}, {:.6f})'.format(
-                #     i, x, y, z))
-                atom = BasisAtom(element, lattice=lattice, xs=xs, ys=ys, zs=zs)
-                atom.rezero()
-
-                if self.verbose:
-                    print('Basis Atom:\n{}'.format(atom))
-
-                basis.append(atom)
+        if self.verbose:
+            for atom in basis:
+                print('Basis Atom:\n{}'.format(atom))
 
         self.unit_cell = UnitCell(lattice=lattice, basis=basis)
 
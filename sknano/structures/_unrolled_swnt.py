@@ -39,6 +39,17 @@ class UnrolledSWNTMixin:
     def Ly(self):
         return self.nlayers * self.layer_spacing / 10
 
+    @property
+    def Natoms(self):
+        """Total number of atoms."""
+        return self.nlayers * self.Natoms_per_layer
+
+    @property
+    def Natoms_per_layer(self):
+        """Number of atoms per layer."""
+        return self.unit_cell.basis.Natoms * int(np.ceil(self.nx)) * \
+            int(np.ceil(self.nz))
+
     @property
     def nx(self):
         """Number of unit cells along the :math:`x`-axis."""
@@ -2,9 +2,12 @@
 from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
+import shutil
+import tempfile
 import nose
 from nose.tools import *
-from sknano.structures import MWNT
+import numpy as np
+from sknano.structures import MWNT, compute_dt, get_chirality_table
 
 
 def test1():
@@ -50,5 +53,30 @@ def test4():
     assert_equal(mwnt.Nwalls, 6)
     assert_equal(mwnt.chiral_set, set(['armchair', 'chiral', 'zigzag']))
 
+
+def test5():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        table = get_chirality_table(imax=20, cache_dir=cache_dir)
+        assert_equal(table.size, 21 ** 2 - 1)
+        assert_true(np.all(np.diff(table['dt']) >= 0))
+        assert_true(np.allclose(table['dt'],
+                                compute_dt(table['n'], table['m'])))
+        assert_equal(set(table['chiral_type'][table['n'] == table['m']]),
+                     {'armchair'})
+        assert_is(get_chirality_table(imax=20, cache_dir=cache_dir), table)
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test6():
+    mwnt = MWNT(max_walls=4, min_wall_diameter=10, max_wall_diameter=30,
+                chiral_types='zigzag')
+    assert_equal(mwnt.chiral_set, {'zigzag'})
+    dt_list = mwnt.dt_list
+    assert_true(all(10 - 0.5 <= dt <= 30 + 0.5 for dt in dt_list))
+    assert_true(np.all(np.diff(dt_list) > 2 * mwnt.wall_spacing - 1))
+
+
 if __name__ == '__main__':
     nose.runmodule()
@@ -3,8 +3,10 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
 import nose
-from nose.tools import assert_equal, assert_almost_equal  # , assert_true
-from sknano.structures import SWNT
+from nose.tools import assert_equal, assert_almost_equal, assert_true
+import numpy as np
+from sknano.structures import SWNT, compute_N, compute_R, compute_T, \
+    compute_electronic_type, compute_t1, compute_t2
 from sknano.testing import generate_structure
 
 
@@ -157,5 +159,29 @@ def test7():
     assert_equal(2 * structure.unit_cell.basis.Natoms,
                  structure.crystal_cell.basis.Natoms)
 
+
+def test8():
+    for n in range(1, 21):
+        for m in range(21):
+            N = compute_N(n, m)
+            t1, t2 = compute_t1(n, m), compute_t2(n, m)
+            p, q = compute_R(n, m)
+            assert_equal(t1 * q - t2 * p, 1)
+            assert_true(0 < m * p - n * q <= N)
+
+
+def test9():
+    n, m = np.indices((21, 21))
+    p, q = compute_R(n, m)
+    T = compute_T(n, m)
+    etype = compute_electronic_type(n, m)
+    assert_equal(p.shape, (21, 21))
+    for i in range(21):
+        for j in range(21):
+            assert_equal((p[i, j], q[i, j]), compute_R(i, j))
+            assert_almost_equal(T[i, j], compute_T(i, j))
+            assert_equal(etype[i, j], compute_electronic_type(i, j))
+
+
 if __name__ == '__main__':
     nose.runmodule()